@@ -1,7 +1,14 @@
 import gzip
+import sys
+import threading
 import time
-from typing import ClassVar, List, IO, Any, Optional, Type, Generic
+from functools import partial
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import count
+from typing import ClassVar, Dict, List, IO, Any, Optional, Type, Generic
+from weakref import WeakSet, finalize
 
+from dlt.common.json import json
 from dlt.common.typing import TDataItem, TDataItems
 from dlt.common.data_writers.exceptions import (
     BufferedDataWriterClosed,
@@ -21,13 +28,73 @@ def new_file_id() -> str:
     return uniq_id(5)
 
 
+def estimate_item_size(item: TDataItem) -> int:
+    """Estimates size of a single data item in bytes from its serialized form"""
+    try:
+        return len(json.typed_dumpb(item))
+    except Exception:
+        return sys.getsizeof(item)
+
+
+class _BuffersMemory:
+    """Tracks estimated size of buffers of all open writers in the process"""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.buffered_bytes = 0
+        self.writers: "WeakSet[BufferedDataWriter[Any]]" = WeakSet()
+        self._writers_bytes: Dict[int, int] = {}
+        self._keys = count()
+
+    def register(self, writer: "BufferedDataWriter[Any]") -> int:
+        """Tracks `writer` and releases its bytes when it is garbage collected without closing"""
+        with self.lock:
+            key = next(self._keys)
+            self._writers_bytes[key] = 0
+            self.writers.add(writer)
+        finalize(writer, self.release, key)
+        return key
+
+    def update(self, key: int, delta: int) -> int:
+        with self.lock:
+            self._writers_bytes[key] += delta
+            self.buffered_bytes += delta
+            return self.buffered_bytes
+
+    def release(self, key: int) -> None:
+        with self.lock:
+            self.buffered_bytes -= self._writers_bytes.pop(key, 0)
+
+    def largest_buffers(self, thread_id: int) -> List["BufferedDataWriter[Any]"]:
+        """Returns writers used by `thread_id` that hold any items, largest buffers first"""
+        with self.lock:
+            writers = [
+                w for w in self.writers if w._buffered_bytes > 0 and w._thread_id == thread_id
+            ]
+        return sorted(writers, key=lambda w: w._buffered_bytes, reverse=True)
+
+
+BUFFERS_MEMORY = _BuffersMemory()
+
+
 class BufferedDataWriter(Generic[TWriter]):
+    BUFFERS_MIN_FLUSH_FRACTION: ClassVar[float] = 0.05
+    """Buffers of a thread holding less than this fraction of `buffers_max_bytes` are not flushed"""
+
     @configspec
     class BufferedDataWriterConfiguration(BaseConfiguration):
         buffer_max_items: int = 5000
+        buffer_max_bytes: Optional[int] = None
+        """Flush the buffer when estimated size of buffered items exceeds this value"""
+        buffers_max_bytes: Optional[int] = None
+        """Max estimated size of buffers of all open writers in the process, largest buffers are flushed first"""
         file_max_items: Optional[int] = None
         file_max_bytes: Optional[int] = None
         disable_compression: bool = False
+        compression_level: int = 9
+        """gzip compression level from 1 (fastest) to 9 (smallest files)"""
+        background_flush: bool = False
+        """Serialize, compress and write full buffers in a background thread"""
         _caps: Optional[DestinationCapabilitiesContext] = None
 
         __section__: ClassVar[str] = known_sections.DATA_WRITER
@@ -39,9 +106,13 @@ class BufferedDataWriter(Generic[TWriter]):
         file_name_template: str,
         *,
         buffer_max_items: int = 5000,
+        buffer_max_bytes: int = None,
+        buffers_max_bytes: int = None,
         file_max_items: int = None,
         file_max_bytes: int = None,
         disable_compression: bool = False,
+        compression_level: int = 9,
+        background_flush: bool = False,
         _caps: DestinationCapabilitiesContext = None
     ):
         self.writer_spec = writer_spec
@@ -55,11 +126,15 @@ class BufferedDataWriter(Generic[TWriter]):
         self.closed_files: List[DataWriterMetrics] = []  # all fully processed files
         # buffered items must be less than max items in file
         self.buffer_max_items = min(buffer_max_items, file_max_items or buffer_max_items)
+        self.buffer_max_bytes = buffer_max_bytes
+        self.buffers_max_bytes = buffers_max_bytes
         self.file_max_bytes = file_max_bytes
         self.file_max_items = file_max_items
         # the open function is either gzip.open or open
         self.open = (
-            gzip.open if self.writer_spec.supports_compression and not disable_compression else open
+            partial(gzip.open, compresslevel=compression_level)
+            if self.writer_spec.supports_compression and not disable_compression
+            else open
         )
 
         self._current_columns: TTableSchemaColumns = None
@@ -71,6 +146,18 @@ class BufferedDataWriter(Generic[TWriter]):
         self._created: float = None
         self._last_modified: float = None
         self._closed = False
+        # when flushing in background, at most one buffer is written while the next one is filled
+        self.background_flush = background_flush
+        self._flush_pool: ThreadPoolExecutor = None
+        self._pending_flush: Future[None] = None
+        # items and bytes in current file, known to producer without waiting for pending flush
+        self._file_items_count: int = 0
+        self._file_bytes: int = 0
+        # estimated size of the buffer, computed only if any bytes limit is set
+        self._buffered_bytes: int = 0
+        self._row_size_sample: int = None
+        self._thread_id = threading.get_ident()
+        self._buffers_memory_key = BUFFERS_MEMORY.register(self)
         try:
             self._rotate_file()
         except TypeError:
@@ -114,18 +201,36 @@ class BufferedDataWriter(Generic[TWriter]):
         # flush if max buffer exceeded
         if self._buffered_items_count >= self.buffer_max_items:
             self._flush_items()
+        elif self.buffer_max_bytes or self.buffers_max_bytes:
+            self._flush_on_max_bytes(item, new_rows_count)
         # set last modification date
         self._last_modified = time.time()
         # rotate the file if max_bytes exceeded
         if self._file:
-            # rotate on max file size
-            if self.file_max_bytes and self._file.tell() >= self.file_max_bytes:
+            # rotate on max file size, with background flush the size is known after previous flush
+            if self.file_max_bytes and self._file_bytes >= self.file_max_bytes:
                 self._rotate_file()
             # rotate on max items
-            elif self.file_max_items and self._writer.items_count >= self.file_max_items:
+            elif self.file_max_items and self._file_items_count >= self.file_max_items:
                 self._rotate_file()
         return new_rows_count
 
+    def write_data_rows(self, rows: List[TDataItem], columns: TTableSchemaColumns) -> int:
+        """Writes `rows` with the same buffer flushes and file rotations as if each row was passed to
+        `write_data_item` separately. Rows are written in slices that fill up the buffer. Files are rotated
+        only after a flush so `file_max_items` and `file_max_bytes` are honored.
+        """
+        if self.buffer_max_bytes or self.buffers_max_bytes:
+            # size of the buffer is checked on each write
+            return sum(self.write_data_item(row, columns) for row in rows)
+        rows_count = 0
+        start = 0
+        while start < len(rows):
+            end = start + max(1, self.buffer_max_items - self._buffered_items_count)
+            rows_count += self.write_data_item(rows[start:end], columns)
+            start = end
+        return rows_count
+
     def write_empty_file(self, columns: TTableSchemaColumns) -> DataWriterMetrics:
         """Writes empty file: only header and footer without actual items. Closed the
         empty file and returns metrics. Mind that header and footer will be written."""
@@ -166,7 +271,14 @@ class BufferedDataWriter(Generic[TWriter]):
         """Flushes the data, writes footer (skip_flush is True), collects metrics and closes the underlying file."""
         # like regular files, we do not except on double close
         if not self._closed:
-            self._flush_and_close_file(skip_flush=skip_flush)
+            try:
+                self._flush_and_close_file(skip_flush=skip_flush)
+            finally:
+                if self._flush_pool:
+                    self._flush_pool.shutdown(wait=True)
+                    self._flush_pool = None
+                # closed writer does not count into the memory limit
+                self._release_buffered_bytes()
             self._closed = True
 
     @property
@@ -210,10 +322,66 @@ class BufferedDataWriter(Generic[TWriter]):
                 self._writer.write_header(self._current_columns)
             # write buffer
             if self._buffered_items:
-                self._writer.write_data(self._buffered_items)
-            # reset buffer and counter
-            self._buffered_items.clear()
+                # swap the buffer so producer may fill a new one
+                items, self._buffered_items = self._buffered_items, []
+                self._file_items_count += self._buffered_items_count
+                if self.background_flush:
+                    # only one buffer is written at a time, this also raises errors of previous write
+                    self._wait_for_flush()
+                    if not self._flush_pool:
+                        self._flush_pool = ThreadPoolExecutor(
+                            max_workers=1, thread_name_prefix="buffered_writer"
+                        )
+                    self._pending_flush = self._flush_pool.submit(self._write_items, items)
+                else:
+                    self._write_items(items)
+            # reset counters
             self._buffered_items_count = 0
+            self._release_buffered_bytes()
+
+    def _flush_on_max_bytes(self, item: TDataItems, rows_count: int) -> None:
+        items = item if isinstance(item, List) else [item]
+        if not items:
+            return
+        if hasattr(items[0], "nbytes"):
+            # arrow tables and record batches know their size
+            size = sum(tbl.nbytes for tbl in items)
+        else:
+            # serialize one row per buffer and assume the others are similar
+            if self._row_size_sample is None:
+                self._row_size_sample = estimate_item_size(items[0])
+            size = self._row_size_sample * rows_count
+        self._buffered_bytes += size
+        buffers_bytes = BUFFERS_MEMORY.update(self._buffers_memory_key, size)
+        if self.buffer_max_bytes and self._buffered_bytes >= self.buffer_max_bytes:
+            self._flush_items()
+        elif self.buffers_max_bytes and buffers_bytes >= self.buffers_max_bytes:
+            writers = BUFFERS_MEMORY.largest_buffers(self._thread_id)
+            # do not flush tiny buffers when writers of other threads use most of the limit
+            thread_bytes = sum(w._buffered_bytes for w in writers)
+            if thread_bytes < self.buffers_max_bytes * self.BUFFERS_MIN_FLUSH_FRACTION:
+                return
+            # flush the largest buffers of writers used by this thread until within the limit
+            for writer in writers:
+                writer._flush_items()
+                if BUFFERS_MEMORY.buffered_bytes < self.buffers_max_bytes:
+                    break
+
+    def _release_buffered_bytes(self) -> None:
+        if self._buffered_bytes:
+            BUFFERS_MEMORY.update(self._buffers_memory_key, -self._buffered_bytes)
+            self._buffered_bytes = 0
+        self._row_size_sample = None
+
+    def _write_items(self, items: List[TDataItem]) -> None:
+        self._writer.write_data(items)
+        self._file_bytes = self._file.tell()
+
+    def _wait_for_flush(self) -> None:
+        """Waits until pending background flush completes, raises if flush failed"""
+        if self._pending_flush:
+            pending_flush, self._pending_flush = self._pending_flush, None
+            pending_flush.result()
 
     def _flush_and_close_file(
         self, allow_empty_file: bool = False, skip_flush: bool = False
@@ -221,6 +389,7 @@ class BufferedDataWriter(Generic[TWriter]):
         if not skip_flush:
             # if any buffered items exist, flush them
             self._flush_items(allow_empty_file)
+            self._wait_for_flush()
             # if writer exists then close it
             if not self._writer:
                 return None
@@ -228,6 +397,11 @@ class BufferedDataWriter(Generic[TWriter]):
             self._writer.write_footer()
             self._file.flush()
         else:
+            try:
+                self._wait_for_flush()
+            except Exception:
+                # we are closing after an exception, writer is discarded anyway
+                pass
             if not self._writer:
                 return None
         self._writer.close()
@@ -243,6 +417,8 @@ class BufferedDataWriter(Generic[TWriter]):
         self._file.close()
         self._writer = None
         self._file = None
+        self._file_items_count = 0
+        self._file_bytes = 0
         self._file_name = None
         self._created = None
         self._last_modified = None
@@ -150,9 +150,12 @@ class DataWriter(abc.ABC):
 class JsonlWriter(DataWriter):
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
-        for row in rows:
-            json.dump(row, self._f)
-            self._f.write(b"\n")
+        if not rows:
+            return
+        # serialize all rows first and write them at once, compression of a large chunk
+        # is faster and releases GIL
+        dumpb = json.dumpb
+        self._f.write(b"\n".join([dumpb(row) for row in rows]) + b"\n")
 
     @classmethod
     def writer_spec(cls) -> FileWriterSpec:
@@ -269,6 +272,10 @@ class ParquetDataWriterConfiguration(BaseConfiguration):
     row_group_size: Optional[int] = None
     coerce_timestamps: Optional[Literal["s", "ms", "us", "ns"]] = None
     allow_truncated_timestamps: bool = False
+    use_dictionary: bool = True
+    """Use dictionary encoding for all columns"""
+    write_statistics: bool = True
+    """Write min/max/null count statistics for all columns"""
 
     __section__: ClassVar[str] = known_sections.DATA_WRITER
 
@@ -287,6 +294,8 @@ class ParquetDataWriter(DataWriter):
         row_group_size: Optional[int] = None,
         coerce_timestamps: Optional[Literal["s", "ms", "us", "ns"]] = None,
         allow_truncated_timestamps: bool = False,
+        use_dictionary: bool = True,
+        write_statistics: bool = True,
     ) -> None:
         super().__init__(f, caps or DestinationCapabilitiesContext.generic_capabilities("parquet"))
         from dlt.common.libs.pyarrow import pyarrow
@@ -301,6 +310,8 @@ class ParquetDataWriter(DataWriter):
         self.parquet_row_group_size = row_group_size
         self.coerce_timestamps = coerce_timestamps
         self.allow_truncated_timestamps = allow_truncated_timestamps
+        self.use_dictionary = use_dictionary
+        self.write_statistics = write_statistics
 
     def _create_writer(self, schema: "pa.Schema") -> "pa.parquet.ParquetWriter":
         from dlt.common.libs.pyarrow import pyarrow, get_py_arrow_timestamp
@@ -321,6 +332,8 @@ class ParquetDataWriter(DataWriter):
             data_page_size=self.parquet_data_page_size,
             coerce_timestamps=self.coerce_timestamps,
             allow_truncated_timestamps=self.allow_truncated_timestamps,
+            use_dictionary=self.use_dictionary,
+            write_statistics=self.write_statistics,
         )
 
     def write_header(self, columns_schema: TTableSchemaColumns) -> None:
@@ -351,15 +364,26 @@ class ParquetDataWriter(DataWriter):
         super().write_data(rows)
         from dlt.common.libs.pyarrow import pyarrow
 
-        # replace complex types with json
-        for key in self.complex_indices:
-            for row in rows:
-                if (value := row.get(key)) is not None:
-                    # TODO: make this configurable
-                    if value is not None and not isinstance(value, str):
-                        row[key] = json.dumps(value)
-
-        table = pyarrow.Table.from_pylist(rows, schema=self.schema)
+        # build the table column by column, so only a single column of python values is kept
+        # in memory at a time and rows are not modified
+        columns = []
+        for field in self.schema:
+            name = field.name
+            if name in self.complex_indices:
+                # replace complex types with json
+                values = [
+                    (
+                        json.dumps(value)
+                        if (value := row.get(name)) is not None and not isinstance(value, str)
+                        else value
+                    )
+                    for row in rows
+                ]
+            else:
+                values = [row.get(name) for row in rows]
+            columns.append(pyarrow.array(values, type=field.type))
+            del values
+        table = pyarrow.Table.from_arrays(columns, schema=self.schema)
         # Write
         self.writer.write_table(table, row_group_size=self.parquet_row_group_size)
 
@@ -15,7 +15,7 @@ from dlt.common.schema.typing import (
 )
 from dlt.common.schema.utils import column_name_validator, get_validity_column_names
 from dlt.common.schema.exceptions import ColumnNameConflictException
-from dlt.common.utils import digest128, update_dict_nested
+from dlt.common.utils import digest128, digest128b, digest128_many, update_dict_nested
 from dlt.common.normalizers.json import (
     TNormalizedRowIterator,
     wrap_in_dict,
@@ -150,8 +150,8 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         Can be used as deterministic row identifier.
         """
         row_filtered = {k: v for k, v in row.items() if not k.startswith(DLT_NAME_PREFIX)}
-        row_str = json.dumps(row_filtered, sort_keys=True)
-        return digest128(row_str, DLT_ID_LENGTH_BYTES)
+        # hash utf-8 bytes directly, without decoding and encoding the json string again
+        return digest128b(json.dumpb(row_filtered, sort_keys=True), DLT_ID_LENGTH_BYTES)
 
     @staticmethod
     def _get_child_row_hash(parent_row_id: str, child_table: str, list_idx: int) -> str:
@@ -159,6 +159,11 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
         # and all child tables must be lists
         return digest128(f"{parent_row_id}_{child_table}_{list_idx}", DLT_ID_LENGTH_BYTES)
 
+    @staticmethod
+    def _get_child_row_hashes(parent_row_id: str, child_table: str, count: int) -> List[str]:
+        # ids of `count` child rows computed in one call, same as `_get_child_row_hash` for each position
+        return digest128_many(f"{parent_row_id}_{child_table}_", count, DLT_ID_LENGTH_BYTES)
+
     @staticmethod
     def _link_row(row: TDataItemRowChild, parent_row_id: str, list_idx: int) -> TDataItemRowChild:
         assert parent_row_id
@@ -216,6 +221,9 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
     ) -> TNormalizedRowIterator:
         v: TDataItemRowChild = None
         table = self.schema.naming.shorten_fragments(*parent_path, *ident_path)
+        parent_table = self.schema.naming.shorten_fragments(*parent_path)
+        # ids of list of simple types computed together for all elements
+        child_row_hashes: List[str] = None
 
         for idx, v in enumerate(seq):
             # yield child table row
@@ -236,12 +244,15 @@ class DataItemNormalizer(DataItemNormalizerBase[RelationalNormalizerConfig]):
                 )
             else:
                 # list of simple types
-                child_row_hash = DataItemNormalizer._get_child_row_hash(parent_row_id, table, idx)
+                if child_row_hashes is None:
+                    child_row_hashes = DataItemNormalizer._get_child_row_hashes(
+                        parent_row_id, table, len(seq)
+                    )
                 wrap_v = wrap_in_dict(v)
-                wrap_v["_dlt_id"] = child_row_hash
+                wrap_v["_dlt_id"] = child_row_hashes[idx]
                 e = DataItemNormalizer._link_row(wrap_v, parent_row_id, idx)
                 DataItemNormalizer._extend_row(extend, e)
-                yield (table, self.schema.naming.shorten_fragments(*parent_path)), e
+                yield (table, parent_table), e
 
     def _normalize_row(
         self,
@@ -21,6 +21,7 @@ from typing import (
     TypeVar,
     TypedDict,
     Mapping,
+    Union,
 )
 from typing_extensions import NotRequired
 
@@ -150,7 +151,9 @@ class StepInfo(SupportsHumanize, Generic[TStepMetricsCo]):
 
     @staticmethod
     def job_metrics_asdict(
-        job_metrics: Dict[str, DataWriterMetrics], key_name: str = "job_id", extend: StrAny = None
+        job_metrics: Mapping[str, Union[DataWriterMetrics, "NormalizeWorkerMetrics"]],
+        key_name: str = "job_id",
+        extend: StrAny = None,
     ) -> List[DictStrAny]:
         jobs = []
         for job_id, metrics in job_metrics.items():
@@ -258,11 +261,38 @@ class ExtractInfo(StepInfo[ExtractMetrics], _ExtractInfo):  # type: ignore[misc]
 # reveal_type(ExtractInfo)
 
 
+class NormalizeWorkerMetrics(NamedTuple):
+    worker_id: str
+    """Process id and thread name of the worker"""
+    tasks_count: int
+    files_count: int
+    files_size: int
+    """Total size of extracted files processed by the worker"""
+    busy_time: float
+    """Seconds spent on normalizing files"""
+    utilization: float
+    """Fraction of package processing time the worker was busy"""
+
+    def __add__(self, other: Tuple[object, ...], /) -> Tuple[object, ...]:
+        if isinstance(other, NormalizeWorkerMetrics):
+            return NormalizeWorkerMetrics(
+                self.worker_id,
+                self.tasks_count + other.tasks_count,
+                self.files_count + other.files_count,
+                self.files_size + other.files_size,
+                self.busy_time + other.busy_time,
+                self.utilization + other.utilization,
+            )
+        return NotImplemented
+
+
 class NormalizeMetrics(StepMetrics):
     job_metrics: Dict[str, DataWriterMetrics]
     """Metrics collected per job id during writing of job file"""
     table_metrics: Dict[str, DataWriterMetrics]
     """Job metrics aggregated by table"""
+    worker_metrics: NotRequired[Dict[str, NormalizeWorkerMetrics]]
+    """Utilization of normalize workers"""
 
 
 class _NormalizeInfo(NamedTuple):
@@ -298,6 +328,7 @@ class NormalizeInfo(StepInfo[NormalizeMetrics], _NormalizeInfo):  # type: ignore
         load_metrics: Dict[str, List[Any]] = {
             "job_metrics": [],
             "table_metrics": [],
+            "worker_metrics": [],
         }
         for load_id, metrics_list in self.metrics.items():
             for idx, metrics in enumerate(metrics_list):
@@ -310,6 +341,11 @@ class NormalizeInfo(StepInfo[NormalizeMetrics], _NormalizeInfo):  # type: ignore
                         metrics["table_metrics"], key_name="table_name", extend=extend
                     )
                 )
+                load_metrics["worker_metrics"].extend(
+                    self.job_metrics_asdict(
+                        metrics.get("worker_metrics", {}), key_name="worker_id", extend=extend
+                    )
+                )
         d.update(load_metrics)
         return d
 
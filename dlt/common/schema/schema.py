@@ -1,5 +1,19 @@
 from copy import copy, deepcopy
-from typing import ClassVar, Dict, List, Mapping, Optional, Sequence, Tuple, Any, cast, Literal
+from functools import partial
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Any,
+    cast,
+    Literal,
+)
 from dlt.common.schema.migrations import migrate_schema
 
 from dlt.common.utils import extend_list_deduplicated
@@ -56,6 +70,9 @@ DEFAULT_SCHEMA_CONTRACT_MODE: TSchemaContractDict = {
     "data_type": "evolve",
 }
 
+TCoercionPlan = Dict[Tuple[str, Type[Any]], Callable[[Any], Any]]
+"""Maps column name and python type of a value into a function that coerces the value"""
+
 
 class Schema:
     ENGINE_VERSION: ClassVar[int] = SCHEMA_ENGINE_VERSION
@@ -94,6 +111,8 @@ class Schema:
     _compiled_includes: Dict[str, Sequence[REPattern]]
     # type detections
     _type_detections: Sequence[TTypeDetections]
+    # per table coercion plans: map (column name, python type) into value converter
+    _coercion_plans: Dict[str, Tuple[TTableSchema, TCoercionPlan]]
 
     # normalizers config
     _normalizers_config: TNormalizersConfig
@@ -233,6 +252,9 @@ class Schema:
         table = self._schema_tables.get(table_name)
         if not table:
             table = utils.new_table(table_name, parent_table)
+            coercion_plan: TCoercionPlan = {}
+        else:
+            coercion_plan = self._get_coercion_plan(table_name, table)
         table_columns = table["columns"]
 
         new_row: DictStrAny = {}
@@ -242,11 +264,27 @@ class Schema:
                 # just check if column is nullable if it exists
                 self._coerce_null_value(table_columns, table_name, col_name)
             else:
+                # use converter compiled for known column and python type
+                converter = coercion_plan.get((col_name, type(v)))
+                if converter is not None:
+                    try:
+                        new_v = converter(v)
+                        # variants must go through full coercion below
+                        if not callable(new_v):
+                            new_row[col_name] = new_v
+                            continue
+                    except (ValueError, SyntaxError):
+                        pass
                 new_col_name, new_col_def, new_v = self._coerce_non_null_value(
                     table_columns, table_name, col_name, v
                 )
                 new_row[new_col_name] = new_v
-                if new_col_def:
+                if new_col_def is None and new_col_name == col_name:
+                    # value fits existing column without variant
+                    coercion_plan[(col_name, type(v))] = self._compile_converter(
+                        table_columns[col_name]["data_type"], type(v)
+                    )
+                elif new_col_def:
                     if not updated_table_partial:
                         # create partial table with only the new columns
                         updated_table_partial = copy(table)
@@ -417,6 +455,8 @@ class Schema:
                     " table.",
                 )
         table = self._schema_tables.get(table_name)
+        # columns may change so compile coercions again
+        self._coercion_plans.pop(table_name, None)
         if table is None:
             # add the whole new table to SchemaTables
             self._schema_tables[table_name] = partial_table
@@ -786,6 +826,22 @@ class Schema:
 
         return col_name, new_column, coerced_v
 
+    def _get_coercion_plan(self, table_name: str, table: TTableSchema) -> TCoercionPlan:
+        """Gets coercion plan for `table_name`. Plans are dropped when table is updated or replaced"""
+        table_plan = self._coercion_plans.get(table_name)
+        if table_plan is None or table_plan[0] is not table:
+            table_plan = self._coercion_plans[table_name] = (table, {})
+        return table_plan[1]
+
+    @staticmethod
+    def _compile_converter(col_type: TDataType, t: Type[Any]) -> Callable[[Any], Any]:
+        """Returns a function that coerces values of python type `t` into `col_type`"""
+        py_type = py_type_to_sc_type(t)
+        # basic python types that already have the right data type are passed as they are
+        if col_type == py_type and t in (str, float, bool, int):
+            return _identity
+        return partial(coerce_value, col_type, py_type)
+
     def _infer_column_type(self, v: Any, col_name: str, skip_preferred: bool = False) -> TDataType:
         tv = type(v)
         # try to autodetect data type
@@ -805,17 +861,23 @@ class Schema:
         else:
             return False
 
-    def _bump_version(self) -> Tuple[int, str]:
+    def _bump_version(self, stored_schema: TStoredSchema = None) -> Tuple[int, str]:
         """Computes schema hash in order to check if schema content was modified. In such case the schema ``stored_version`` and ``stored_version_hash`` are updated.
 
         Should not be used directly. The method ``to_dict`` will generate TStoredSchema with correct value, only once before persisting schema to storage.
+        If such `stored_schema` is passed, its version and hashes are taken without hashing the content again.
 
         Returns:
             Tuple[int, str]: Current (``stored_version``, ``stored_version_hash``) tuple
         """
-        self._stored_version, self._stored_version_hash, _, _ = utils.bump_version_if_modified(
-            self.to_dict(bump_version=False)
-        )
+        if stored_schema is None:
+            self._stored_version, self._stored_version_hash, _, _ = utils.bump_version_if_modified(
+                self.to_dict(bump_version=False)
+            )
+        else:
+            self._stored_version = stored_schema["version"]
+            self._stored_version_hash = stored_schema["version_hash"]
+            self._stored_previous_hashes = stored_schema["previous_hashes"]
         return self._stored_version, self._stored_version_hash
 
     def _drop_version(self) -> None:
@@ -881,6 +943,7 @@ class Schema:
         self._compiled_excludes: Dict[str, Sequence[REPattern]] = {}
         self._compiled_includes: Dict[str, Sequence[REPattern]] = {}
         self._type_detections: Sequence[TTypeDetections] = None
+        self._coercion_plans = {}
 
         self._normalizers_config = None
         self.naming = None
@@ -940,6 +1003,12 @@ class Schema:
                         )
         # look for auto-detections in settings and then normalizer
         self._type_detections = self._settings.get("detections") or self._normalizers_config.get("detections") or []  # type: ignore
+        # settings affect the coercion
+        self._coercion_plans.clear()
 
     def __repr__(self) -> str:
         return f"Schema {self.name} at {id(self)}"
+
+
+def _identity(v: Any) -> Any:
+    return v
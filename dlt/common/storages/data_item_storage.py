@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 
 from dlt.common import logger
 from dlt.common.schema import TTableSchemaColumns
-from dlt.common.typing import StrAny, TDataItems
+from dlt.common.typing import StrAny, TDataItem, TDataItems
 from dlt.common.data_writers import (
     BufferedDataWriter,
     DataWriter,
@@ -45,6 +45,18 @@ class DataItemStorage(ABC):
         # write item(s)
         return writer.write_data_item(item, columns)
 
+    def write_data_rows(
+        self,
+        load_id: str,
+        schema_name: str,
+        table_name: str,
+        rows: List[TDataItem],
+        columns: TTableSchemaColumns,
+    ) -> int:
+        """Writes `rows` in slices, flushing and rotating files like when rows are written one by one"""
+        writer = self._get_writer(load_id, schema_name, table_name)
+        return writer.write_data_rows(rows, columns)
+
     def write_empty_items_file(
         self, load_id: str, schema_name: str, table_name: str, columns: TTableSchemaColumns
     ) -> DataWriterMetrics:
@@ -180,8 +180,8 @@ class SchemaStorage(Mapping[str, Schema]):
         stored_schema = schema.to_dict()
         saved_path = self.storage.save(schema_file, to_pretty_json(stored_schema))
         # this should be the only place where this function is called. we bump a version and
-        # clean modified status
-        schema._bump_version()
+        # clean modified status, stored schema is already bumped so it is not hashed again
+        schema._bump_version(stored_schema)
         return saved_path
 
     @staticmethod
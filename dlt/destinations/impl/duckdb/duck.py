@@ -1,5 +1,7 @@
+import sys
 import threading
-from typing import ClassVar, Dict, Optional
+from concurrent.futures import Future
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
@@ -8,7 +10,6 @@ from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.destination.reference import LoadJob, FollowupJob, TLoadJobState
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
 from dlt.common.storages.file_storage import FileStorage
-from dlt.common.utils import maybe_context
 
 from dlt.destinations.insert_job_client import InsertValuesJobClient
 
@@ -23,6 +24,10 @@ HINT_TO_POSTGRES_ATTR: Dict[TColumnHint, str] = {"unique": "UNIQUE"}
 # duckdb cannot load PARQUET to the same table in parallel. so serialize it per table
 PARQUET_TABLE_LOCK = threading.Lock()
 TABLES_LOCKS: Dict[str, threading.Lock] = {}
+# parquet files waiting for the table lock. the job that acquires the lock loads all of them.
+# files are kept per credentials (that own the connection to the database) and table so they
+# are never loaded into a table with the same name in another database
+TABLES_PENDING_FILES: Dict[Tuple[int, str], List[Tuple[str, "Future[None]"]]] = {}
 
 
 class DuckDbTypeMapper(TypeMapper):
@@ -120,27 +125,103 @@ class DuckDbCopyJob(LoadJob, FollowupJob):
 
         qualified_table_name = sql_client.make_qualified_table_name(table_name)
         if file_path.endswith("parquet"):
-            source_format = "PARQUET"
-            options = ""
-            # lock when creating a new lock
-            with PARQUET_TABLE_LOCK:
-                # create or get lock per table name
-                lock: threading.Lock = TABLES_LOCKS.setdefault(
-                    qualified_table_name, threading.Lock()
-                )
+            self._copy_parquet(qualified_table_name, file_path, sql_client)
         elif file_path.endswith("jsonl"):
             # NOTE: loading JSON does not work in practice on duckdb: the missing keys fail the load instead of being interpreted as NULL
             source_format = "JSON"  # newline delimited, compression auto
             options = ", COMPRESSION GZIP" if FileStorage.is_gzipped(file_path) else ""
-            lock = None
+            with sql_client.begin_transaction():
+                sql_client.execute_sql(
+                    f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT"
+                    f" {source_format} {options});"
+                )
         else:
             raise ValueError(file_path)
 
-        with maybe_context(lock):
+    @staticmethod
+    def _copy_parquet(
+        qualified_table_name: str, file_path: str, sql_client: DuckDbSqlClient
+    ) -> None:
+        """Loads parquet files into a table one transaction at a time. Files of all jobs that wait for the
+        table lock are loaded together by the job that acquires it, files with the same columns in a
+        single multi-file scan. If the group fails, its files are loaded one by one.
+        """
+        loaded: "Future[None]" = Future()
+        files_key = (id(sql_client.credentials), qualified_table_name)
+        # lock when creating a new lock
+        with PARQUET_TABLE_LOCK:
+            # create or get lock per table name
+            lock: threading.Lock = TABLES_LOCKS.setdefault(qualified_table_name, threading.Lock())
+            TABLES_PENDING_FILES.setdefault(files_key, []).append((file_path, loaded))
+
+        with lock:
+            with PARQUET_TABLE_LOCK:
+                pending = TABLES_PENDING_FILES.pop(files_key, [])
+            # our file may have been already loaded together with other job's files
+            try:
+                DuckDbCopyJob._copy_pending_files(qualified_table_name, pending, sql_client)
+            finally:
+                # resolve futures of other jobs if loading was interrupted ie. by KeyboardInterrupt
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(sys.exc_info()[1])
+        # raises if our file failed to load
+        loaded.result()
+
+    @staticmethod
+    def _copy_pending_files(
+        qualified_table_name: str,
+        pending: List[Tuple[str, "Future[None]"]],
+        sql_client: DuckDbSqlClient,
+    ) -> None:
+        if not pending:
+            return
+        try:
+            DuckDbCopyJob._copy_parquet_files(
+                qualified_table_name, [path for path, _ in pending], sql_client
+            )
+        except Exception as ex:
+            if len(pending) == 1:
+                pending[0][1].set_exception(ex)
+                return
+            # group transaction was rolled back, load each file separately so only
+            # jobs with failing files fail
+            for path, future in pending:
+                try:
+                    DuckDbCopyJob._copy_parquet_files(qualified_table_name, [path], sql_client)
+                except Exception as file_ex:
+                    future.set_exception(file_ex)
+                else:
+                    future.set_result(None)
+        else:
+            for _, future in pending:
+                future.set_result(None)
+
+    @staticmethod
+    def _copy_parquet_files(
+        qualified_table_name: str, file_paths: List[str], sql_client: DuckDbSqlClient
+    ) -> None:
+        if len(file_paths) == 1:
             with sql_client.begin_transaction():
                 sql_client.execute_sql(
-                    f"COPY {qualified_table_name} FROM '{file_path}' ( FORMAT"
-                    f" {source_format} {options});"
+                    f"COPY {qualified_table_name} FROM '{file_paths[0]}' ( FORMAT PARQUET );"
+                )
+            return
+
+        from dlt.common.libs.pyarrow import pyarrow
+
+        # files written for the same table may have different columns if schema evolved
+        files_by_columns: Dict[Tuple[str, ...], List[str]] = {}
+        for path in file_paths:
+            columns = tuple(pyarrow.parquet.read_schema(path).names)
+            files_by_columns.setdefault(columns, []).append(path)
+        with sql_client.begin_transaction():
+            for columns, paths in files_by_columns.items():
+                column_names = ",".join(sql_client.escape_column_name(c) for c in columns)
+                sql_client.execute_sql(
+                    f"INSERT INTO {qualified_table_name} ({column_names}) SELECT * FROM"
+                    " read_parquet(%s);",
+                    paths,
                 )
 
     def state(self) -> TLoadJobState:
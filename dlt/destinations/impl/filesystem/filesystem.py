@@ -3,11 +3,12 @@ import pathlib
 import os
 import base64
 from types import TracebackType
-from typing import ClassVar, List, Type, Iterable, Set, Iterator, Optional, Tuple, cast
+from typing import Callable, ClassVar, List, Type, Iterable, Set, Iterator, Optional, Tuple, cast
 from fsspec import AbstractFileSystem
 from contextlib import contextmanager
 from dlt.common import json, pendulum
 from dlt.common.typing import DictStrAny
+from dlt.common.utils import uniq_id
 
 import dlt
 from dlt.common import logger, time
@@ -36,6 +37,8 @@ from dlt.destinations.fs_client import FSClientBase
 
 INIT_FILE_NAME = "init"
 FILENAME_SEPARATOR = "__"
+MANIFEST_FILE_SUFFIX = ".manifest"
+MANIFEST_FOLDER_NAME = "_manifests"
 
 
 class LoadFilesystemJob(LoadJob):
@@ -47,6 +50,7 @@ class LoadFilesystemJob(LoadJob):
         config: FilesystemDestinationClientConfiguration,
         schema_name: str,
         load_id: str,
+        fs_client: AbstractFileSystem = None,
     ) -> None:
         file_name = FileStorage.get_file_name_from_file_path(local_path)
         self.config = config
@@ -65,7 +69,9 @@ class LoadFilesystemJob(LoadJob):
         )
 
         super().__init__(file_name)
-        fs_client, _ = fsspec_from_config(config)
+        # reuse authenticated filesystem of the client if passed
+        if fs_client is None:
+            fs_client, _ = fsspec_from_config(config)
         # We would like to avoid failing for local filesystem where
         # deeply nested directory will not exist before writing a file.
         # It `auto_mkdir` is disabled by default in fsspec so we made some
@@ -135,10 +141,13 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         # cannot be replaced and we cannot initialize folders consistently
         self.table_prefix_layout = path_utils.get_table_prefix_layout(config.layout)
         self.dataset_name = self.config.normalize_dataset_name(self.schema)
+        # manifest folders known to exist, created once per client
+        self._manifest_dirs: Set[str] = set()
 
     def drop_storage(self) -> None:
         if self.is_storage_initialized():
             self.fs_client.rm(self.dataset_path, recursive=True)
+            self._manifest_dirs.clear()
 
     @property
     def dataset_path(self) -> str:
@@ -248,8 +257,8 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         result = []
         for current_dir, _dirs, files in self.fs_client.walk(table_dir, detail=False, refresh=True):
             for file in files:
-                # skip INIT files
-                if file == INIT_FILE_NAME:
+                # skip INIT files and manifests
+                if file == INIT_FILE_NAME or file.endswith(MANIFEST_FILE_SUFFIX):
                     continue
                 filepath = self.pathlib.join(
                     path_utils.normalize_path_sep(self.pathlib, current_dir), file
@@ -277,6 +286,7 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
             config=self.config,
             schema_name=self.schema.name,
             load_id=load_id,
+            fs_client=self.fs_client,
         )
 
     def restore_file_load(self, file_path: str) -> LoadJob:
@@ -318,6 +328,83 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
                 continue
             yield filepath, fileparts
 
+    def _get_manifest_path(self, table_name: str, key: str) -> str:
+        # manifests are kept in a sub folder so writing them does not modify the table folder
+        return self.pathlib.join(  # type: ignore[no-any-return]
+            self.get_table_dir(table_name), MANIFEST_FOLDER_NAME, f"{key}{MANIFEST_FILE_SUFFIX}"
+        )
+
+    def _write_manifest(self, table_name: str, key: str, filepath: str) -> None:
+        """Points manifest `key` in dlt table `table_name` to `filepath`. Must be written after the file"""
+        manifest_path = self._get_manifest_path(table_name, key)
+        manifest_dir = self.pathlib.dirname(manifest_path)
+        if manifest_dir not in self._manifest_dirs:
+            if not self.fs_client.isdir(self.get_table_dir(table_name)):
+                return
+            self.fs_client.makedirs(manifest_dir, exist_ok=True)
+            self._manifest_dirs.add(manifest_dir)
+        manifest = json.dumps({"file_name": self.pathlib.basename(filepath)})
+        if not self.is_local_filesystem:
+            # a single object write is atomic on buckets
+            self.fs_client.write_text(manifest_path, manifest, "utf-8")
+            return
+        # write to a temp file and rename it so readers never see a partial manifest
+        temp_path = self._get_manifest_path(table_name, f"{key}.{uniq_id()}")
+        self.fs_client.write_text(temp_path, manifest, "utf-8")
+        self.fs_client.mv(temp_path, manifest_path)
+
+    def _is_manifest_stale(self, table_name: str, manifest_path: str) -> bool:
+        """Tells if files were added to the folder of `table_name` after manifest was written, ie. by
+        older dlt versions or when writing the manifest failed. Folder modification times are only
+        available on local filesystems.
+        """
+        if not self.is_local_filesystem:
+            return False
+        table_dir = self.get_table_dir(table_name)
+        return self.fs_client.modified(table_dir) > self.fs_client.modified(manifest_path)  # type: ignore[no-any-return]
+
+    def _read_manifest(self, table_name: str, key: str) -> Optional[str]:
+        """Returns path of the file manifest `key` points to or None if manifest is missing, corrupted
+        or stale
+        """
+        manifest_path = self._get_manifest_path(table_name, key)
+        try:
+            manifest = json.loads(self.fs_client.read_text(manifest_path))
+            if self._is_manifest_stale(table_name, manifest_path):
+                return None
+            return self.pathlib.join(  # type: ignore[no-any-return]
+                self.get_table_dir(table_name), manifest["file_name"]
+            )
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def _read_dlt_table_file(
+        self, table_name: str, key: str, is_selected: Callable[[List[str]], bool]
+    ) -> Optional[DictStrAny]:
+        """Reads the file that manifest `key` points to. If manifest is missing, stale or points to a
+        deleted file, selects the newest file for which `is_selected(fileparts)` is true with a full
+        listing and rebuilds the manifest
+        """
+        selected_path = self._read_manifest(table_name, key)
+        if selected_path:
+            try:
+                return json.loads(self.fs_client.read_text(selected_path))  # type: ignore[no-any-return]
+            except FileNotFoundError:
+                pass
+
+        selected_path = None
+        newest_load_id = "0"
+        for filepath, fileparts in self._list_dlt_table_files(table_name):
+            if is_selected(fileparts) and fileparts[1] > newest_load_id:
+                newest_load_id = fileparts[1]
+                selected_path = filepath
+
+        if selected_path:
+            self._write_manifest(table_name, key, selected_path)
+            return json.loads(self.fs_client.read_text(selected_path))  # type: ignore[no-any-return]
+
+        return None
+
     def _store_load(self, load_id: str) -> None:
         # write entry to load "table"
         # TODO: this is also duplicate across all destinations. DRY this.
@@ -369,21 +456,20 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
             pipeline_name, self.schema.stored_version_hash, load_id
         )
 
-        # write
+        # write and point the pipeline manifest to the newest state
         self._write_to_json_file(hash_path, cast(DictStrAny, pipeline_state_doc))
+        self._write_manifest(self.schema.state_table_name, pipeline_name, hash_path)
 
     def get_stored_state(self, pipeline_name: str) -> Optional[StateInfo]:
-        # search newest state
-        selected_path = None
-        newest_load_id = "0"
-        for filepath, fileparts in self._list_dlt_table_files(self.schema.state_table_name):
-            if fileparts[0] == pipeline_name and fileparts[1] > newest_load_id:
-                newest_load_id = fileparts[1]
-                selected_path = filepath
+        # read newest state of the pipeline
+        state_json = self._read_dlt_table_file(
+            self.schema.state_table_name,
+            pipeline_name,
+            lambda fileparts: fileparts[0] == pipeline_name,
+        )
 
         # Load compressed state from destination
-        if selected_path:
-            state_json = json.loads(self.fs_client.read_text(selected_path))
+        if state_json:
             state_json.pop("version_hash")
             return StateInfo(**state_json)
 
@@ -407,22 +493,21 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
         """Get the schema by supplied hash, falls back to getting the newest version matching the existing schema name"""
         version_hash = self._to_path_safe_string(version_hash)
         # find newest schema for pipeline or by version hash
-        selected_path = None
-        newest_load_id = "0"
-        for filepath, fileparts in self._list_dlt_table_files(self.schema.version_table_name):
-            if (
-                not version_hash
-                and fileparts[0] == self.schema.name
-                and fileparts[1] > newest_load_id
-            ):
-                newest_load_id = fileparts[1]
-                selected_path = filepath
-            elif fileparts[2] == version_hash:
-                selected_path = filepath
-                break
+        if version_hash:
+            schema_json = self._read_dlt_table_file(
+                self.schema.version_table_name,
+                version_hash,
+                lambda fileparts: fileparts[2] == version_hash,
+            )
+        else:
+            schema_json = self._read_dlt_table_file(
+                self.schema.version_table_name,
+                self.schema.name,
+                lambda fileparts: fileparts[0] == self.schema.name,
+            )
 
-        if selected_path:
-            return StorageSchemaInfo(**json.loads(self.fs_client.read_text(selected_path)))
+        if schema_json:
+            return StorageSchemaInfo(**schema_json)
 
         return None
 
@@ -448,6 +533,13 @@ class FilesystemClient(FSClientBase, JobClientBase, WithStagingDataset, WithStat
 
         # we always keep tabs on what the current schema is
         self._write_to_json_file(filepath, version_info)
+        # point manifests for the schema hash and the schema name to the new version
+        self._write_manifest(
+            self.schema.version_table_name,
+            self._to_path_safe_string(self.schema.stored_version_hash),
+            filepath,
+        )
+        self._write_manifest(self.schema.version_table_name, self.schema.name, filepath)
 
     def get_stored_schema(self) -> Optional[StorageSchemaInfo]:
         """Retrieves newest schema from destination storage"""
@@ -2,11 +2,12 @@ from typing import ClassVar, Dict, Optional, Sequence, List, Any, Tuple
 
 from dlt.common.exceptions import TerminalValueError
 from dlt.common.wei import EVM_DECIMAL_PRECISION
-from dlt.common.destination.reference import NewLoadJob
+from dlt.common.destination.reference import FollowupJob, LoadJob, NewLoadJob, TLoadJobState
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.data_types import TDataType
 from dlt.common.schema import TColumnSchema, TColumnHint, Schema
 from dlt.common.schema.typing import TTableSchema, TColumnType, TTableFormat
+from dlt.common.storages.file_storage import FileStorage
 from dlt.common.utils import uniq_id
 
 from dlt.destinations.sql_jobs import SqlStagingCopyJob, SqlMergeJob, SqlJobParams
@@ -145,6 +146,56 @@ class MsSqlMergeJob(SqlMergeJob):
         return "#" + name
 
 
+class MsSqlParquetCopyJob(LoadJob, FollowupJob):
+    """Inserts parquet file in batches of rows with `executemany`. pyodbc `fast_executemany` sends
+    whole batch as parameter arrays, which avoids rendering and parsing of sql literals.
+    """
+
+    BATCH_SIZE: ClassVar[int] = 10000
+
+    def __init__(self, table_name: str, file_path: str, sql_client: PyOdbcMsSqlClient) -> None:
+        super().__init__(FileStorage.get_file_name_from_file_path(file_path))
+        from dlt.common.libs.pyarrow import pyarrow
+
+        qualified_table_name = sql_client.make_qualified_table_name(table_name)
+        with FileStorage.open_zipsafe_ro(file_path, "rb") as f:
+            parquet_file = pyarrow.parquet.ParquetFile(f)
+            column_names = parquet_file.schema_arrow.names
+            insert_sql = "INSERT INTO %s (%s) VALUES (%s)" % (
+                qualified_table_name,
+                ",".join(sql_client.escape_column_name(name) for name in column_names),
+                ",".join("?" * len(column_names)),
+            )
+            with sql_client.begin_transaction():
+                # do not use cursor as context manager: pyodbc commits on exit
+                cursor = sql_client.native_connection.cursor()
+                try:
+                    cursor.fast_executemany = True
+                    for batch in parquet_file.iter_batches(batch_size=self.BATCH_SIZE):
+                        cursor.executemany(insert_sql, self._batch_to_rows(batch))
+                finally:
+                    cursor.close()
+
+    @staticmethod
+    def _batch_to_rows(batch: Any) -> List[Tuple[Any, ...]]:
+        from dlt.common.libs.pyarrow import pyarrow
+
+        columns = []
+        for column in batch.columns:
+            if pyarrow.types.is_timestamp(column.type):
+                # pyodbc does not bind tz aware datetimes, all timestamps are UTC so drop the tz
+                # datetimeoffset stores time with 100ns precision, python datetime with 1us
+                column = column.cast(pyarrow.timestamp("us"), safe=False)
+            columns.append(column.to_pylist())
+        return list(zip(*columns))
+
+    def state(self) -> TLoadJobState:
+        return "completed"
+
+    def exception(self) -> str:
+        raise NotImplementedError()
+
+
 class MsSqlClient(InsertValuesJobClient):
     capabilities: ClassVar[DestinationCapabilitiesContext] = capabilities()
 
@@ -152,10 +203,16 @@ class MsSqlClient(InsertValuesJobClient):
         sql_client = PyOdbcMsSqlClient(config.normalize_dataset_name(schema), config.credentials)
         super().__init__(schema, config, sql_client)
         self.config: MsSqlClientConfiguration = config
-        self.sql_client = sql_client
+        self.sql_client: PyOdbcMsSqlClient = sql_client
         self.active_hints = HINT_TO_MSSQL_ATTR if self.config.create_indexes else {}
         self.type_mapper = MsSqlTypeMapper(self.capabilities)
 
+    def start_file_load(self, table: TTableSchema, file_path: str, load_id: str) -> LoadJob:
+        job = super().start_file_load(table, file_path, load_id)
+        if not job and file_path.endswith("parquet"):
+            job = MsSqlParquetCopyJob(table["name"], file_path, self.sql_client)
+        return job
+
     def _create_merge_followup_jobs(self, table_chain: Sequence[TTableSchema]) -> List[NewLoadJob]:
         return [MsSqlMergeJob.from_table_chain(table_chain, self.sql_client)]
 
@@ -99,7 +99,11 @@ def get_unused_placeholders(
 def prepare_datetime_params(
     current_datetime: Optional[pendulum.DateTime] = None,
     load_package_timestamp: Optional[pendulum.DateTime] = None,
+    placeholders: Optional[Sequence[str]] = None,
 ) -> Dict[str, str]:
+    """Prepares datetime placeholders values. If `placeholders` are present only datetime formats
+    from that list are rendered.
+    """
     params: Dict[str, str] = {}
     current_timestamp: pendulum.DateTime = None
     if load_package_timestamp:
@@ -119,7 +123,12 @@ def prepare_datetime_params(
     params["timestamp_ms"] = str(datetime_to_timestamp_ms(current_datetime))
     params["curr_date"] = str(current_datetime.date())
 
-    for format_string in DATETIME_PLACEHOLDERS:
+    format_strings = (
+        DATETIME_PLACEHOLDERS
+        if placeholders is None
+        else DATETIME_PLACEHOLDERS.intersection(placeholders)
+    )
+    for format_string in format_strings:
         params[format_string] = current_datetime.format(format_string).lower()
 
     return params
@@ -232,7 +241,10 @@ def create_path(
         load_id=load_id,
     )
 
-    datetime_params = prepare_datetime_params(current_datetime, load_package_timestamp)
+    # format only datetime placeholders present in the layout
+    datetime_params = prepare_datetime_params(
+        current_datetime, load_package_timestamp, get_placeholders(layout)
+    )
     params.update(datetime_params)
 
     placeholders, _ = check_layout(layout, params)
@@ -43,6 +43,8 @@ from dlt.extract.incremental.transform import (
     JsonIncremental,
     ArrowIncremental,
     IncrementalTransform,
+    pack_unique_hashes,
+    unpack_unique_hashes,
 )
 
 try:
@@ -96,6 +98,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             specified range of data. Currently Airflow scheduler is detected: "data_interval_start" and "data_interval_end" are taken from the context and passed Incremental class.
             The values passed explicitly to Incremental will be ignored.
             Note that if logical "end date" is present then also "end_value" will be set which means that resource state is not used and exactly this range of date will be loaded
+        max_unique_hashes: Optional limit of hashes of rows with the same cursor value that are kept in state to deduplicate them in the next run. When more rows
+            share the last cursor value, only part of them is deduplicated and the rest is loaded again in the next run. Not limited by default.
     """
 
     # this is config/dataclass so declare members
@@ -105,6 +109,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
     end_value: Optional[Any] = None
     row_order: Optional[TSortOrder] = None
     allow_external_schedulers: bool = False
+    max_unique_hashes: Optional[int] = None
 
     # incremental acting as empty
     EMPTY: ClassVar["Incremental[Any]"] = None
@@ -118,6 +123,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         end_value: Optional[TCursorValue] = None,
         row_order: Optional[TSortOrder] = None,
         allow_external_schedulers: bool = False,
+        max_unique_hashes: Optional[int] = None,
     ) -> None:
         # make sure that path is valid
         if cursor_path:
@@ -133,6 +139,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         self._primary_key: Optional[TTableHintTemplate[TColumnNames]] = primary_key
         self.row_order = row_order
         self.allow_external_schedulers = allow_external_schedulers
+        self.max_unique_hashes = max_unique_hashes
 
         self._cached_state: IncrementalColumnState = None
         """State dictionary cached on first access"""
@@ -143,6 +150,8 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         self.start_out_of_range: bool = False
         """Becomes true on the first item that is out of range of `start_value`. I.e. when using `max` this is a value that is lower than `start_value`"""
 
+        self._unique_hashes_capped: bool = False
+        """Set when rows over `max_unique_hashes` were dropped from state, to warn once"""
         self._transformers: Dict[str, IncrementalTransform] = {}
         self._bound_pipe: SupportsPipe = None
         """Bound pipe"""
@@ -170,7 +179,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
                 self.end_value,
                 self.last_value_func,
                 self._primary_key,
-                set(self._cached_state["unique_hashes"]),
+                unpack_unique_hashes(self._cached_state["unique_hashes"]),
             )
 
     @classmethod
@@ -262,6 +271,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             self._primary_key = native_value._primary_key
             self.allow_external_schedulers = native_value.allow_external_schedulers
             self.row_order = native_value.row_order
+            self.max_unique_hashes = native_value.max_unique_hashes
         else:  # TODO: Maybe check if callable(getattr(native_value, '__lt__', None))
             # Passing bare value `incremental=44` gets parsed as initial_value
             self.initial_value = native_value
@@ -275,7 +285,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
             return {
                 "initial_value": self.initial_value,
                 "last_value": self.initial_value,
-                "unique_hashes": [],
+                "unique_hashes": "",
             }
 
         if not self.resource_name:
@@ -288,7 +298,7 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
                 {
                     "initial_value": self.initial_value,
                     "last_value": self.initial_value,
-                    "unique_hashes": [],
+                    "unique_hashes": "",
                 }
             )
         return self._cached_state
@@ -472,14 +482,24 @@ class Incremental(ItemTransform[TDataItem], BaseConfiguration, Generic[TCursorVa
         # write back state
         self._cached_state["last_value"] = transformer.last_value
         if not transformer.deduplication_disabled:
-            # compute hashes for new last rows
-            unique_hashes = set(
-                transformer.compute_unique_value(row, self.primary_key)
-                for row in transformer.last_rows
+            unique_hashes = transformer.unique_hashes
+            if (
+                self.max_unique_hashes is not None
+                and len(unique_hashes) > self.max_unique_hashes
+                and not self._unique_hashes_capped
+            ):
+                self._unique_hashes_capped = True
+                logger.warning(
+                    f"Incremental for resource {self.resource_name} found {len(unique_hashes)} rows"
+                    f" with cursor value {transformer.last_value} but keeps only"
+                    f" {self.max_unique_hashes} (max_unique_hashes) of them in state. Remaining"
+                    " rows will not be deduplicated and will be loaded again in the next run. Use"
+                    " a cursor with more distinct values or a merge write disposition to avoid"
+                    " duplicates."
+                )
+            self._cached_state["unique_hashes"] = pack_unique_hashes(
+                unique_hashes, self.max_unique_hashes
             )
-            # add directly computed hashes
-            unique_hashes.update(transformer.unique_hashes)
-            self._cached_state["unique_hashes"] = list(unique_hashes)
 
         return rows
 
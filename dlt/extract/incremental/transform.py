@@ -1,8 +1,10 @@
+import base64
+import hashlib
+import heapq
 from datetime import datetime, date  # noqa: I251
-from typing import Any, Optional, Set, Tuple, List
+from typing import Any, Collection, Optional, Sequence, Set, Tuple, List, Union
 
 from dlt.common.exceptions import MissingDependencyException
-from dlt.common.utils import digest128
 from dlt.common.json import json
 from dlt.common.pendulum import pendulum
 from dlt.common.typing import TDataItem
@@ -33,6 +35,39 @@ except MissingDependencyException:
     pandas = None
 
 
+UNIQUE_HASH_SIZE = 8
+"""Size in bytes of the row digests used for deduplication. With `n` digests in the state, a new row
+is taken for a duplicate with a probability of about `n / 2**64`"""
+
+
+def unique_hash(v: str) -> bytes:
+    """Returns a shake128 digest of `v` used to deduplicate rows with the same cursor value"""
+    return hashlib.shake_128(v.encode("utf-8")).digest(UNIQUE_HASH_SIZE)
+
+
+def pack_unique_hashes(hashes: Collection[bytes], max_hashes: Optional[int] = None) -> str:
+    """Concatenates `hashes` into a compact, base64 encoded state representation. Keeps only
+    `max_hashes` smallest digests if set.
+    """
+    if max_hashes is not None and len(hashes) > max_hashes:
+        hashes = heapq.nsmallest(max_hashes, hashes)
+    return base64.b64encode(b"".join(hashes)).decode("ascii")
+
+
+def unpack_unique_hashes(packed: Union[str, Sequence[str]]) -> Set[bytes]:
+    """Reverses `pack_unique_hashes`. Also accepts a list of base64 encoded digests stored by
+    previous versions of dlt.
+    """
+    if isinstance(packed, str):
+        digests = base64.b64decode(packed)
+        return {
+            digests[idx : idx + UNIQUE_HASH_SIZE]
+            for idx in range(0, len(digests), UNIQUE_HASH_SIZE)
+        }
+    # shake128 digest is a prefix of a longer digest of the same value
+    return {base64.b64decode(h + "=" * (-len(h) % 4))[:UNIQUE_HASH_SIZE] for h in packed}
+
+
 class IncrementalTransform:
     def __init__(
         self,
@@ -43,7 +78,7 @@ class IncrementalTransform:
         end_value: Optional[TCursorValue],
         last_value_func: LastValueFunc[TCursorValue],
         primary_key: Optional[TTableHintTemplate[TColumnNames]],
-        unique_hashes: Set[str],
+        unique_hashes: Set[bytes],
     ) -> None:
         self.resource_name = resource_name
         self.cursor_path = cursor_path
@@ -51,11 +86,12 @@ class IncrementalTransform:
         self.start_value = start_value
         self.last_value = start_value
         self.end_value = end_value
-        self.last_rows: List[TDataItem] = []
         self.last_value_func = last_value_func
         self.primary_key = primary_key
         self.unique_hashes = unique_hashes
+        """Hashes of rows with cursor equal to `last_value`"""
         self.start_unique_hashes = set(unique_hashes)
+        """Hashes of rows with cursor equal to `start_value`, loaded in previous runs"""
 
         # compile jsonpath
         self._compiled_cursor_path = compile_path(cursor_path)
@@ -72,7 +108,7 @@ class IncrementalTransform:
         self,
         row: TDataItem,
         primary_key: Optional[TTableHintTemplate[TColumnNames]],
-    ) -> str:
+    ) -> bytes:
         try:
             assert not self.deduplication_disabled, (
                 f"{self.resource_name}: Attempt to compute unique values when deduplication is"
@@ -80,9 +116,11 @@ class IncrementalTransform:
             )
 
             if primary_key:
-                return digest128(json.dumps(resolve_column_value(primary_key, row), sort_keys=True))
+                return unique_hash(
+                    json.dumps(resolve_column_value(primary_key, row), sort_keys=True)
+                )
             elif primary_key is None:
-                return digest128(json.dumps(row, sort_keys=True))
+                return unique_hash(json.dumps(row, sort_keys=True))
             else:
                 return None
         except KeyError as k_err:
@@ -180,20 +218,27 @@ class JsonIncremental(IncrementalTransform):
             # we store row id for all records with the current "last_value" in state and use it to deduplicate
             if processed_row_value == last_value:
                 # add new hash only if the record row id is same as current last value
-                self.last_rows.append(row)
+                self._add_unique_hash(row)
         else:
             self.last_value = new_value
-            # store rows with "max" values to compute hashes after processing full batch
-            self.last_rows = [row]
             self.unique_hashes = set()
+            self._add_unique_hash(row)
 
         return row, False, False
 
+    def _add_unique_hash(self, row: TDataItem) -> None:
+        if not self.deduplication_disabled:
+            unique_value = self.compute_unique_value(row, self.primary_key)
+            if unique_value is not None:
+                self.unique_hashes.add(unique_value)
+
 
 class ArrowIncremental(IncrementalTransform):
     _dlt_index = "_dlt_index"
 
-    def compute_unique_values(self, item: "TAnyArrowItem", unique_columns: List[str]) -> List[str]:
+    def compute_unique_values(
+        self, item: "TAnyArrowItem", unique_columns: List[str]
+    ) -> List[bytes]:
         if not unique_columns:
             return []
         rows = item.select(unique_columns).to_pylist()
@@ -201,7 +246,7 @@ class ArrowIncremental(IncrementalTransform):
 
     def compute_unique_values_with_index(
         self, item: "TAnyArrowItem", unique_columns: List[str]
-    ) -> List[Tuple[int, str]]:
+    ) -> List[Tuple[int, bytes]]:
         if not unique_columns:
             return []
         indices = item[self._dlt_index].to_pylist()
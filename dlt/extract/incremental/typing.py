@@ -1,4 +1,4 @@
-from typing import TypedDict, Optional, Any, List, TypeVar, Callable, Sequence
+from typing import TypedDict, Optional, Any, List, TypeVar, Callable, Sequence, Union
 
 
 TCursorValue = TypeVar("TCursorValue", bound=Any)
@@ -8,4 +8,5 @@ LastValueFunc = Callable[[Sequence[TCursorValue]], Any]
 class IncrementalColumnState(TypedDict):
     initial_value: Optional[Any]
     last_value: Optional[Any]
-    unique_hashes: List[str]
+    unique_hashes: Union[str, List[str]]
+    """Base64 encoded, concatenated digests of rows with cursor equal to `last_value`. Older versions of dlt stored a list of base64 encoded digests"""
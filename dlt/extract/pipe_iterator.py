@@ -159,23 +159,22 @@ class PipeIterator(Iterator[PipeItem]):
                     pipe_item = self._get_source_item()
 
                 if pipe_item is None:
-                    # Wait for some time for futures to resolve
+                    if self._futures_pool.empty:
+                        if len(self._sources) == 0:
+                            # no more elements in futures or sources
+                            raise StopIteration()
+                        # sources are not ready and there's nothing to wait for - do a regular poll sleep
+                        self._futures_pool.sleep()
+                        continue
+                    # Wait for some time for futures to resolve. Do not sleep if future resolved to None
+                    # ie. filtered item or exhausted async generator, there may be more futures done
                     try:
                         pipe_item = self._futures_pool.resolve_next_future(
                             use_configured_timeout=True
                         )
                     except FutureTimeoutError:
                         pass
-                    else:
-                        if pipe_item is None:
-                            # pool was empty - then do a regular poll sleep
-                            self._futures_pool.sleep()
-
-                if pipe_item is None:
-                    if self._futures_pool.empty and len(self._sources) == 0:
-                        # no more elements in futures or sources
-                        raise StopIteration()
-                    else:
+                    if pipe_item is None:
                         continue
 
             item = pipe_item.item
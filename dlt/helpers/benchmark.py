@@ -0,0 +1,270 @@
+"""Synthetic end-to-end benchmarks of the extract, normalize and load steps.
+
+Run from the command line and store results as json lines, one per workload and destination:
+
+    python -m dlt.helpers.benchmark --rows 100000 --output results.jsonl
+
+Results from different dlt versions may be compared to catch throughput regressions.
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypedDict
+
+import dlt
+from dlt.common import json
+from dlt.common.destination import TDestinationReferenceArg
+from dlt.common.pendulum import pendulum
+from dlt.common.typing import TDataItems
+from dlt.common.utils import uniq_id
+from dlt.extract import DltResource
+
+BATCH_SIZE = 1000
+"""Number of rows yielded together by the synthetic data generators"""
+
+
+class TBenchmarkResult(TypedDict):
+    workload: str
+    destination: str
+    dlt_version: str
+    rows: int
+    """Number of rows written to all tables, including child tables"""
+    bytes: int
+    """Size of the normalized load package files"""
+    extract_time: float
+    normalize_time: float
+    load_time: float
+    total_time: float
+    rows_per_second: float
+    mb_per_second: float
+    peak_rss_mb: Optional[float]
+    """Peak resident memory of the benchmark process or of the largest of its finished worker processes,
+    None if not available on this platform. The peak is kept for the lifetime of a process so it includes
+    benchmarks that ran before in the same process. Use `run_benchmark_in_subprocess` to measure a single one.
+    """
+
+
+def _batched(rows: int, make_row: Callable[[int], Dict[str, Any]]) -> Iterator[TDataItems]:
+    for start in range(0, rows, BATCH_SIZE):
+        yield [make_row(idx) for idx in range(start, min(start + BATCH_SIZE, rows))]
+
+
+def nested_json(rows: int, seed: int = 0) -> DltResource:
+    """Events with nested objects and lists that normalize into a parent and two child tables"""
+    rnd = random.Random(seed)
+    start = pendulum.datetime(2024, 1, 1)
+
+    def _make_row(idx: int) -> Dict[str, Any]:
+        return {
+            "id": idx,
+            "created_at": start.add(seconds=idx),
+            "user": {"name": f"user_{rnd.randint(0, 10000)}", "score": rnd.random()},
+            "tags": [f"tag_{rnd.randint(0, 100)}" for _ in range(rnd.randint(0, 5))],
+            "items": [
+                {"sku": rnd.randint(0, 1000), "price": round(rnd.random() * 100, 2)}
+                for _ in range(rnd.randint(1, 3))
+            ],
+        }
+
+    return dlt.resource(_batched(rows, _make_row), name="nested_json")
+
+
+def wide_table(rows: int, columns: int = 200, seed: int = 0) -> DltResource:
+    """Flat rows with `columns` columns of mixed types"""
+    rnd = random.Random(seed)
+
+    def _make_row(idx: int) -> Dict[str, Any]:
+        row: Dict[str, Any] = {"id": idx}
+        for col in range(columns):
+            if col % 3 == 0:
+                row[f"col_{col}"] = rnd.randint(0, 1 << 30)
+            elif col % 3 == 1:
+                row[f"col_{col}"] = rnd.random()
+            else:
+                row[f"col_{col}"] = f"value_{rnd.randint(0, 1000)}"
+        return row
+
+    return dlt.resource(_batched(rows, _make_row), name="wide_table")
+
+
+def arrow_table(rows: int, seed: int = 0) -> DltResource:
+    """Arrow tables with numeric, string and timestamp columns. Requires `pyarrow`"""
+    from dlt.common.libs.pyarrow import pyarrow
+
+    rnd = random.Random(seed)
+    start = pendulum.datetime(2024, 1, 1)
+
+    def _tables() -> Iterator[Any]:
+        for batch_start in range(0, rows, BATCH_SIZE):
+            ids = range(batch_start, min(batch_start + BATCH_SIZE, rows))
+            yield pyarrow.table(
+                {
+                    "id": list(ids),
+                    "value": [rnd.random() for _ in ids],
+                    "name": [f"name_{rnd.randint(0, 1000)}" for _ in ids],
+                    "created_at": [start.add(seconds=idx) for idx in ids],
+                }
+            )
+
+    return dlt.resource(_tables(), name="arrow_table")
+
+
+def many_small_tables(rows: int, tables: int = 100, seed: int = 0) -> DltResource:
+    """Flat rows dispatched to `tables` tables"""
+    rnd = random.Random(seed)
+
+    def _make_row(idx: int) -> Dict[str, Any]:
+        return {"id": idx, "table": f"table_{idx % tables}", "value": rnd.random()}
+
+    return dlt.resource(
+        _batched(rows, _make_row), name="many_small_tables", table_name=lambda row: row["table"]
+    )
+
+
+WORKLOADS: Dict[str, Callable[[int], Any]] = {
+    "nested_json": nested_json,
+    "wide_table": wide_table,
+    "arrow_table": arrow_table,
+    "many_small_tables": many_small_tables,
+}
+
+DESTINATIONS = ("duckdb", "filesystem", "dummy")
+
+
+def _make_destination(destination: str, storage_path: str) -> TDestinationReferenceArg:
+    if destination == "duckdb":
+        return dlt.destinations.duckdb(os.path.join(storage_path, "benchmark.duckdb"))
+    if destination == "filesystem":
+        return dlt.destinations.filesystem(os.path.join(storage_path, "bucket"))
+    if destination == "dummy":
+        return dlt.destinations.dummy(completed_prob=1.0)
+    raise ValueError(f"Unknown benchmark destination {destination}, use one of {DESTINATIONS}")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # children are normalize workers that already exited, their peak is the largest of them
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # linux reports kilobytes, mac os bytes
+    return peak / (1024**2 if sys.platform == "darwin" else 1024)
+
+
+def run_benchmark(
+    workload: str, destination: str, rows: int, storage_path: str = None
+) -> TBenchmarkResult:
+    """Generates `rows` of `workload` data, runs extract, normalize and load separately into `destination` and
+    measures time of each step. Data generation is part of the extract time. Pipeline working dir and local destinations are created in `storage_path` or in
+    a temporary directory that is deleted afterwards.
+    """
+    if storage_path is None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            return run_benchmark(workload, destination, rows, tmp_dir)
+
+    data = WORKLOADS[workload](rows)
+    pipeline = dlt.pipeline(
+        pipeline_name=f"benchmark_{workload}_{uniq_id(4)}",
+        pipelines_dir=os.path.join(storage_path, "pipelines"),
+        destination=_make_destination(destination, storage_path),
+        dataset_name=f"benchmark_{workload}",
+    )
+
+    started = time.perf_counter()
+    pipeline.extract(data)
+    extracted = time.perf_counter()
+    normalize_info = pipeline.normalize()
+    normalized = time.perf_counter()
+    # measure normalized files before they get loaded
+    package_bytes = 0
+    for load_id in normalize_info.loads_ids:
+        package_info = pipeline.get_load_package_info(load_id)
+        package_bytes += sum(job.file_size for job in package_info.jobs["new_jobs"])
+    load_started = time.perf_counter()
+    pipeline.load()
+    loaded = time.perf_counter()
+
+    row_count = sum(
+        count
+        for table_name, count in normalize_info.row_counts.items()
+        if not table_name.startswith(pipeline.default_schema._dlt_tables_prefix)
+    )
+    total_time = (extracted - started) + (normalized - extracted) + (loaded - load_started)
+    return {
+        "workload": workload,
+        "destination": destination,
+        "dlt_version": dlt.__version__,
+        "rows": row_count,
+        "bytes": package_bytes,
+        "extract_time": extracted - started,
+        "normalize_time": normalized - extracted,
+        "load_time": loaded - load_started,
+        "total_time": total_time,
+        "rows_per_second": row_count / total_time,
+        "mb_per_second": package_bytes / (1024**2) / total_time,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_benchmark_in_subprocess(workload: str, destination: str, rows: int) -> TBenchmarkResult:
+    """Runs `run_benchmark` in a new process so `peak_rss_mb` is measured for this benchmark only"""
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return pool.submit(run_benchmark, workload, destination, rows).result()
+
+
+def run_benchmarks(
+    workloads: Sequence[str] = None, destinations: Sequence[str] = None, rows: int = 100000
+) -> List[TBenchmarkResult]:
+    """Runs all combinations of `workloads` and `destinations`, all known ones by default. Each
+    benchmark runs in a new process.
+    """
+    return [
+        run_benchmark_in_subprocess(workload, destination, rows)
+        for workload in workloads or WORKLOADS
+        for destination in destinations or DESTINATIONS
+    ]
+
+
+def main(argv: Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs synthetic dlt benchmarks and prints results as json lines"
+    )
+    parser.add_argument("--rows", type=int, default=100000, help="Rows generated per workload")
+    parser.add_argument(
+        "--workload",
+        action="append",
+        choices=list(WORKLOADS),
+        help="Workload to run, all if not set",
+    )
+    parser.add_argument(
+        "--destination",
+        action="append",
+        choices=list(DESTINATIONS),
+        help="Destination to load to, all if not set",
+    )
+    parser.add_argument("--output", help="Appends results to this file instead of printing them")
+    args = parser.parse_args(argv)
+
+    for workload in args.workload or WORKLOADS:
+        for destination in args.destination or DESTINATIONS:
+            line = json.dumps(run_benchmark_in_subprocess(workload, destination, args.rows))
+            if args.output:
+                with open(args.output, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            else:
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from dlt.common.configuration import configspec
 from dlt.common.storages import LoadStorageConfiguration
@@ -14,6 +14,10 @@ class LoaderConfiguration(PoolRunnerConfiguration):
     """when True, raises on terminally failed jobs immediately"""
     raise_on_max_retries: int = 5
     """When gt 0 will raise when job reaches raise_on_max_retries"""
+    job_poll_interval: float = 1.0
+    """How often (in seconds) the state of jobs running on the destination is checked. New jobs are started as soon as a worker is free"""
+    client_pool_size: Optional[int] = None
+    """How many destination clients (connections) are kept open and reused by load jobs of a package. Defaults to `workers`, set to 0 to open a new client for each job"""
     _load_storage_config: LoadStorageConfiguration = None
 
     def on_resolved(self) -> None:
@@ -1,12 +1,14 @@
 import contextlib
-from functools import reduce
+from functools import partial, reduce
 import datetime  # noqa: 251
-from typing import Dict, List, Optional, Tuple, Set, Iterator, Iterable
-from concurrent.futures import Executor
+from typing import Deque, Dict, List, Optional, Sequence, Tuple, Set, Iterator, Iterable
+from collections import deque
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
 import os
+import time
 
 from dlt.common import logger
-from dlt.common.runtime.signals import sleep
+from dlt.common.runtime.signals import sleep, raise_if_signalled
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.resolve import inject_section
 from dlt.common.configuration.accessors import config
@@ -53,7 +55,7 @@ from dlt.load.exceptions import (
     LoadClientUnsupportedWriteDisposition,
     LoadClientUnsupportedFileFormats,
 )
-from dlt.load.utils import get_completed_table_chain, init_client
+from dlt.load.utils import JobClientPool, get_completed_table_chain, init_client
 
 
 class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
@@ -79,6 +81,9 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.staging_destination = staging_destination
         self.pool = NullExecutor()
         self.load_storage: LoadStorage = self.create_storage(is_storage_owner)
+        self.client_pool = JobClientPool(
+            config.workers if config.client_pool_size is None else config.client_pool_size
+        )
         self._loaded_packages: List[LoadPackageInfo] = []
         super().__init__()
 
@@ -133,14 +138,20 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         job: LoadJob = None
         try:
             is_staging_destination_job = self.is_staging_destination_job(file_path)
-            job_client = self.get_destination_client(schema)
 
             # if we have a staging destination and the file is not a reference, send to staging
-            with (
-                self.get_staging_destination_client(schema)
-                if is_staging_destination_job
-                else job_client
+            # clients (and their connections) are reused by jobs running in the same worker
+            with self.client_pool.client(
+                (
+                    partial(self.get_staging_destination_client, schema)
+                    if is_staging_destination_job
+                    else partial(self.get_destination_client, schema)
+                ),
+                is_staging=is_staging_destination_job,
             ) as client:
+                job_client = (
+                    self.get_destination_client(schema) if is_staging_destination_job else client
+                )
                 job_info = ParsedLoadJobFileName.parse(file_path)
                 if job_info.file_format not in self.load_storage.supported_job_file_formats:
                     raise LoadClientUnsupportedFileFormats(
@@ -189,21 +200,6 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
         self.load_storage.normalized_packages.start_job(load_id, job.file_name())
         return job
 
-    def spool_new_jobs(self, load_id: str, schema: Schema) -> Tuple[int, List[LoadJob]]:
-        # use thread based pool as jobs processing is mostly I/O and we do not want to pickle jobs
-        load_files = self.load_storage.list_new_jobs(load_id)[: self.config.workers]
-        file_count = len(load_files)
-        if file_count == 0:
-            logger.info(f"No new jobs found in {load_id}")
-            return 0, []
-        logger.info(f"Will load {file_count}, creating jobs")
-        param_chunk = [(id(self), file, load_id, schema) for file in load_files]
-        # exceptions should not be raised, None as job is a temporary failure
-        # other jobs should not be affected
-        jobs = self.pool.map(Load.w_spool_job, *zip(*param_chunk))
-        # remove None jobs and check the rest
-        return file_count, [job for job in jobs if job is not None]
-
     def retrieve_jobs(
         self, client: JobClientBase, load_id: str, staging_client: JobClientBase = None
     ) -> Tuple[int, List[LoadJob]]:
@@ -402,9 +398,11 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             else:
                 jobs_count, jobs = self.retrieve_jobs(job_client, load_id)
 
+        new_files: Sequence[str] = []
         if not jobs:
             # jobs count is a total number of jobs including those that could not be initialized
-            jobs_count, jobs = self.spool_new_jobs(load_id, schema)
+            new_files = self.load_storage.list_new_jobs(load_id)
+            jobs_count = len(new_files)
         # if there are no existing or new jobs we complete the package
         if jobs_count == 0:
             self.complete_package(load_id, schema, False)
@@ -419,44 +417,120 @@ class Load(Runnable[Executor], WithStepInfo[LoadMetrics, LoadInfo]):
             self.collector.update(
                 "Jobs", no_failed_jobs, message="WARNING: Some of the jobs failed!", label="Failed"
             )
-        # loop until all jobs are processed
-        while True:
+        try:
+            # run until all jobs are processed
             try:
-                remaining_jobs = self.complete_jobs(load_id, jobs, schema)
-                if len(remaining_jobs) == 0:
-                    # get package status
-                    package_info = self.load_storage.normalized_packages.get_load_package_info(
-                        load_id
+                self.schedule_jobs(load_id, schema, jobs, new_files)
+            finally:
+                self.client_pool.close()
+            # get package status
+            package_info = self.load_storage.normalized_packages.get_load_package_info(load_id)
+            # possibly raise on failed jobs
+            if self.config.raise_on_failed_jobs:
+                if package_info.jobs["failed_jobs"]:
+                    failed_job = package_info.jobs["failed_jobs"][0]
+                    raise LoadClientJobFailed(
+                        load_id,
+                        failed_job.job_file_info.job_id(),
+                        failed_job.failed_message,
+                    )
+            # possibly raise on too many retries
+            if self.config.raise_on_max_retries:
+                for new_job in package_info.jobs["new_jobs"]:
+                    r_c = new_job.job_file_info.retry_count
+                    if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
+                        raise LoadClientJobRetry(
+                            load_id,
+                            new_job.job_file_info.job_id(),
+                            r_c,
+                            self.config.raise_on_max_retries,
+                        )
+        except LoadClientJobFailed:
+            # the package is completed and skipped
+            self.complete_package(load_id, schema, True)
+            raise
+
+    def schedule_jobs(
+        self, load_id: str, schema: Schema, jobs: List[LoadJob], new_files: Sequence[str]
+    ) -> None:
+        """Starts jobs for `new_files` and completes them together with already running `jobs`.
+
+        Keeps up to `workers` jobs starting or running at any time and starts a new job as soon as
+        a worker becomes free. Jobs that finish in the worker are completed immediately, jobs that
+        run on the destination are checked every `job_poll_interval` seconds. Files that get retried
+        or are created as followup jobs are left in new jobs and picked up in the next run.
+        """
+        queue: Deque[str] = deque(new_files)
+        starting: Set["Future[LoadJob]"] = set()
+        running: List[LoadJob] = list(jobs)
+        started_at: Dict[str, float] = {}
+        latencies: List[float] = []
+        max_queue_depth = 0
+        poll_interval = self.config.job_poll_interval
+        next_poll = time.monotonic() + poll_interval
+
+        def _complete(to_complete: List[LoadJob]) -> List[LoadJob]:
+            remaining_jobs = self.complete_jobs(load_id, to_complete, schema)
+            remaining_ids = {id(job) for job in remaining_jobs}
+            now = time.monotonic()
+            for job in to_complete:
+                if id(job) not in remaining_ids:
+                    # jobs retrieved in previous runs have unknown start time
+                    if (job_started_at := started_at.pop(job.file_name(), None)) is not None:
+                        latency = now - job_started_at
+                        latencies.append(latency)
+                        logger.info(f"Job {job.job_id()} finished in {latency:.3f}s")
+            return remaining_jobs
+
+        try:
+            while True:
+                # keep all workers busy
+                while queue and len(starting) + len(running) < self.config.workers:
+                    file_path = queue.popleft()
+                    started_at[ParsedLoadJobFileName.parse(file_path).file_name()] = (
+                        time.monotonic()
+                    )
+                    starting.add(
+                        self.pool.submit(Load.w_spool_job, id(self), file_path, load_id, schema)  # type: ignore[arg-type]
                     )
-                    # possibly raise on failed jobs
-                    if self.config.raise_on_failed_jobs:
-                        if package_info.jobs["failed_jobs"]:
-                            failed_job = package_info.jobs["failed_jobs"][0]
-                            raise LoadClientJobFailed(
-                                load_id,
-                                failed_job.job_file_info.job_id(),
-                                failed_job.failed_message,
-                            )
-                    # possibly raise on too many retries
-                    if self.config.raise_on_max_retries:
-                        for new_job in package_info.jobs["new_jobs"]:
-                            r_c = new_job.job_file_info.retry_count
-                            if r_c > 0 and r_c % self.config.raise_on_max_retries == 0:
-                                raise LoadClientJobRetry(
-                                    load_id,
-                                    new_job.job_file_info.job_id(),
-                                    r_c,
-                                    self.config.raise_on_max_retries,
-                                )
+                max_queue_depth = max(max_queue_depth, len(queue))
+                logger.debug(
+                    f"Load {load_id}: {len(queue)} job(s) queued, {len(starting)} starting,"
+                    f" {len(running)} running"
+                )
+                # complete jobs that were just started, unexpected worker exceptions are raised here
+                if started := [future for future in starting if future.done()]:
+                    starting.difference_update(started)
+                    running.extend(_complete([future.result() for future in started]))
+                # check the jobs running on the destination
+                if running and time.monotonic() >= next_poll:
+                    running = _complete(running)
+                    next_poll = time.monotonic() + poll_interval
+                if not (queue or starting or running):
                     break
-                # process remaining jobs again
-                jobs = remaining_jobs
-                # this will raise on signal
-                sleep(1)
-            except LoadClientJobFailed:
-                # the package is completed and skipped
-                self.complete_package(load_id, schema, True)
-                raise
+                # a worker got free, start next job without waiting
+                if queue and len(starting) + len(running) < self.config.workers:
+                    continue
+                # wait until a worker is free or the running jobs should be checked again
+                timeout = max(next_poll - time.monotonic(), 0.0) if running else poll_interval
+                if starting:
+                    wait(starting, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    # this will raise on signal
+                    sleep(timeout)
+                raise_if_signalled()
+        finally:
+            # jobs that are starting hold pooled clients, let them finish before clients are closed
+            for future in starting:
+                future.cancel()
+            wait(starting)
+
+        if latencies:
+            logger.info(
+                f"Load {load_id}: {len(latencies)} job(s) finished, max queue depth"
+                f" {max_queue_depth}, avg job latency {sum(latencies) / len(latencies):.3f}s, max"
+                f" job latency {max(latencies):.3f}s"
+            )
 
     def run(self, pool: Optional[Executor]) -> TRunMetrics:
         # store pool
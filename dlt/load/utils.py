@@ -1,4 +1,7 @@
-from typing import List, Set, Iterable, Callable
+import contextlib
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Set, Iterable, Callable, Tuple
 
 from dlt.common import logger
 from dlt.common.storages.load_package import LoadJobInfo, PackageStorage
@@ -184,3 +187,106 @@ def _extend_tables_with_table_chain(
                 continue
             result.add(chain_table_name)
     return result
+
+
+class JobClientPool:
+    """Keeps one open job client per worker thread and destination to be reused by the load jobs.
+
+    At most `max_size` clients are kept open, threads that do not fit in the pool get a client that
+    is closed right after use. Before a sql client that was idle for more than `probe_after` seconds
+    is reused, its connection is probed with a `SELECT 1` query and the client is replaced when the
+    probe fails. A pooled client is also dropped when the code using it raised. `close` must be
+    called when the load package is processed.
+    """
+
+    def __init__(self, max_size: int, probe_after: float = 30.0) -> None:
+        self.max_size = max_size
+        self.probe_after = probe_after
+        self._clients: Dict[Tuple[int, bool], Optional[JobClientBase]] = {}
+        self._last_used: Dict[Tuple[int, bool], float] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def client(
+        self, client_factory: Callable[[], JobClientBase], is_staging: bool = False
+    ) -> Iterator[JobClientBase]:
+        """Yields an open client for the current thread, creates it with `client_factory` if needed"""
+        key = (threading.get_ident(), is_staging)
+        with self._lock:
+            client = self._clients.get(key)
+            last_used = self._last_used.get(key, 0.0)
+        # pooled client is used only by this thread so it may be probed outside of the lock
+        if client is not None and not self.is_alive(
+            client, probe=time.monotonic() - last_used > self.probe_after
+        ):
+            with self._lock:
+                self._clients.pop(key, None)
+            self._close_client(client)
+            client = None
+        with self._lock:
+            is_pooled = key in self._clients or len(self._clients) < self.max_size
+            if is_pooled and client is None:
+                # reserve the slot so the (slow) connection is opened outside of the lock
+                self._clients[key] = None
+        if client is None:
+            try:
+                client = client_factory()
+                client.__enter__()
+            except Exception:
+                with self._lock:
+                    self._clients.pop(key, None)
+                raise
+            if is_pooled:
+                with self._lock:
+                    self._clients[key] = client
+        try:
+            yield client
+        except Exception:
+            if is_pooled:
+                # the connection may be broken, do not reuse
+                with self._lock:
+                    self._clients.pop(key, None)
+                self._close_client(client)
+            raise
+        finally:
+            if is_pooled:
+                with self._lock:
+                    self._last_used[key] = time.monotonic()
+            else:
+                self._close_client(client)
+
+    def close(self) -> None:
+        """Closes all pooled clients"""
+        with self._lock:
+            clients = [client for client in self._clients.values() if client is not None]
+            self._clients.clear()
+            self._last_used.clear()
+        for client in clients:
+            self._close_client(client)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def is_alive(client: JobClientBase, probe: bool = True) -> bool:
+        """Checks if connection of a sql client is open and, if `probe` is set, that it answers a query"""
+        if (sql_client := getattr(client, "sql_client", None)) is not None:
+            if not sql_client.native_connection:
+                return False
+            if probe:
+                try:
+                    sql_client.execute_sql("SELECT 1")
+                except Exception as ex:
+                    logger.warning(
+                        f"Pooled client {type(client).__name__} failed liveness probe and will be"
+                        f" reconnected: {ex}"
+                    )
+                    return False
+        return True
+
+    @staticmethod
+    def _close_client(client: JobClientBase) -> None:
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            logger.exception(f"Could not close pooled client {type(client).__name__}")
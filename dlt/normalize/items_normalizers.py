@@ -1,4 +1,4 @@
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Tuple
 from abc import abstractmethod
 
 from dlt.common import logger
@@ -50,6 +50,9 @@ class ItemsNormalizer:
 
 
 class JsonLItemsNormalizer(ItemsNormalizer):
+    READ_BLOCK_SIZE = 1024 * 1024
+    """Approximate number of bytes of lines read, decoded and normalized together"""
+
     def __init__(
         self,
         item_storage: DataItemStorage,
@@ -76,14 +79,28 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     row.pop(name)
         return row
 
+    def _write_batches(
+        self, batches: Dict[str, Tuple[TTableSchemaColumns, List[DictStrAny]]]
+    ) -> None:
+        schema_name = self.schema.name
+        for table_name, (columns, rows) in batches.items():
+            if rows:
+                self.item_storage.write_data_rows(
+                    self.load_id, schema_name, table_name, rows, columns
+                )
+        batches.clear()
+
     def _normalize_chunk(
         self, root_table_name: str, items: List[TDataItem], may_have_pua: bool, skip_write: bool
     ) -> TSchemaUpdate:
         column_schemas = self._column_schemas
         schema_update: TSchemaUpdate = {}
         schema = self.schema
-        schema_name = schema.name
         normalize_data_fun = self.schema.normalize_data_item
+        # coerced rows are collected per table and written in batches, together with a copy of the
+        # columns schema they were coerced against. a batch is written when the chunk is processed or
+        # when table columns change so writers see exactly the same sequence of schemas
+        batches: Dict[str, Tuple[TTableSchemaColumns, List[DictStrAny]]] = {}
 
         for item in items:
             items_gen = normalize_data_fun(item, self.load_id, root_table_name)
@@ -177,12 +194,19 @@ class JsonLItemsNormalizer(ItemsNormalizer):
                     #   will be useful if we implement bad data sending to a table
                     # we skip write when discovering schema for empty file
                     if not skip_write:
-                        self.item_storage.write_data_item(
-                            self.load_id, schema_name, table_name, row, columns
-                        )
+                        batch = batches.get(table_name)
+                        # columns can only be added so compare lengths like the writer does, the
+                        # columns dict may be modified in place by schema updates
+                        if batch is None or len(batch[0]) != len(columns):
+                            # columns changed: write rows coerced against previous columns
+                            if batch is not None:
+                                self._write_batches({table_name: batch})
+                            batch = batches[table_name] = (dict(columns), [])
+                        batch[1].append(row)
             except StopIteration:
                 pass
             signals.raise_if_signalled()
+        self._write_batches(batches)
         return schema_update
 
     def __call__(
@@ -194,16 +218,23 @@ class JsonLItemsNormalizer(ItemsNormalizer):
         with self.normalize_storage.extracted_packages.storage.open_file(
             extracted_items_file, "rb"
         ) as f:
-            # enumerate jsonl file line by line
-            line: bytes = None
-            for line_no, line in enumerate(f):
-                items: List[TDataItem] = json.loadb(line)
+            # read jsonl file in blocks of lines and decode each block as a single json array
+            line_no = 0
+            while True:
+                lines: List[bytes] = f.readlines(self.READ_BLOCK_SIZE)
+                if not lines:
+                    break
+                block = b"[" + b",".join(lines) + b"]"
+                items: List[TDataItem] = [
+                    item for line_items in json.loadb(block) for item in line_items
+                ]
                 partial_update = self._normalize_chunk(
-                    root_table_name, items, may_have_pua(line), skip_write=False
+                    root_table_name, items, may_have_pua(block), skip_write=False
                 )
                 schema_updates.append(partial_update)
-                logger.debug(f"Processed {line_no+1} lines from file {extracted_items_file}")
-            if line is None and root_table_name in self.schema.tables:
+                line_no += len(lines)
+                logger.debug(f"Processed {line_no} lines from file {extracted_items_file}")
+            if line_no == 0 and root_table_name in self.schema.tables:
                 # TODO: we should push the truncate jobs via package state
                 # not as empty jobs. empty jobs should be reserved for
                 # materializing schemas and other edge cases ie. empty parquet files
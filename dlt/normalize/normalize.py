@@ -1,10 +1,12 @@
 import os
 import itertools
-from typing import Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
-from concurrent.futures import Future, Executor
+import threading
+import time
+from collections import deque
+from typing import Callable, ClassVar, Deque, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, Executor, wait
 
 from dlt.common import logger
-from dlt.common.runtime.signals import sleep
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -35,12 +37,12 @@ from dlt.common.schema.exceptions import CannotCoerceColumnException
 from dlt.common.pipeline import (
     NormalizeInfo,
     NormalizeMetrics,
+    NormalizeWorkerMetrics,
     SupportsPipeline,
     WithStepInfo,
 )
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.storages.load_package import LoadPackageInfo
-from dlt.common.utils import chunks
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
@@ -54,6 +56,7 @@ from dlt.normalize.items_normalizers import (
 class TWorkerRV(NamedTuple):
     schema_updates: List[TSchemaUpdate]
     file_metrics: List[DataWriterMetrics]
+    worker_metrics: List[NormalizeWorkerMetrics]
 
 
 # normalize worker wrapping function signature
@@ -64,6 +67,8 @@ TMapFuncType = Callable[
 
 class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo]):
     pool: Executor
+    TASKS_PER_WORKER: ClassVar[int] = 4
+    """Files are split into tasks of similar size so each worker gets that many tasks on average"""
 
     @with_config(spec=NormalizeConfiguration, sections=(known_sections.NORMALIZE,))
     def __init__(
@@ -108,6 +113,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         load_id: str,
         extracted_items_files: Sequence[str],
     ) -> TWorkerRV:
+        started_at = time.monotonic()
         destination_caps = config.destination_capabilities
         schema_updates: List[TSchemaUpdate] = []
         item_normalizers: Dict[TDataItemFormat, ItemsNormalizer] = {}
@@ -228,7 +234,18 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                 writer_metrics = _gather_metrics_and_close(parsed_file_name, in_exception=False)
 
             logger.info(f"Processed all items in {len(extracted_items_files)} files")
-            return TWorkerRV(schema_updates, writer_metrics)
+            worker_metrics = NormalizeWorkerMetrics(
+                f"{os.getpid()}/{threading.current_thread().name}",
+                1,
+                len(extracted_items_files),
+                sum(
+                    os.path.getsize(normalize_storage.extracted_packages.storage.make_full_path(f))
+                    for f in extracted_items_files
+                ),
+                time.monotonic() - started_at,
+                0.0,
+            )
+            return TWorkerRV(schema_updates, writer_metrics, [worker_metrics])
 
     def update_table(self, schema: Schema, schema_updates: List[TSchemaUpdate]) -> None:
         for schema_update in schema_updates:
@@ -241,85 +258,85 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                     schema.update_table(partial_table)
 
     @staticmethod
-    def group_worker_files(files: Sequence[str], no_groups: int) -> List[Sequence[str]]:
-        # sort files so the same tables are in the same worker
-        files = list(sorted(files))
-
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -= 1
-            l_idx = idx + 1
-        return chunk_files
+    def group_worker_files(
+        files: Sequence[str], file_sizes: Sequence[int], max_group_size: float
+    ) -> List[List[str]]:
+        """Groups `files` into tasks, largest files first. Files are added to a group until its total
+        size reaches `max_group_size` so big files get own groups and small files are batched together.
+        """
+        # largest files first so the longest tasks start early, same tables are next to each other
+        sorted_files = sorted(zip(files, file_sizes), key=lambda f: (-f[1], f[0]))
+        groups: List[List[str]] = []
+        group_size = 0
+        for file, size in sorted_files:
+            if not groups or group_size >= max_group_size:
+                groups.append([])
+                group_size = 0
+            groups[-1].append(file)
+            group_size += size
+        return groups
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
         workers: int = getattr(self.pool, "_max_workers", 1)
-        chunk_files = self.group_worker_files(files, workers)
-        schema_dict: TStoredSchema = schema.to_dict()
-        param_chunk = [
-            (
-                self.config,
-                self.normalize_storage.config,
-                self.load_storage.config,
-                schema_dict,
-                load_id,
-                files,
+        storage = self.normalize_storage.extracted_packages.storage
+        file_sizes = [os.path.getsize(storage.make_full_path(file)) for file in files]
+        # hand out tasks one by one so a free worker always takes the next one
+        tasks: Deque[List[str]] = deque(
+            self.group_worker_files(
+                files, file_sizes, sum(file_sizes) / (workers * self.TASKS_PER_WORKER)
             )
-            for files in chunk_files
-        ]
+        )
+        logger.info(f"Will normalize {len(files)} files in {len(tasks)} tasks in {workers} workers")
+        # workers do not save the schema so version is not bumped
+        schema_dict: TStoredSchema = schema.to_dict(bump_version=False)
         # return stats
-        summary = TWorkerRV([], [])
-        # push all tasks to queue
-        tasks = [
-            (self.pool.submit(Normalize.w_normalize_files, *params), params)
-            for params in param_chunk
-        ]
+        summary = TWorkerRV([], [], [])
+        pending: Dict[Future[TWorkerRV], List[str]] = {}
 
-        while len(tasks) > 0:
-            sleep(0.3)
-            # operate on copy of the list
-            for task in list(tasks):
-                pending, params = task
-                if pending.done():
-                    # collect metrics from the exception (if any)
-                    if isinstance(pending.exception(), NormalizeJobFailed):
-                        summary.file_metrics.extend(pending.exception().writer_metrics)  # type: ignore[attr-defined]
-                    # Exception in task (if any) is raised here
-                    result: TWorkerRV = pending.result()
-                    try:
-                        # gather schema from all manifests, validate consistency and combine
-                        self.update_table(schema, result[0])
-                        summary.schema_updates.extend(result.schema_updates)
-                        summary.file_metrics.extend(result.file_metrics)
-                        # update metrics
-                        self.collector.update("Files", len(result.file_metrics))
-                        self.collector.update(
-                            "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
-                        )
-                    except CannotCoerceColumnException as exc:
-                        # schema conflicts resulting from parallel executing
-                        logger.warning(
-                            f"Parallel schema update conflict, retrying task ({str(exc)}"
-                        )
-                        # delete all files produced by the task
-                        for metrics in result.file_metrics:
-                            os.remove(metrics.file_path)
-                        # schedule the task again
-                        schema_dict = schema.to_dict()
-                        # TODO: it's time for a named tuple
-                        params = params[:3] + (schema_dict,) + params[4:]
-                        retry_pending: Future[TWorkerRV] = self.pool.submit(
-                            Normalize.w_normalize_files, *params
-                        )
-                        tasks.append((retry_pending, params))
-                    # remove finished tasks
-                    tasks.remove(task)
-                logger.debug(f"{len(tasks)} tasks still remaining for {load_id}...")
+        while tasks or pending:
+            while tasks and len(pending) < workers:
+                task_files = tasks.popleft()
+                params = (
+                    self.config,
+                    self.normalize_storage.config,
+                    self.load_storage.config,
+                    schema_dict,
+                    load_id,
+                    task_files,
+                )
+                pending[self.pool.submit(Normalize.w_normalize_files, *params)] = task_files
+            done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            signals.raise_if_signalled()
+            for future in done:
+                task_files = pending.pop(future)
+                # collect metrics from the exception (if any)
+                if isinstance(future.exception(), NormalizeJobFailed):
+                    summary.file_metrics.extend(future.exception().writer_metrics)  # type: ignore[attr-defined]
+                # Exception in task (if any) is raised here
+                result: TWorkerRV = future.result()
+                summary.worker_metrics.extend(result.worker_metrics)
+                try:
+                    # gather schema from all manifests, validate consistency and combine
+                    self.update_table(schema, result.schema_updates)
+                    summary.schema_updates.extend(result.schema_updates)
+                    summary.file_metrics.extend(result.file_metrics)
+                    # update metrics
+                    self.collector.update("Files", len(result.file_metrics))
+                    self.collector.update(
+                        "Items", sum(result.file_metrics, EMPTY_DATA_WRITER_METRICS).items_count
+                    )
+                except CannotCoerceColumnException as exc:
+                    # schema conflicts resulting from parallel executing
+                    logger.warning(f"Parallel schema update conflict, retrying task ({str(exc)}")
+                    # delete all files produced by the task
+                    for metrics in result.file_metrics:
+                        os.remove(metrics.file_path)
+                    # schedule the task again
+                    tasks.appendleft(task_files)
+                # send the schema with the updates so far with next tasks to avoid conflicts
+                if any(result.schema_updates):
+                    schema_dict = schema.to_dict(bump_version=False)
+            logger.debug(f"{len(tasks) + len(pending)} tasks still remaining for {load_id}...")
 
         return summary
 
@@ -328,7 +345,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
             self.config,
             self.normalize_storage.config,
             self.load_storage.config,
-            schema.to_dict(),
+            schema.to_dict(bump_version=False),
             load_id,
             files,
         )
@@ -342,14 +359,28 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
     def spool_files(
         self, load_id: str, schema: Schema, map_f: TMapFuncType, files: Sequence[str]
     ) -> None:
+        started_at = time.monotonic()
         # process files in parallel or in single thread, depending on map_f
-        schema_updates, writer_metrics = map_f(schema, load_id, files)
+        schema_updates, writer_metrics, task_metrics = map_f(schema, load_id, files)
+        elapsed = time.monotonic() - started_at
+        # aggregate task metrics per worker
+        worker_metrics: Dict[str, NormalizeWorkerMetrics] = {}
+        for metrics in task_metrics:
+            if metrics.worker_id in worker_metrics:
+                metrics = worker_metrics[metrics.worker_id] + metrics  # type: ignore[assignment]
+            worker_metrics[metrics.worker_id] = metrics
+        for worker_id, metrics in worker_metrics.items():
+            worker_metrics[worker_id] = metrics._replace(
+                utilization=min(metrics.busy_time / elapsed, 1.0) if elapsed else 1.0
+            )
         # compute metrics
         job_metrics = {ParsedLoadJobFileName.parse(m.file_path): m for m in writer_metrics}
         table_metrics: Dict[str, DataWriterMetrics] = {
             table_name: sum(map(lambda pair: pair[1], metrics), EMPTY_DATA_WRITER_METRICS)
             for table_name, metrics in itertools.groupby(
-                job_metrics.items(), lambda pair: pair[0].table_name
+                # tasks write the same tables, so metrics must be sorted before grouping
+                sorted(job_metrics.items(), key=lambda pair: pair[0].table_name),
+                lambda pair: pair[0].table_name,
             )
         }
         # update normalizer specific info
@@ -364,15 +395,19 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                     f"Table {table_name} has seen data for a first time with load id {load_id}"
                 )
                 x_normalizer["seen-data"] = True
-        # schema is updated, save it to schema volume
-        if schema.is_modified:
+        # schema is updated, save it to schema volume. compute the content hash only once,
+        # for large schemas serializing and hashing is the most expensive part of the commit
+        stored_schema = schema.to_dict()
+        if stored_schema["version_hash"] != schema.stored_version_hash:
             logger.info(
-                f"Saving schema {schema.name} with version {schema.stored_version}:{schema.version}"
+                f"Saving schema {schema.name} with version"
+                f" {schema.stored_version}:{stored_schema['version']}"
             )
             self.schema_storage.save_schema(schema)
         else:
             logger.info(
-                f"Schema {schema.name} with version {schema.version} was not modified. Save skipped"
+                f"Schema {schema.name} with version {stored_schema['version']} was not modified."
+                " Save skipped"
             )
         # save schema new package
         self.load_storage.new_packages.save_schema(load_id, schema)
@@ -396,6 +431,7 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
                 "finished_at": None,
                 "job_metrics": {job.job_id(): metrics for job, metrics in job_metrics.items()},
                 "table_metrics": table_metrics,
+                "worker_metrics": worker_metrics,
             },
         )
 
@@ -14,6 +14,8 @@ from requests import (
 )
 from requests.exceptions import ChunkedEncodingError
 from dlt.sources.helpers.requests.retry import Client
+from dlt.sources.helpers.requests.rate_limit import RateLimiter
+from dlt.sources.helpers.requests.cache import HttpCache
 from dlt.sources.helpers.requests.session import Session
 from dlt.common.configuration.specs import RunConfiguration
 
@@ -47,6 +49,8 @@ __all__ = [
     "head",
     "request",
     "init",
+    "RateLimiter",
+    "HttpCache",
     "Session",
     "Request",
     "Response",
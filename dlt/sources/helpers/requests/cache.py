@@ -0,0 +1,255 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from requests import PreparedRequest, Response, Session
+from requests.hooks import dispatch_hook
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from dlt.common import json
+from dlt.common.configuration.container import Container
+from dlt.common.configuration.paths import get_dlt_data_dir
+from dlt.common.pipeline import PipelineContext
+
+HTTP_CACHE_FILE_NAME = "http_cache.sqlite"
+# body is stored decoded so those headers do not apply to it anymore
+_NOT_STORED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+# conditional headers are added by the cache itself when revalidating
+_NOT_KEYED_HEADERS = {"if-none-match", "if-modified-since"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+class HttpCache:
+    """Caches successful GET responses in a SQLite file and revalidates them with conditional requests.
+
+    Responses with `ETag` or `Last-Modified` headers are stored, except those with `Cache-Control`
+    `no-store` or `private` or with `Vary: *`. Responses are keyed by method, url and all request
+    headers, so they are not shared between credentials and match the headers listed in `Vary`. On
+    later requests, also in later pipeline runs, `If-None-Match`/`If-Modified-Since` are sent and a
+    `304 Not Modified` response is replaced with the stored one. Responses younger than the `ttl` of their endpoint are served
+    without any request. When the cache grows above `max_size` bytes, least recently used responses
+    are evicted.
+
+    Attach it to a session with `attach` or pass it to `Client` or `RESTClient`.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_size: int = 512 * 1024 * 1024,
+        ttl: float = 0,
+        endpoint_ttl: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Args:
+            path (str, optional): Path to the SQLite cache file. When not set, `http_cache.sqlite`
+                in the working dir of the active pipeline is used, or in dlt data dir if there's no
+                active pipeline.
+            max_size (int): Max size of cached response bodies in bytes.
+            ttl (float): Seconds for which a cached response is served without a request. With
+                the default 0, every response is revalidated.
+            endpoint_ttl (Dict[str, float], optional): Per endpoint `ttl`, keys are regular expressions
+                searched in the request url. The first matching one is used.
+        """
+        self.path = path
+        self.max_size = max_size
+        self.ttl = ttl
+        self.endpoint_ttl = {re.compile(p): t for p, t in (endpoint_ttl or {}).items()}
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                context = Container()[PipelineContext]
+                storage_dir = (
+                    context.pipeline().working_dir if context.is_active() else get_dlt_data_dir()
+                )
+                self.path = os.path.join(storage_dir, HTTP_CACHE_FILE_NAME)
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self._conn.execute(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _ttl_for(self, url: str) -> float:
+        for pattern, ttl in self.endpoint_ttl.items():
+            if pattern.search(url):
+                return ttl
+        return self.ttl
+
+    @staticmethod
+    def _key(request: PreparedRequest) -> str:
+        # all request headers are in the key: responses for different credentials (`Authorization`,
+        # api key headers, cookies) are not mixed and headers listed in `Vary` always match
+        key = hashlib.sha256()
+        parts: List[Any] = [request.method, request.url]
+        for name, value in sorted(
+            (name.lower(), value)
+            for name, value in request.headers.items()
+            if name.lower() not in _NOT_KEYED_HEADERS
+        ):
+            parts.extend((name, value))
+        for part in parts:
+            key.update(part if isinstance(part, bytes) else str(part).encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    @staticmethod
+    def _is_storable(response: Response) -> bool:
+        cache_control = {
+            directive.split("=", 1)[0].strip().lower()
+            for directive in response.headers.get("Cache-Control", "").split(",")
+        }
+        if cache_control & {"no-store", "private"}:
+            return False
+        # response varies on something other than request headers
+        return response.headers.get("Vary", "").strip() != "*"
+
+    def _load(self, key: str) -> Optional[Tuple[Any, ...]]:
+        with self._lock:
+            cursor = self._connection().execute(
+                "SELECT headers, body, etag, last_modified, stored_at FROM responses WHERE key=?",
+                (key,),
+            )
+            return cursor.fetchone()  # type: ignore[no-any-return]
+
+    def _touch(self, key: str, revalidated: bool) -> None:
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self._connection().execute(
+                    "UPDATE responses SET accessed_at = ?, stored_at = ? WHERE key = ?",
+                    (now, now, key),
+                )
+            else:
+                self._connection().execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+    def _store(self, key: str, response: Response) -> None:
+        body = response.content
+        if len(body) > self.max_size:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    json.dumps(
+                        {
+                            k: v
+                            for k, v in response.headers.items()
+                            if k.lower() not in _NOT_STORED_HEADERS
+                        }
+                    ),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Removes least recently used responses until cache fits in `max_size`"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+    @staticmethod
+    def _cached_response(
+        request: PreparedRequest, headers: str, body: bytes, **kwargs: Any
+    ) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response._content = body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.from_cache = True  # type: ignore[attr-defined]
+        return dispatch_hook("response", request.hooks, response, **kwargs)
+
+    def attach(self, session: Session) -> None:
+        """Caches GET responses of `session`"""
+        # keep send already replaced on the instance, otherwise resolve the class method on each call
+        wrapped_send: Optional[Callable[..., Response]] = session.__dict__.get("send")
+
+        def _send(request: PreparedRequest, **kwargs: Any) -> Response:
+            return (
+                wrapped_send(request, **kwargs)
+                if wrapped_send
+                else type(session).send(session, request, **kwargs)
+            )
+
+        def _cached_send(request: PreparedRequest, **kwargs: Any) -> Response:
+            # streamed bodies are not read into memory so they can't be cached
+            if request.method != "GET" or kwargs.get("stream"):
+                return _send(request, **kwargs)
+
+            key = self._key(request)
+            cached = self._load(key)
+            if cached is not None:
+                headers, body, etag, last_modified, stored_at = cached
+                if time.time() - stored_at < self._ttl_for(request.url):
+                    self._touch(key, revalidated=False)
+                    return self._cached_response(request, headers, body, **kwargs)
+                if etag:
+                    request.headers["If-None-Match"] = etag
+                if last_modified:
+                    request.headers["If-Modified-Since"] = last_modified
+
+            response = _send(request, **kwargs)
+            if cached is not None and response.status_code == 304:
+                self._touch(key, revalidated=True)
+                return self._cached_response(request, headers, body, **kwargs)
+            if (
+                response.status_code == 200
+                and self._is_storable(response)
+                and (
+                    "ETag" in response.headers
+                    or "Last-Modified" in response.headers
+                    or self._ttl_for(request.url) > 0
+                )
+            ):
+                self._store(key, response)
+            return response
+
+        session.send = _cached_send  # type: ignore[method-assign]
@@ -0,0 +1,146 @@
+import asyncio
+import re
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+from typing import Any, Callable, Optional, Sequence
+
+from requests import Response, Session
+
+
+def parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parses `Retry-After` header value given in seconds or as http date into seconds from now"""
+    # Borrowed from urllib3
+    # Whitespace: https://tools.ietf.org/html/rfc7230#section-3.2.4
+    if re.match(r"^\s*[0-9]+\s*$", retry_after):
+        return float(int(retry_after))
+    retry_date_tuple = parsedate_tz(retry_after)
+    if retry_date_tuple is None:
+        return None
+    return mktime_tz(retry_date_tuple) - time.time()
+
+
+def _header_float(response: Response, *names: str) -> Optional[float]:
+    for name in names:
+        value = response.headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class RateLimiter:
+    """Token bucket rate limiter with a rate that adapts to the API (AIMD).
+
+    The rate grows by about `rate_increase` requests per second every second while responses
+    succeed and is multiplied by `decrease_factor` on each response with one of `status_codes`.
+    `Retry-After` pauses all requests and `X-RateLimit-Remaining`/`X-RateLimit-Reset` (or
+    `RateLimit-*`) spread the remaining quota over the time left until reset.
+
+    A single instance may be shared by many sessions, threads and async tasks. Attach it to a session
+    with `attach` or pass it to `Client` or `RESTClient`.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: int = 1,
+        min_rate: float = 0.1,
+        max_rate: Optional[float] = None,
+        rate_increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        status_codes: Sequence[int] = (429,),
+    ) -> None:
+        """
+        Args:
+            rate (float): Initial number of requests per second.
+            burst (int): Max number of requests sent at once after a period of inactivity.
+            min_rate (float): Rate will not be decreased below this value.
+            max_rate (float, optional): Rate will not be increased above this value. Not limited by default.
+            rate_increase (float): Requests per second added to the rate every second of successful responses.
+            decrease_factor (float): Multiplier applied to the rate on each rate limited response.
+            status_codes (Sequence[int]): Status codes of rate limited responses.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_increase = rate_increase
+        self.decrease_factor = decrease_factor
+        self.status_codes = set(status_codes)
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        # time of the last refill, is in the future when requests are paused
+        self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Takes a token and returns number of seconds to wait before sending the request"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+            self._updated = max(now, self._updated)
+            self._tokens -= 1
+            return (self._updated - now) + max(0.0, -self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Waits without blocking the event loop until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Stops sending requests for `seconds`"""
+        with self._lock:
+            self._updated = max(self._updated, time.monotonic() + seconds)
+            self._tokens = min(self._tokens, 0.0)
+
+    def update(self, response: Response) -> None:
+        """Adapts the rate to `response` status code and rate limit headers"""
+        remaining = _header_float(response, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = _header_float(response, "X-RateLimit-Reset", "RateLimit-Reset")
+        if reset is not None and reset > time.time() / 2:
+            # reset given as unix timestamp
+            reset -= time.time()
+        retry_after = response.headers.get("Retry-After")
+
+        with self._lock:
+            if response.status_code in self.status_codes:
+                self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            elif response.status_code < 400:
+                self.rate += self.rate_increase / self.rate
+                if self.max_rate is not None:
+                    self.rate = min(self.max_rate, self.rate)
+            if remaining is not None and remaining >= 1 and reset is not None and reset > 0:
+                # spread remaining quota until reset
+                self.rate = min(self.rate, max(self.min_rate, remaining / reset))
+
+        if remaining is not None and remaining < 1 and reset is not None and reset > 0:
+            self.pause(reset)
+        if retry_after and response.status_code >= 400:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None and seconds > 0:
+                self.pause(seconds)
+
+    def attach(self, session: Session) -> None:
+        """Limits all requests sent with `session`, including retries"""
+        # keep send already replaced on the instance, otherwise resolve the class method on each call
+        wrapped_send: Optional[Callable[..., Response]] = session.__dict__.get("send")
+
+        def _limited_send(request: Any, **kwargs: Any) -> Response:
+            self.acquire()
+            if wrapped_send is not None:
+                response = wrapped_send(request, **kwargs)
+            else:
+                response = type(session).send(session, request, **kwargs)
+            self.update(response)
+            return response
+
+        session.send = _limited_send  # type: ignore[method-assign]
@@ -1,6 +1,3 @@
-from email.utils import parsedate_tz, mktime_tz
-import re
-import time
 from typing import (
     Optional,
     cast,
@@ -30,6 +27,8 @@ from tenacity import (
 from tenacity.retry import retry_base
 
 from dlt.sources.helpers.requests.session import Session, DEFAULT_TIMEOUT
+from dlt.sources.helpers.requests.cache import HttpCache
+from dlt.sources.helpers.requests.rate_limit import RateLimiter, parse_retry_after
 from dlt.sources.helpers.requests.typing import TRequestTimeout
 from dlt.common.typing import TimedeltaSeconds
 from dlt.common.configuration.specs import RunConfiguration
@@ -78,17 +77,9 @@ class retry_if_predicate(retry_base):
 
 class wait_exponential_retry_after(wait_exponential):
     def _parse_retry_after(self, retry_after: str) -> Optional[float]:
-        # Borrowed from urllib3
-        seconds: float
-        # Whitespace: https://tools.ietf.org/html/rfc7230#section-3.2.4
-        if re.match(r"^\s*[0-9]+\s*$", retry_after):
-            seconds = int(retry_after)
-        else:
-            retry_date_tuple = parsedate_tz(retry_after)
-            if retry_date_tuple is None:
-                return None
-            retry_date = mktime_tz(retry_date_tuple)
-            seconds = retry_date - time.time()
+        seconds = parse_retry_after(retry_after)
+        if seconds is None:
+            return None
         return max(self.min, min(self.max, seconds))
 
     def _get_retry_after(self, retry_state: RetryCallState) -> Optional[float]:
@@ -166,6 +157,8 @@ class Client:
         request_max_retry_delay: Maximum delay when using exponential backoff
         respect_retry_after_header: Whether to use the `Retry-After` response header (when available) to determine the retry delay
         session_attrs: Extra attributes that will be set on the session instance, e.g. `{headers: {'Authorization': 'api-key'}}` (see `requests.sessions.Session` for possible attributes)
+        rate_limiter: Optional `RateLimiter` that paces all requests of the sessions created by this client, including retries. Share one instance between clients calling the same API
+        http_cache: Optional `HttpCache` that stores GET responses and revalidates them with conditional requests. Cache hits do not take tokens from `rate_limiter`
     """
 
     _session_attrs: Dict[str, Any]
@@ -186,8 +179,12 @@ class Client:
         request_max_retry_delay: TimedeltaSeconds = RunConfiguration.request_max_retry_delay,
         respect_retry_after_header: bool = True,
         session_attrs: Optional[Dict[str, Any]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
     ) -> None:
         self._adapter = HTTPAdapter(pool_maxsize=max_connections)
+        self._rate_limiter = rate_limiter
+        self._http_cache = http_cache
         self._local = local()
         self._session_kwargs = dict(timeout=request_timeout, raise_for_status=raise_for_status)
         self._retry_kwargs: Dict[str, Any] = dict(
@@ -240,6 +237,11 @@ class Client:
         session.mount("https://", self._adapter)
         retry = _make_retry(**self._retry_kwargs)
         session.request = retry.wraps(session.request)  # type: ignore[method-assign]
+        if self._rate_limiter is not None:
+            self._rate_limiter.attach(session)
+        # cache is attached last so cached responses skip the rate limiter
+        if self._http_cache is not None:
+            self._http_cache.attach(session)
         return session
 
     @property
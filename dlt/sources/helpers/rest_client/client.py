@@ -1,33 +1,43 @@
 from typing import (
+    Deque,
     Iterator,
     Optional,
     List,
     Dict,
     Any,
+    Tuple,
     TypeVar,
     Iterable,
     cast,
 )
 import copy
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from urllib.parse import urlparse
 from requests import Session as BaseSession  # noqa: I251
 from requests import Response, Request
 
 from dlt.common import jsonpath, logger
 
+from dlt.sources.helpers.requests.cache import HttpCache
+from dlt.sources.helpers.requests.rate_limit import RateLimiter
 from dlt.sources.helpers.requests.retry import Client
 
 from .typing import HTTPMethodBasic, HTTPMethod, Hooks
-from .paginators import BasePaginator
+from .paginators import BasePaginator, RangePaginator
 from .auth import AuthConfigBase
 from .detector import PaginatorFactory, find_response_page_data
 from .exceptions import IgnoreResponseException, PaginatorNotFound
+from .streaming import iter_json_items, simple_path_keys
 
 from .utils import join_url
 
 
 _T = TypeVar("_T")
 
+STREAM_READ_SIZE = 64 * 1024
+"""Number of bytes read from a response body at once in stream mode"""
+
 
 class PageData(List[_T]):
     """A list of elements in a single page of results with attached request context.
@@ -63,6 +73,10 @@ class RESTClient:
         session (BaseSession): HTTP session for making requests.
         paginator_factory (Optional[PaginatorFactory]): Factory for creating paginator instances,
             used for detecting paginators.
+        rate_limiter (Optional[RateLimiter]): Paces all requests sent by the client. May be shared
+            between clients and threads calling the same API.
+        http_cache (Optional[HttpCache]): Caches GET responses and revalidates them with conditional
+            requests on later calls and pipeline runs.
     """
 
     def __init__(
@@ -74,16 +88,27 @@ class RESTClient:
         data_selector: Optional[jsonpath.TJsonPath] = None,
         session: BaseSession = None,
         paginator_factory: Optional[PaginatorFactory] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        http_cache: Optional[HttpCache] = None,
     ) -> None:
         self.base_url = base_url
         self.headers = headers
         self.auth = auth
 
+        # creates a retrying session for each thread, not available with a custom session
+        self._client: Optional[Client] = None
         if session:
             self._validate_session_raise_for_status(session)
             self.session = session
+            if rate_limiter:
+                rate_limiter.attach(session)
+            if http_cache:
+                http_cache.attach(session)
         else:
-            self.session = Client(raise_for_status=False).session
+            self._client = Client(
+                raise_for_status=False, rate_limiter=rate_limiter, http_cache=http_cache
+            )
+            self.session = self._client.session
 
         self.paginator = paginator
         self.pagination_factory = paginator_factory or PaginatorFactory()
@@ -93,7 +118,7 @@ class RESTClient:
     def _validate_session_raise_for_status(self, session: BaseSession) -> None:
         # dlt.sources.helpers.requests.session.Session
         # has raise_for_status=True by default
-        if getattr(self.session, "raise_for_status", False):
+        if getattr(session, "raise_for_status", False):
             logger.warning(
                 "The session provided has raise_for_status enabled. "
                 "This may cause unexpected behavior."
@@ -124,7 +149,7 @@ class RESTClient:
             hooks=hooks,
         )
 
-    def _send_request(self, request: Request) -> Response:
+    def _send_request(self, request: Request, stream: bool = False) -> Response:
         logger.info(
             f"Making {request.method.upper()} request to {request.url}"
             f" with params={request.params}, json={request.json}"
@@ -132,7 +157,7 @@ class RESTClient:
 
         prepared_request = self.session.prepare_request(request)
 
-        return self.session.send(prepared_request)
+        return self.session.send(prepared_request, stream=stream)
 
     def request(self, path: str = "", method: HTTPMethod = "GET", **kwargs: Any) -> Response:
         prepared_request = self._create_request(
@@ -158,6 +183,10 @@ class RESTClient:
         paginator: Optional[BasePaginator] = None,
         data_selector: Optional[jsonpath.TJsonPath] = None,
         hooks: Optional[Hooks] = None,
+        concurrency: int = 1,
+        ordered: bool = True,
+        stream: bool = False,
+        stream_chunk_size: int = 1000,
     ) -> Iterator[PageData[Any]]:
         """Iterates over paginated API responses, yielding pages of data.
 
@@ -174,6 +203,19 @@ class RESTClient:
             hooks (Optional[Hooks]): Hooks to modify request/response objects. Note that
                 when hooks are not provided, the default behavior is to raise an exception
                 on error status codes.
+            concurrency (int): Maximum number of page requests in flight. When larger than 1 and
+                the paginator is a `RangePaginator` (ie. `OffsetPaginator` or `PageNumberPaginator`),
+                the pages after the first one are requested concurrently. Their params are computed
+                from the total or the maximum value known after the first response. Defaults to 1.
+            ordered (bool): Yield concurrently fetched pages in page order. When False, pages are
+                yielded as soon as they are received. Defaults to True.
+            stream (bool): Parse response bodies incrementally and yield the selected data in chunks
+                of `stream_chunk_size` items, so a large page is never fully held in memory. Requires
+                `data_selector` made only of keys (ie. `$.data[*]`) and a paginator that does not read
+                the response body (ie. `HeaderLinkPaginator`, `SinglePagePaginator` or range paginators
+                without `total_path`). Other selectors or paginators still work but read the full body.
+                Concurrently fetched pages are not streamed. Defaults to False.
+            stream_chunk_size (int): Maximum number of items in a page yielded in stream mode.
 
         Yields:
             PageData[Any]: A page of data from the paginated API response, along with request and response context.
@@ -206,28 +248,138 @@ class RESTClient:
         if paginator:
             paginator.init_request(request)
 
+        if concurrency > 1 and self._client is None:
+            logger.warning(
+                "Pages are requested one by one because a custom session can't be shared between"
+                " threads. Do not pass the session to RESTClient to fetch pages concurrently."
+            )
+            concurrency = 1
+
         while True:
             try:
-                response = self._send_request(request)
+                response = self._send_request(request, stream=stream)
             except IgnoreResponseException:
                 break
 
             if not data_selector:
                 data_selector = self.detect_data_selector(response)
-            data = self.extract_response(response, data_selector)
 
-            if paginator is None:
-                paginator = self.detect_paginator(response, data)
-            paginator.update_state(response)
-            paginator.update_request(request)
+            if stream:
+                if paginator is None:
+                    paginator = self.detect_paginator(response, None)
+                # paginator state must be updated before the body is consumed
+                paginator.update_state(response)
+                paginator.update_request(request)
+                for data in self.extract_response_chunks(
+                    response, data_selector, stream_chunk_size
+                ):
+                    yield PageData(
+                        data, request=request, response=response, paginator=paginator, auth=auth
+                    )
+            else:
+                data = self.extract_response(response, data_selector)
+
+                if paginator is None:
+                    paginator = self.detect_paginator(response, data)
+                paginator.update_state(response)
+                paginator.update_request(request)
 
-            # yield data with context
-            yield PageData(data, request=request, response=response, paginator=paginator, auth=auth)
+                # yield data with context
+                yield PageData(
+                    data, request=request, response=response, paginator=paginator, auth=auth
+                )
 
             if not paginator.has_next_page:
                 logger.info(f"Paginator {str(paginator)} does not have more pages")
                 break
 
+            if concurrency > 1 and isinstance(paginator, RangePaginator):
+                yield from self._paginate_concurrently(
+                    request, paginator, auth, data_selector, concurrency, ordered
+                )
+                break
+
+    def _paginate_concurrently(
+        self,
+        request: Request,
+        paginator: RangePaginator,
+        auth: AuthConfigBase,
+        data_selector: jsonpath.TJsonPath,
+        concurrency: int,
+        ordered: bool,
+    ) -> Iterator[PageData[Any]]:
+        """Requests the remaining pages of `paginator` with up to `concurrency` requests in flight.
+        Each worker thread uses its own session with the retries, headers and auth of the client
+        session. All sessions share one connection pool.
+        """
+
+        def _next_request() -> Optional[Request]:
+            if not paginator.has_next_page:
+                return None
+            page_request = copy.copy(request)
+            page_request.params = dict(request.params)
+            paginator.update_request(page_request)
+            paginator.advance()
+            return page_request
+
+        def _fetch(page_request: Request) -> Tuple[Response, List[Any]]:
+            logger.info(
+                f"Making {page_request.method.upper()} request to {page_request.url}"
+                f" with params={page_request.params}, json={page_request.json}"
+            )
+            # session of the worker thread, `request` (unlike `send`) retries failed requests
+            session = self._client.session
+            response = session.request(
+                page_request.method,
+                page_request.url,
+                params=page_request.params,
+                data=page_request.data,
+                headers=page_request.headers,
+                cookies=page_request.cookies,
+                files=page_request.files,
+                auth=page_request.auth,
+                hooks=page_request.hooks,
+                json=page_request.json,
+            )
+            return response, self.extract_response(response, data_selector)
+
+        pending: Deque[Tuple[Request, "Future[Tuple[Response, List[Any]]]"]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            try:
+                while True:
+                    while len(pending) < concurrency:
+                        page_request = _next_request()
+                        if page_request is None:
+                            break
+                        pending.append((page_request, pool.submit(_fetch, page_request)))
+                    if not pending:
+                        logger.info(f"Paginator {str(paginator)} does not have more pages")
+                        break
+
+                    if ordered:
+                        page_request, future = pending.popleft()
+                    else:
+                        wait([f for _, f in pending], return_when=FIRST_COMPLETED)
+                        page_request, future = next(p for p in pending if p[1].done())
+                        pending.remove((page_request, future))
+
+                    try:
+                        response, data = future.result()
+                    except IgnoreResponseException:
+                        break
+
+                    yield PageData(
+                        data,
+                        request=page_request,
+                        response=response,
+                        paginator=paginator,
+                        auth=auth,
+                    )
+            finally:
+                # do not start requests that were not sent yet
+                for _, future in pending:
+                    future.cancel()
+
     def extract_response(self, response: Response, data_selector: jsonpath.TJsonPath) -> List[Any]:
         # we should compile data_selector
         data: Any = jsonpath.find_values(data_selector, response.json())
@@ -245,6 +397,35 @@ class RESTClient:
             data = [data]
         return cast(List[Any], data)
 
+    def extract_response_chunks(
+        self, response: Response, data_selector: jsonpath.TJsonPath, chunk_size: int
+    ) -> Iterator[List[Any]]:
+        """Parses the response body incrementally and yields the data under `data_selector`
+        in lists of up to `chunk_size` items. Always yields at least one (possibly empty) list.
+        """
+        keys = simple_path_keys(data_selector)
+        if keys is None:
+            logger.warning(
+                f"Data selector {data_selector} can't be used to stream the response, full response"
+                " body will be parsed"
+            )
+            yield self.extract_response(response, data_selector)
+            return
+
+        chunk: List[Any] = []
+        yielded = False
+        try:
+            for item in iter_json_items(response.iter_content(STREAM_READ_SIZE), keys):
+                chunk.append(item)
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    yielded = True
+                    chunk = []
+        finally:
+            response.close()
+        if chunk or not yielded:
+            yield chunk
+
     def detect_data_selector(self, response: Response) -> str:
         """Detects a path to page data in `response`. If there's no
            paging detected, returns "$" which will select full response
@@ -122,6 +122,7 @@ class RangePaginator(BasePaginator):
         self.maximum_value = maximum_value
         self.total_path = jsonpath.compile_path(total_path) if total_path else None
         self.error_message_items = error_message_items
+        self._total: Optional[int] = None
 
     def init_request(self, request: Request) -> None:
         if request.params is None:
@@ -143,9 +144,17 @@ class RangePaginator(BasePaginator):
             except ValueError:
                 self._handle_invalid_total(total)
 
+        self._total = total
+        self.advance()
+
+    def advance(self) -> None:
+        """Moves to the next value without a response, using the total from the last response
+        and `maximum_value` to detect the last page. Allows to compute the remaining page
+        requests up front.
+        """
         self.current_value += self.value_step
 
-        if (total is not None and self.current_value >= total) or (
+        if (self._total is not None and self.current_value >= self._total) or (
             self.maximum_value is not None and self.current_value >= self.maximum_value
         ):
             self._has_next_page = False
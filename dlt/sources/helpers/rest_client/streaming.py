@@ -0,0 +1,128 @@
+"""Incremental reading of json arrays from streamed response bodies"""
+import codecs
+import json as stdlib_json  # dlt json does not decode partial documents
+import re
+from typing import Any, Iterator, List, Optional
+
+from dlt.common import jsonpath
+
+_WHITESPACE = " \t\n\r"
+_DECODER = stdlib_json.JSONDecoder()
+_SIMPLE_KEY = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+def simple_path_keys(data_selector: jsonpath.TJsonPath) -> Optional[List[str]]:
+    """Converts a data selector made only of object keys, optionally ending with `[*]`,
+    ie. `$.data[*]` or `results.items`, into a list of keys. Returns None for other selectors.
+    """
+    path = str(data_selector).strip()
+    if path.endswith("[*]"):
+        path = path[:-3]
+    keys = path.split(".")
+    if keys[0] == "$":
+        keys = keys[1:]
+    if all(_SIMPLE_KEY.match(key) for key in keys):
+        return keys
+    return None
+
+
+class _JsonStreamReader:
+    """Decodes json values from a stream of byte chunks, keeping only the not yet decoded part in memory"""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_chunk(self) -> bool:
+        """Appends the next chunk to the buffer, returns False if stream ended"""
+        if self._eof:
+            return False
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            self._buffer += self._decoder.decode(b"", final=True)
+            return False
+        self._buffer += self._decoder.decode(chunk)
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, empty string at the end of stream"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_chunk():
+                return ""
+
+    def skip(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                f"Expected '{char}' at position {self._pos} of json stream, got '{self.peek()}'"
+            )
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decodes the next complete json value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buffer, self._pos)
+            except ValueError:
+                # value is incomplete: at least double the buffered data so large values
+                # are not decoded from the start for every chunk
+                wanted = 2 * (len(self._buffer) - self._pos)
+                read = False
+                while self._read_chunk():
+                    read = True
+                    if len(self._buffer) >= wanted:
+                        break
+                if read:
+                    continue
+                raise
+            # a number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._read_chunk():
+                continue
+            self._pos = end
+            return value
+
+    def find_key(self, key: str) -> bool:
+        """Moves to the value of `key` in the object at the current position"""
+        if self.peek() != "{":
+            return False
+        self.skip("{")
+        while self.peek() != "}":
+            found = self.value() == key
+            self.skip(":")
+            if found:
+                return True
+            self.value()
+            if self.peek() == ",":
+                self.skip(",")
+        return False
+
+
+def iter_json_items(chunks: Iterator[bytes], keys: List[str]) -> Iterator[Any]:
+    """Yields elements of the json array found under `keys` in a document streamed in `chunks`.
+    Yields the value itself if it is not an array and nothing if `keys` are not found.
+    """
+    reader = _JsonStreamReader(chunks)
+    for key in keys:
+        if not reader.find_key(key):
+            return
+    if reader.peek() != "[":
+        yield reader.value()
+        return
+    reader.skip("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == "]":
+            return
+        reader.skip(",")
@@ -22,6 +22,10 @@ def get_writer(
     file_max_bytes: int = None,
     disable_compression: bool = False,
     caps: DestinationCapabilitiesContext = None,
+    background_flush: bool = False,
+    compression_level: int = 9,
+    buffer_max_bytes: int = None,
+    buffers_max_bytes: int = None,
 ) -> BufferedDataWriter[TWriter]:
     caps = caps or DestinationCapabilitiesContext.generic_capabilities()
     writer_spec = writer.writer_spec()
@@ -34,5 +38,9 @@ def get_writer(
         file_max_items=file_max_items,
         file_max_bytes=file_max_bytes,
         disable_compression=disable_compression,
+        background_flush=background_flush,
+        compression_level=compression_level,
+        buffer_max_bytes=buffer_max_bytes,
+        buffers_max_bytes=buffers_max_bytes,
         _caps=caps,
     )
@@ -1,5 +1,6 @@
 import pytest
 
+from dlt.common import json
 from dlt.common.typing import StrAny, DictStrAny
 from dlt.common.normalizers.naming import NamingConvention
 from dlt.common.schema.typing import TSimpleRegex
@@ -466,6 +467,16 @@ def test_child_row_deterministic_hash(norm: RelationalNormalizer) -> None:
     assert all(ch[0][1]["_dlt_id"] != ch[1][1]["_dlt_id"] for ch in zip(children, children_3))
 
 
+def test_row_hash(norm: RelationalNormalizer) -> None:
+    row = {"b": "ł", "a": 1, "_dlt_load_id": "1234", "c": {"n": [1, 2]}}
+    expected_hash = digest128(
+        json.dumps({"a": 1, "b": "ł", "c": {"n": [1, 2]}}, sort_keys=True), DLT_ID_LENGTH_BYTES
+    )
+    assert norm.get_row_hash(row) == expected_hash
+    # dlt columns and order of keys do not change the hash
+    assert norm.get_row_hash({"c": {"n": [1, 2]}, "a": 1, "b": "ł"}) == expected_hash
+
+
 def test_keeps_dlt_id(norm: RelationalNormalizer) -> None:
     h = uniq_id()
     row = {"a": "b", "_dlt_id": h}
@@ -167,6 +167,30 @@ def test_coerce_row(schema: Schema) -> None:
     assert not isinstance(exc_val.value.coerced_value, bytes)
 
 
+def test_coerce_row_coercion_plan(schema: Schema) -> None:
+    _, new_table = schema.coerce_row("event_user", None, {"confidence": 0.1, "name": "A"})
+    schema.update_table(new_table)
+    # plan is compiled for known columns and python types
+    new_row, new_table = schema.coerce_row("event_user", None, {"confidence": 1, "name": "B"})
+    assert new_table is None
+    assert new_row == {"confidence": 1.0, "name": "B"}
+    assert isinstance(new_row["confidence"], float)
+    plan = schema._coercion_plans["event_user"][1]
+    assert set(plan.keys()) == {("confidence", int), ("name", str)}
+    # value that does not fit the compiled converter still creates a variant
+    new_row, new_table = schema.coerce_row("event_user", None, {"confidence": "STR"})
+    assert new_row == {"confidence__v_text": "STR"}
+    assert "confidence__v_text" in new_table["columns"]
+    # plan is dropped when table is updated
+    schema.update_table(new_table)
+    assert "event_user" not in schema._coercion_plans
+    new_row, new_table = schema.coerce_row("event_user", None, {"confidence": "STR"})
+    assert new_table is None
+    assert new_row == {"confidence__v_text": "STR"}
+    # variant columns do not go into the plan
+    assert schema._coercion_plans["event_user"][1] == {}
+
+
 def test_coerce_row_iso_timestamp(schema: Schema) -> None:
     _add_preferred_types(schema)
     timestamp_str = "2022-05-10T00:17:15.300000+00:00"
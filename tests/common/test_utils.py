@@ -10,6 +10,7 @@ from dlt.common.utils import (
     graph_find_scc_nodes,
     flatten_list_of_str_or_dicts,
     digest128,
+    digest128_many,
     graph_edges_to_nodes,
     map_nested_in_place,
     reveal_pseudo_secret,
@@ -39,6 +40,12 @@ def test_digest128_length() -> None:
     assert len(digest128("hash it")) == 120 / 6
 
 
+def test_digest128_many() -> None:
+    assert digest128_many("prefix_ł_", 0) == []
+    digests = digest128_many("prefix_ł_", 12, 10)
+    assert digests == [digest128(f"prefix_ł_{idx}", 10) for idx in range(12)]
+
+
 def test_map_dicts_in_place() -> None:
     _d = {"a": "1", "b": ["a", "b", ["a", "b"], {"a": "c"}], "c": {"d": "e", "e": ["a", 2]}}
     exp_d = {
@@ -7,7 +7,12 @@ from dlt.common import logger, pendulum
 from dlt.common.storages import LoadStorage
 from dlt.common.storages.load_package import ParsedLoadJobFileName
 
-from dlt.destinations.path_utils import create_path, get_table_prefix_layout
+from dlt.destinations.path_utils import (
+    DATETIME_PLACEHOLDERS,
+    create_path,
+    get_table_prefix_layout,
+    prepare_datetime_params,
+)
 
 from dlt.destinations.exceptions import InvalidFilesystemLayout, CantExtractTablePrefix
 from tests.common.storages.utils import start_loading_file, load_storage
@@ -571,3 +576,16 @@ def test_create_path_resolves_extra_placeholders(test_load: TestLoad) -> None:
         == f"schema_name/mock_table/boo-boo/{load_id}.{job_info.file_id}.{timestamp}.jsonl"
     )
     assert counter.count == 2
+
+
+def test_prepare_datetime_params_only_placeholders() -> None:
+    now = pendulum.datetime(2024, 4, 14, 8, 32, 0)
+    params = prepare_datetime_params(now)
+    assert DATETIME_PLACEHOLDERS.issubset(params)
+    # only requested formats are rendered
+    params = prepare_datetime_params(now, placeholders=["YYYY", "MM", "table_name"])
+    assert params["YYYY"] == "2024"
+    assert params["MM"] == "04"
+    assert DATETIME_PLACEHOLDERS.intersection(params) == {"YYYY", "MM"}
+    assert "table_name" not in params
+    assert params["timestamp"] == str(int(now.timestamp()))
@@ -1,8 +1,11 @@
+import gc
 import os
 import pytest
 import time
 from typing import Iterator, Type
+from unittest.mock import patch
 
+from dlt.common.data_writers.buffered import BUFFERS_MEMORY, BufferedDataWriter
 from dlt.common.data_writers.exceptions import BufferedDataWriterClosed
 from dlt.common.data_writers.writers import (
     DataWriter,
@@ -330,3 +333,207 @@ def test_special_write_rotates(disable_compression: bool, writer_type: Type[Data
         metrics = writer.import_file(
             "tests/extract/cases/imported.any", DataWriterMetrics("", 1, 231, 0, 0)
         )
+
+
+def test_compression_level() -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    files = []
+    for compression_level in (1, 9):
+        with get_writer(
+            JsonlWriter,
+            buffer_max_items=100,
+            file_max_items=1000,
+            compression_level=compression_level,
+        ) as writer:
+            writer.write_data_item([{"col1": f"value {idx % 17}"} for idx in range(1000)], t1)
+        files.append(writer.closed_files[0])
+    # both files are gzipped and have the same content
+    assert all(FileStorage.is_gzipped(m.file_path) for m in files)
+    with FileStorage.open_zipsafe_ro(files[0].file_path, "rb") as f:
+        content = f.read()
+    with FileStorage.open_zipsafe_ro(files[1].file_path, "rb") as f:
+        assert f.read() == content
+    # file_size is the uncompressed size
+    assert files[0].file_size == files[1].file_size
+    assert os.path.getsize(files[0].file_path) > os.path.getsize(files[1].file_path)
+
+
+def test_flush_on_buffer_max_bytes() -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    doc = {"col1": "x" * 1000}
+    with get_writer(
+        JsonlWriter, buffer_max_items=1000, file_max_items=1000, buffer_max_bytes=5000
+    ) as writer:
+        for _ in range(4):
+            writer.write_data_item(doc, t1)
+        # nothing flushed
+        assert writer._file is None
+        assert writer._buffered_bytes >= 4000
+        writer.write_data_item(doc, t1)
+        # flushed on size
+        assert writer._file is not None
+        assert writer._buffered_items == []
+        assert writer._buffered_bytes == 0
+    assert writer.closed_files[0].items_count == 5
+
+
+def test_flush_largest_on_buffers_max_bytes() -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    small_doc = {"col1": "x" * 10}
+    large_doc = {"col1": "x" * 1000}
+    buffers_memory = BUFFERS_MEMORY.buffered_bytes
+    writers = [
+        get_writer(
+            JsonlWriter,
+            buffer_max_items=1000,
+            file_max_items=1000,
+            buffers_max_bytes=buffers_memory + 5000,
+        )
+        for _ in range(3)
+    ]
+    try:
+        writers[0].write_data_item([small_doc] * 10, t1)
+        writers[1].write_data_item([large_doc] * 3, t1)
+        assert BUFFERS_MEMORY.buffered_bytes > buffers_memory + 3000
+        # exceed the limit with a small write to another writer
+        writers[2].write_data_item([small_doc] * 120, t1)
+        # the largest buffer was flushed
+        assert writers[1]._buffered_items == []
+        assert writers[0]._buffered_items != []
+        assert writers[2]._buffered_items != []
+        assert BUFFERS_MEMORY.buffered_bytes < buffers_memory + 5000
+    finally:
+        for writer in writers:
+            writer.close()
+    # closed writers do not count
+    assert BUFFERS_MEMORY.buffered_bytes == buffers_memory
+    assert [len(w.closed_files) for w in writers] == [1, 1, 1]
+
+
+def test_buffers_max_bytes_skips_small_thread_buffers() -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    small_doc = {"col1": "x" * 10}
+    large_doc = {"col1": "x" * 1000}
+    buffers_memory = BUFFERS_MEMORY.buffered_bytes
+    buffers_max_bytes = buffers_memory + 9200
+
+    def _new_writer() -> BufferedDataWriter[DataWriter]:
+        return get_writer(
+            JsonlWriter,
+            buffer_max_items=1000,
+            file_max_items=1000,
+            buffers_max_bytes=buffers_max_bytes,
+        )
+
+    foreign_writer = _new_writer()
+    writer = _new_writer()
+    try:
+        # writer of another thread holds most of the limit
+        foreign_writer.write_data_item([large_doc] * 9, t1)
+        foreign_writer._thread_id = -1
+        writer.write_data_item([small_doc] * 10, t1)
+        assert BUFFERS_MEMORY.buffered_bytes >= buffers_max_bytes
+        # small writes of this thread are not flushed one by one
+        for _ in range(5):
+            writer.write_data_item([small_doc] * 2, t1)
+        assert len(writer._buffered_items) == 20
+        assert writer._writer is None
+        # once this thread holds a larger share, its buffers get flushed
+        writer.write_data_item([large_doc] * 2, t1)
+        assert writer._buffered_items == []
+        assert foreign_writer._buffered_items != []
+    finally:
+        writer.close()
+        foreign_writer.close()
+    assert BUFFERS_MEMORY.buffered_bytes == buffers_memory
+
+
+def test_buffers_memory_released_on_gc() -> None:
+    c1 = new_column("col1", "text")
+    t1 = {"col1": c1}
+    buffers_memory = BUFFERS_MEMORY.buffered_bytes
+    writer = get_writer(JsonlWriter, buffers_max_bytes=buffers_memory + 100000)
+    writer.write_data_item([{"col1": "x" * 1000}] * 3, t1)
+    assert BUFFERS_MEMORY.buffered_bytes > buffers_memory + 3000
+    # writer dropped without closing
+    del writer
+    gc.collect()
+    assert BUFFERS_MEMORY.buffered_bytes == buffers_memory
+
+
+@pytest.mark.parametrize("writer_type", ALL_OBJECT_WRITERS)
+def test_background_flush(writer_type: Type[DataWriter]) -> None:
+    c1 = new_column("col1", "bigint")
+    t1 = {"col1": c1}
+    files = []
+    for background_flush in (False, True):
+        with get_writer(
+            writer_type, buffer_max_items=10, file_max_items=25, background_flush=background_flush
+        ) as writer:
+            for idx in range(0, 105, 3):
+                writer.write_data_item([{"col1": idx}, {"col1": idx + 1}, {"col1": idx + 2}], t1)
+        assert writer._flush_pool is None
+        files.append(writer.closed_files)
+    # files rotate in the same way and have the same content
+    assert [m.items_count for m in files[0]] == [m.items_count for m in files[1]]
+    assert sum(m.items_count for m in files[1]) == 105
+    for sync_metrics, background_metrics in zip(*files):
+        assert sync_metrics.file_size == background_metrics.file_size
+        with FileStorage.open_zipsafe_ro(sync_metrics.file_path, "rb") as f:
+            sync_content = f.read()
+        with FileStorage.open_zipsafe_ro(background_metrics.file_path, "rb") as f:
+            assert f.read() == sync_content
+
+
+@pytest.mark.parametrize("writer_type", ALL_OBJECT_WRITERS)
+def test_background_flush_error(writer_type: Type[DataWriter]) -> None:
+    c1 = new_column("col1", "bigint")
+    t1 = {"col1": c1}
+    with pytest.raises(RuntimeError):
+        with get_writer(
+            writer_type, buffer_max_items=2, file_max_items=100, background_flush=True
+        ) as writer:
+            writer.write_data_item([{"col1": 1}], t1)
+            writer.write_data_item([{"col1": 2}], t1)
+            # fail writing to file in background
+            with patch.object(writer._writer, "write_data", side_effect=RuntimeError("disk full")):
+                writer.write_data_item([{"col1": 3}, {"col1": 4}], t1)
+                # error is raised on producer side on next flush
+                writer.write_data_item([{"col1": 5}, {"col1": 6}], t1)
+    # background thread was stopped
+    assert writer._flush_pool is None
+    assert writer.closed
+
+
+@pytest.mark.parametrize(
+    "limits",
+    [
+        dict(buffer_max_items=10, file_max_items=10),
+        dict(buffer_max_items=7, file_max_items=25),
+        dict(buffer_max_items=10, file_max_items=None, file_max_bytes=300),
+        dict(buffer_max_items=100, file_max_items=None, file_max_bytes=300, buffer_max_bytes=60),
+    ],
+    ids=["max_items", "buffer_smaller_than_file", "max_bytes", "buffer_max_bytes"],
+)
+def test_write_data_rows_rotates_like_single_rows(limits: DictStrAny) -> None:
+    c1 = new_column("col1", "bigint")
+    t1 = {"col1": c1}
+    rows = [{"col1": idx} for idx in range(103)]
+    files = []
+    for write_rows in (False, True):
+        with get_writer(JsonlWriter, disable_compression=True, **limits) as writer:
+            # a few single rows so the buffer is partially filled
+            for row in rows[:3]:
+                writer.write_data_item(row, t1)
+            if write_rows:
+                assert writer.write_data_rows(rows[3:], t1) == 100
+            else:
+                for row in rows[3:]:
+                    writer.write_data_item(row, t1)
+        files.append([m.items_count for m in writer.closed_files])
+    assert len(files[0]) > 1
+    assert files[0] == files[1]
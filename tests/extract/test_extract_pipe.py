@@ -3,12 +3,14 @@ import asyncio
 import inspect
 from typing import List, Sequence
 import time
+from unittest import mock
 
 import pytest
 
 import dlt
 from dlt.common import sleep
 from dlt.common.typing import TDataItems
+from dlt.extract.concurrency import FuturesPool
 from dlt.extract.exceptions import CreatePipeException, ResourceExtractionError, UnclosablePipe
 from dlt.extract.items import DataItemWithMeta, FilterItem, MapItem, YieldMapItem
 from dlt.extract.pipe import Pipe
@@ -109,6 +111,26 @@ def test_rotation_on_none() -> None:
     assert time.time() - started < 3.5
 
 
+def test_no_poll_sleep_on_resolved_futures() -> None:
+    async def source_gen():
+        for i in range(20):
+            await asyncio.sleep(0.001)
+            yield i
+
+    async def filter_odd(item: int) -> int:
+        await asyncio.sleep(0.001)
+        # futures resolving to None are filtered out
+        return None if item % 2 else item
+
+    pipe = Pipe.from_data("data", source_gen())
+    pipe.append_step(filter_odd)  # type: ignore[arg-type]
+    with mock.patch.object(FuturesPool, "sleep") as poll_sleep:
+        _l = list(PipeIterator.from_pipe(pipe))
+    assert [pi.item for pi in _l] == list(range(0, 20, 2))
+    # iterator waits on futures and never sleeps when futures are pending
+    poll_sleep.assert_not_called()
+
+
 def test_add_step() -> None:
     data = [1, 2, 3]
     data_iter = iter(data)
@@ -15,7 +15,12 @@ from dlt.common.configuration.container import Container
 from dlt.common.configuration.specs.base_configuration import configspec, BaseConfiguration
 from dlt.common.configuration import ConfigurationValueError
 from dlt.common.pendulum import pendulum, timedelta
-from dlt.common.pipeline import NormalizeInfo, StateInjectableContext, resource_state
+from dlt.common.pipeline import (
+    NormalizeInfo,
+    StateInjectableContext,
+    TPipelineState,
+    resource_state,
+)
 from dlt.common.schema.schema import Schema
 from dlt.common.utils import uniq_id, digest128, chunks
 from dlt.common.json import json
@@ -23,6 +28,11 @@ from dlt.common.json import json
 from dlt.extract import DltSource
 from dlt.extract.exceptions import InvalidStepFunctionArguments
 from dlt.extract.resource import DltResource
+from dlt.extract.incremental.transform import (
+    pack_unique_hashes,
+    unique_hash,
+    unpack_unique_hashes,
+)
 from dlt.sources.helpers.transform import take_first
 from dlt.extract.incremental.exceptions import (
     IncrementalCursorPathMissing,
@@ -503,14 +513,65 @@ def test_descending_order_unique_hashes(item_type: TestDataItemFormat) -> None:
         "created_at"
     ]
 
-    last_hash = digest128(json.dumps({"created_at": 24}))
+    last_hash = unique_hash(json.dumps({"created_at": 24}))
 
-    assert s["unique_hashes"] == [last_hash]
+    assert s["unique_hashes"] == pack_unique_hashes([last_hash])
 
     # make sure nothing is returned on a next run, source will use state from the active pipeline
     assert list(some_data()) == []
 
 
+@pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
+def test_unique_hashes_from_legacy_state(item_type: TestDataItemFormat) -> None:
+    """State written by previous versions keeps base64 encoded 15 bytes digests"""
+    data = [{"created_at": 1, "id": i} for i in range(5)]
+    source_items = data_to_item_format(item_type, data)
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at")):
+        yield from source_items
+
+    legacy_state = {
+        "initial_value": None,
+        "last_value": 1,
+        "unique_hashes": [digest128(json.dumps(i)) for i in range(3)],
+    }
+    # seed the state of the resource as written by previous versions
+    pipeline_state: TPipelineState = {
+        "sources": {
+            "test_incremental": {
+                "resources": {"some_data": {"incremental": {"created_at": legacy_state}}}
+            }
+        }
+    }
+    with Container().injectable_context(StateInjectableContext(state=pipeline_state)):
+        r_ = some_data()
+        assert data_item_to_list(item_type, list(r_)) == data[3:]
+        state = r_.state["incremental"]["created_at"]
+        assert unpack_unique_hashes(state["unique_hashes"]) == {
+            unique_hash(json.dumps(i)) for i in range(5)
+        }
+
+
+@pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
+def test_max_unique_hashes(item_type: TestDataItemFormat) -> None:
+    data = [{"created_at": 1, "id": i} for i in range(100)]
+    source_items = data_to_item_format(item_type, data)
+
+    @dlt.resource(primary_key="id")
+    def some_data(created_at=dlt.sources.incremental("created_at", max_unique_hashes=10)):
+        yield from source_items
+
+    with Container().injectable_context(StateInjectableContext(state={})):
+        r_ = some_data()
+        assert len(data_item_to_list(item_type, list(r_))) == 100
+        packed = r_.state["incremental"]["created_at"]["unique_hashes"]
+        assert len(unpack_unique_hashes(packed)) == 10
+        # rows that did not fit into state are loaded again
+        r_ = some_data()
+        assert len(data_item_to_list(item_type, list(r_))) == 90
+
+
 @pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
 def test_unique_keys_json_identifiers(item_type: TestDataItemFormat) -> None:
     """Uses primary key name that is matching the name of the JSON element in the original namespace but gets converted into destination namespace"""
@@ -855,7 +916,7 @@ def test_incremental_explicit_disable_unique_check(item_type: TestDataItemFormat
         s = some_data()
         list(s)
         # no unique hashes at all
-        assert s.state["incremental"]["ts"]["unique_hashes"] == []
+        assert s.state["incremental"]["ts"]["unique_hashes"] == ""
 
 
 @pytest.mark.parametrize("item_type", ALL_TEST_DATA_ITEM_FORMATS)
@@ -1544,7 +1605,7 @@ def test_carry_unique_hashes(
     pipeline = dlt.pipeline("test_unique_values_unordered_rows", destination="dummy")
 
     def _assert_state(r_: DltResource, day: int, info: NormalizeInfo) -> None:
-        uniq_hashes = r_.state["incremental"]["updated_at"]["unique_hashes"]
+        uniq_hashes = unpack_unique_hashes(r_.state["incremental"]["updated_at"]["unique_hashes"])
         row_count = info.row_counts.get("random_ascending_chunks", 0)
         if primary_key == "updated_at":
             # we keep only newest version of the record
@@ -0,0 +1,57 @@
+import pytest
+
+from dlt.common import json
+
+from dlt.helpers.benchmark import (
+    DESTINATIONS,
+    WORKLOADS,
+    main,
+    run_benchmark,
+    run_benchmark_in_subprocess,
+)
+
+from tests.utils import TEST_STORAGE_ROOT, clean_test_storage
+
+
+@pytest.fixture(autouse=True)
+def storage() -> None:
+    clean_test_storage()
+
+
+@pytest.mark.parametrize("destination", DESTINATIONS)
+@pytest.mark.parametrize("workload", list(WORKLOADS))
+def test_run_benchmark(workload: str, destination: str) -> None:
+    result = run_benchmark(workload, destination, 1500, TEST_STORAGE_ROOT)
+    assert result["workload"] == workload
+    assert result["destination"] == destination
+    # child tables add rows
+    if workload == "nested_json":
+        assert result["rows"] > 1500
+    else:
+        assert result["rows"] == 1500
+    assert result["bytes"] > 0
+    assert result["total_time"] == pytest.approx(
+        result["extract_time"] + result["normalize_time"] + result["load_time"]
+    )
+    assert result["rows_per_second"] > 0
+
+
+def test_run_benchmark_in_subprocess() -> None:
+    result = run_benchmark_in_subprocess("wide_table", "dummy", 100)
+    assert result["rows"] == 100
+    # measured in a fresh process
+    if result["peak_rss_mb"] is not None:
+        assert result["peak_rss_mb"] > 0
+
+
+def test_unknown_destination() -> None:
+    with pytest.raises(ValueError):
+        run_benchmark("nested_json", "redshift", 10, TEST_STORAGE_ROOT)
+
+
+def test_main_writes_json_lines(capsys: pytest.CaptureFixture[str]) -> None:
+    main(["--rows", "10", "--workload", "wide_table", "--destination", "dummy"])
+    results = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(results) == 1
+    assert results[0]["workload"] == "wide_table"
+    assert results[0]["rows"] == 10
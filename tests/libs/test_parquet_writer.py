@@ -226,6 +226,41 @@ def test_parquet_writer_config_spark() -> None:
             assert table.column(1)[0].as_py() == now.in_timezone(tz="UTC").replace(tzinfo=None)
 
 
+def test_parquet_writer_dictionary_and_statistics() -> None:
+    os.environ["NORMALIZE__DATA_WRITER__USE_DICTIONARY"] = "false"
+    os.environ["NORMALIZE__DATA_WRITER__WRITE_STATISTICS"] = "false"
+
+    rows = [{"col1": i, "col2": {"hello": "dave"}} for i in range(0, 10)]
+    with inject_section(ConfigSectionContext(pipeline_name=None, sections=("normalize",))):
+        with get_writer(ParquetDataWriter) as writer:
+            writer.write_data_item(
+                rows,
+                {"col1": new_column("col1", "bigint"), "col2": new_column("col2", "complex")},
+            )
+    # rows are not modified when complex values are serialized
+    assert rows[0]["col2"] == {"hello": "dave"}
+    with pa.parquet.ParquetFile(writer.closed_files[0].file_path) as reader:
+        column = reader.metadata.row_group(0).column(1)
+        assert column.statistics is None
+        assert "PLAIN_DICTIONARY" not in column.encodings
+        assert "RLE_DICTIONARY" not in column.encodings
+        assert reader.read().column("col2").to_pylist() == ['{"hello":"dave"}'] * 10
+
+    # dictionary encoding and statistics are on by default
+    del os.environ["NORMALIZE__DATA_WRITER__USE_DICTIONARY"]
+    del os.environ["NORMALIZE__DATA_WRITER__WRITE_STATISTICS"]
+    with inject_section(ConfigSectionContext(pipeline_name=None, sections=("normalize",))):
+        with get_writer(ParquetDataWriter) as writer:
+            writer.write_data_item(
+                rows,
+                {"col1": new_column("col1", "bigint"), "col2": new_column("col2", "complex")},
+            )
+    with pa.parquet.ParquetFile(writer.closed_files[0].file_path) as reader:
+        column = reader.metadata.row_group(0).column(1)
+        assert column.statistics.has_min_max
+        assert column.has_dictionary_page
+
+
 def test_parquet_writer_schema_from_caps() -> None:
     # store nanoseconds
     os.environ["DATA_WRITER__VERSION"] = "2.6"
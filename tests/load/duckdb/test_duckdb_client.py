@@ -1,6 +1,10 @@
 import os
+import threading
+import time
 import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Iterator, cast
+from unittest.mock import patch
 
 import dlt
 from dlt.common.configuration.resolve import resolve_configuration
@@ -306,6 +310,144 @@ def test_default_duckdb_dataset_name() -> None:
     assert_table(cast(dlt.Pipeline, info.pipeline), "data", data, info=info)
 
 
+def test_parquet_files_loaded_together() -> None:
+    from dlt.destinations.impl.duckdb import duck
+
+    os.environ["DATA_WRITER__FILE_MAX_ITEMS"] = "10"
+    pipeline = dlt.pipeline(pipeline_name="quack_parquet", destination="duckdb", full_refresh=True)
+    # schema evolves: last rows have an additional column
+    data = [{"id": i} for i in range(0, 80)] + [{"id": i, "value": str(i)} for i in range(80, 100)]
+    pipeline.extract(data, table_name="items")
+    pipeline.normalize(loader_file_format="parquet")
+    # table must exist so the qualified name can be generated
+    with pipeline.sql_client() as client:
+        qualified_table_name = client.make_qualified_table_name("items")
+
+    copy_calls = []
+    copy_parquet_files = duck.DuckDbCopyJob._copy_parquet_files
+
+    def _copy_parquet_files(table_name, file_paths, sql_client):
+        copy_calls.append((table_name, len(file_paths)))
+        copy_parquet_files(table_name, file_paths, sql_client)
+
+    # hold the table lock until all jobs are waiting for it
+    lock = duck.TABLES_LOCKS.setdefault(qualified_table_name, threading.Lock())
+    lock.acquire()
+    with patch.object(duck.DuckDbCopyJob, "_copy_parquet_files", _copy_parquet_files):
+        with ThreadPoolExecutor(1) as pool:
+            load = pool.submit(pipeline.load)
+            for _ in range(0, 1000):
+                pending = [
+                    files
+                    for (_, table_name), files in duck.TABLES_PENDING_FILES.items()
+                    if table_name == qualified_table_name
+                ]
+                if pending and len(pending[0]) == 10:
+                    break
+                time.sleep(0.01)
+            lock.release()
+            load.result()
+
+    # all files loaded with a single transaction
+    assert [call for call in copy_calls if call[0] == qualified_table_name] == [
+        (qualified_table_name, 10)
+    ]
+    with pipeline.sql_client() as client:
+        rows = client.execute_sql("SELECT id, value FROM items ORDER BY id")
+    assert [row[0] for row in rows] == list(range(0, 100))
+    assert rows[0][1] is None
+    assert rows[99][1] == "99"
+
+
+def test_parquet_group_failure_fails_only_bad_files() -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+    from dlt.destinations.impl.duckdb import duck
+
+    pipeline = dlt.pipeline(pipeline_name="quack_parquet", destination="duckdb", full_refresh=True)
+    paths = []
+    for idx in range(3):
+        path = os.path.join(TEST_STORAGE_ROOT, f"items.{idx}.0.parquet")
+        pyarrow.parquet.write_table(pyarrow.table({"id": [idx]}), path)
+        paths.append(path)
+    bad_path = os.path.join(TEST_STORAGE_ROOT, "items.bad.0.parquet")
+    with open(bad_path, "wb") as f:
+        f.write(b"not a parquet file")
+
+    with pipeline.sql_client() as client:
+        client.create_dataset()
+        qualified_table_name = client.make_qualified_table_name("items")
+        client.execute_sql(f"CREATE TABLE {qualified_table_name} (id BIGINT)")
+        # files of other jobs wait for the table, the job below loads them in one group
+        futures = [Future() for _ in range(3)]  # type: ignore[var-annotated]
+        duck.TABLES_PENDING_FILES[(id(client.credentials), qualified_table_name)] = list(
+            zip([paths[0], bad_path, paths[1]], futures)
+        )
+        duck.DuckDbCopyJob("items", paths[2], cast(duck.DuckDbSqlClient, client))
+        assert futures[0].result() is None
+        assert futures[2].result() is None
+        with pytest.raises(Exception):
+            futures[1].result()
+        rows = client.execute_sql(f"SELECT id FROM {qualified_table_name} ORDER BY id")
+    assert [row[0] for row in rows] == [0, 1, 2]
+
+
+def test_parquet_pending_files_kept_per_database() -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+    from dlt.destinations.impl.duckdb import duck
+
+    pipeline = dlt.pipeline(pipeline_name="quack_parquet", destination="duckdb", full_refresh=True)
+    paths = []
+    for idx in range(2):
+        path = os.path.join(TEST_STORAGE_ROOT, f"items.{idx}.0.parquet")
+        pyarrow.parquet.write_table(pyarrow.table({"id": [idx]}), path)
+        paths.append(path)
+
+    with pipeline.sql_client() as client:
+        client.create_dataset()
+        qualified_table_name = client.make_qualified_table_name("items")
+        client.execute_sql(f"CREATE TABLE {qualified_table_name} (id BIGINT)")
+        # file of a job loading a table with the same name into another database
+        other_key = (id(object()), qualified_table_name)
+        other_future: "Future[None]" = Future()
+        duck.TABLES_PENDING_FILES[other_key] = [(paths[0], other_future)]
+        try:
+            duck.DuckDbCopyJob("items", paths[1], cast(duck.DuckDbSqlClient, client))
+            assert not other_future.done()
+            assert duck.TABLES_PENDING_FILES[other_key] == [(paths[0], other_future)]
+        finally:
+            duck.TABLES_PENDING_FILES.pop(other_key)
+        rows = client.execute_sql(f"SELECT id FROM {qualified_table_name}")
+    assert [row[0] for row in rows] == [1]
+
+
+def test_parquet_group_interrupted_resolves_pending_files() -> None:
+    from dlt.common.libs.pyarrow import pyarrow
+    from dlt.destinations.impl.duckdb import duck
+
+    pipeline = dlt.pipeline(pipeline_name="quack_parquet", destination="duckdb", full_refresh=True)
+    paths = []
+    for idx in range(2):
+        path = os.path.join(TEST_STORAGE_ROOT, f"items.{idx}.0.parquet")
+        pyarrow.parquet.write_table(pyarrow.table({"id": [idx]}), path)
+        paths.append(path)
+
+    def _interrupt(*args, **kwargs) -> None:
+        raise KeyboardInterrupt()
+
+    with pipeline.sql_client() as client:
+        qualified_table_name = client.make_qualified_table_name("items")
+        other_future: "Future[None]" = Future()
+        duck.TABLES_PENDING_FILES[(id(client.credentials), qualified_table_name)] = [
+            (paths[0], other_future)
+        ]
+        with patch.object(duck.DuckDbCopyJob, "_copy_parquet_files", _interrupt):
+            with pytest.raises(KeyboardInterrupt):
+                duck.DuckDbCopyJob("items", paths[1], cast(duck.DuckDbSqlClient, client))
+    # job waiting for its file does not block forever
+    with pytest.raises(KeyboardInterrupt):
+        other_future.result(timeout=0)
+
+
 def delete_quack_db() -> None:
     if os.path.isfile(DEFAULT_DUCK_DB_NAME):
         os.remove(DEFAULT_DUCK_DB_NAME)
@@ -0,0 +1,114 @@
+import os
+from contextlib import contextmanager
+from datetime import date, datetime, timezone  # noqa: I251
+from decimal import Decimal
+from typing import Any, Iterator, List
+
+import pytest
+
+pytest.importorskip("dlt.destinations.impl.mssql.mssql", reason="MSSQL ODBC driver not installed")
+
+from dlt.common.libs.pyarrow import pyarrow
+
+from dlt.destinations.impl.mssql.mssql import MsSqlParquetCopyJob
+
+# mark all tests as essential, do not remove
+pytestmark = pytest.mark.essential
+
+
+class _Cursor:
+    def __init__(self) -> None:
+        self.fast_executemany = False
+        self.executed: List[Any] = []
+        self.closed = False
+
+    def executemany(self, sql: str, rows: List[Any]) -> None:
+        assert self.fast_executemany is True
+        self.executed.append((sql, rows))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.cursors: List[_Cursor] = []
+
+    def cursor(self) -> _Cursor:
+        self.cursors.append(_Cursor())
+        return self.cursors[-1]
+
+
+class _SqlClient:
+    """Implements the parts of PyOdbcMsSqlClient used by the copy job, without a server"""
+
+    def __init__(self) -> None:
+        self.native_connection = _Connection()
+        self.transactions = 0
+
+    def make_qualified_table_name(self, table_name: str) -> str:
+        return f'"dataset"."{table_name}"'
+
+    def escape_column_name(self, column_name: str) -> str:
+        return f'"{column_name}"'
+
+    @contextmanager
+    def begin_transaction(self) -> Iterator[None]:
+        self.transactions += 1
+        yield
+
+
+def test_batch_to_rows_types_and_nulls() -> None:
+    ts = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+    batch = pyarrow.record_batch(
+        [
+            pyarrow.array([1, None], type=pyarrow.int64()),
+            pyarrow.array(["ł", None]),
+            pyarrow.array([1.5, None]),
+            pyarrow.array([True, None]),
+            pyarrow.array([Decimal("1.25"), None], type=pyarrow.decimal128(10, 2)),
+            pyarrow.array([b"\x00\x01", None]),
+            pyarrow.array([date(2024, 1, 2), None]),
+            pyarrow.array([ts, None], type=pyarrow.timestamp("ns", tz="UTC")),
+        ],
+        names=["bigint", "text", "double", "bool", "decimal", "binary", "date", "timestamp"],
+    )
+    rows = MsSqlParquetCopyJob._batch_to_rows(batch)
+    assert rows == [
+        (
+            1,
+            "ł",
+            1.5,
+            True,
+            Decimal("1.25"),
+            b"\x00\x01",
+            date(2024, 1, 2),
+            ts.replace(tzinfo=None),
+        ),
+        (None,) * 8,
+    ]
+    # pyodbc cannot bind tz aware datetimes
+    assert rows[0][7].tzinfo is None
+
+
+def test_copy_job_inserts_in_batches(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(MsSqlParquetCopyJob, "BATCH_SIZE", 3)
+    file_path = os.path.join(tmp_path, "items.1234.0.parquet")
+    table = pyarrow.table(
+        {"id": list(range(7)), "name": [str(i) if i % 2 else None for i in range(7)]}
+    )
+    pyarrow.parquet.write_table(table, file_path)
+
+    sql_client = _SqlClient()
+    job = MsSqlParquetCopyJob("items", file_path, sql_client)  # type: ignore[arg-type]
+    assert job.state() == "completed"
+    assert sql_client.transactions == 1
+    (cursor,) = sql_client.native_connection.cursors
+    assert cursor.closed is True
+    assert [sql for sql, _ in cursor.executed] == [
+        'INSERT INTO "dataset"."items" ("id","name") VALUES (?,?)'
+    ] * 3
+    assert [len(rows) for _, rows in cursor.executed] == [3, 3, 1]
+    assert [row for _, rows in cursor.executed for row in rows] == [
+        (i, str(i) if i % 2 else None) for i in range(7)
+    ]
@@ -1,6 +1,7 @@
 import csv
 import os
 import posixpath
+import time
 from pathlib import Path
 from typing import Any, Callable, List, Dict, cast
 
@@ -383,7 +384,8 @@ def test_state_files(destination_config: DestinationTestConfiguration) -> None:
 
     created_files = _collect_files(p1)
     # 4 init files, 2 item files, 2 load files, 2 state files, 2 version files
-    assert len(created_files) == 12
+    # 2 state manifests, 4 version manifests (per schema name and per hash)
+    assert len(created_files) == 18
 
     # second two loads
     @dlt.resource(table_name="items2")
@@ -425,7 +427,8 @@ def test_state_files(destination_config: DestinationTestConfiguration) -> None:
 
     created_files = _collect_files(p1)
     # 4 init files, 4 item files, 4 load files, 3 state files, 3 version files
-    assert len(created_files) == 18
+    # 2 state manifests, 5 version manifests
+    assert len(created_files) == 25
 
     # drop it
     p1.destination_client().drop_storage()
@@ -433,6 +436,67 @@ def test_state_files(destination_config: DestinationTestConfiguration) -> None:
     assert len(created_files) == 0
 
 
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(all_buckets_filesystem_configs=True),
+    ids=lambda x: x.name,
+)
+def test_state_manifests(
+    destination_config: DestinationTestConfiguration, mocker: MockerFixture
+) -> None:
+    p = destination_config.setup_pipeline("p1", dataset_name="manifest_test")
+    client = cast(FilesystemClient, p.destination_client())
+
+    @dlt.resource(table_name="items")
+    def some_data():
+        dlt.current.resource_state()["state"] = {"some": "state"}
+        yield from [1, 2, 3]
+
+    load_id = p.run(some_data()).loads_ids[0]
+    state_manifest = client._get_manifest_path(client.schema.state_table_name, "p1")
+    schema_manifest = client._get_manifest_path(client.schema.version_table_name, "p1")
+    assert client.fs_client.exists(state_manifest)
+    assert client.fs_client.exists(schema_manifest)
+
+    # state and schema are read via manifests without listing the tables
+    list_spy = mocker.spy(client, "_list_dlt_table_files")
+    assert client.get_stored_state("p1").dlt_load_id == load_id
+    assert client.get_stored_schema().version_hash == p.default_schema.stored_version_hash
+    assert client.get_stored_schema_by_hash(p.default_schema.stored_version_hash)
+    assert list_spy.call_count == 0
+
+    # missing or corrupted manifests are rebuilt from a full scan
+    client.fs_client.rm(state_manifest)
+    client.fs_client.write_text(schema_manifest, "{broken", "utf-8")
+    assert client.get_stored_state("p1").dlt_load_id == load_id
+    assert client.get_stored_schema().version_hash == p.default_schema.stored_version_hash
+    assert list_spy.call_count == 2
+    assert client.fs_client.exists(state_manifest)
+    assert client._read_manifest(client.schema.version_table_name, "p1")
+    # manifests are replaced without leaving temp files
+    manifest_dir = posixpath.dirname(client.fs_client._strip_protocol(state_manifest))
+    assert client.fs_client.ls(manifest_dir, detail=False) == [
+        client.fs_client._strip_protocol(state_manifest)
+    ]
+
+    if client.is_local_filesystem:
+        # state written without updating the manifest (ie. by older dlt version) is found with a full scan
+        state_doc = json.loads(
+            client.fs_client.read_text(client._read_manifest(client.schema.state_table_name, "p1"))
+        )
+        state_doc["dlt_load_id"] = "9" * 10
+        time.sleep(0.05)
+        client._write_to_json_file(
+            client._get_state_file_name("p1", p.default_schema.stored_version_hash, "9" * 10),
+            state_doc,
+        )
+        assert client.get_stored_state("p1").dlt_load_id == "9" * 10
+        assert list_spy.call_count == 3
+        # manifest was rebuilt
+        assert client.get_stored_state("p1").dlt_load_id == "9" * 10
+        assert list_spy.call_count == 3
+
+
 @pytest.mark.parametrize(
     "destination_config",
     destinations_configs(all_buckets_filesystem_configs=True),
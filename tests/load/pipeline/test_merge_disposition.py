@@ -13,8 +13,8 @@ from dlt.common.pipeline import StateInjectableContext
 from dlt.common.schema.utils import has_table_seen_data
 from dlt.common.schema.exceptions import SchemaException
 from dlt.common.typing import StrAny
-from dlt.common.utils import digest128
 from dlt.extract import DltResource
+from dlt.extract.incremental.transform import pack_unique_hashes, unique_hash
 from dlt.sources.helpers.transform import skip_first, take_first
 from dlt.pipeline.exceptions import PipelineStepFailed
 
@@ -431,9 +431,8 @@ def test_merge_with_dispatch_and_incremental(
             incremental_state["incremental"]["created_at"]["last_value"]
             == newest_issue["created_at"]
         )
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] == [
-            digest128(f'"{newest_issue["id"]}"')
-        ]
+        newest_hashes = pack_unique_hashes([unique_hash(f'"{newest_issue["id"]}"')])
+        assert incremental_state["incremental"]["created_at"]["unique_hashes"] == newest_hashes
         # subsequent load will skip all elements
         assert len(list(_get_shuffled_events(True) | github_resource)) == 0
         # add one more issue
@@ -442,9 +441,7 @@ def test_merge_with_dispatch_and_incremental(
             incremental_state["incremental"]["created_at"]["last_value"]
             > newest_issue["created_at"]
         )
-        assert incremental_state["incremental"]["created_at"]["unique_hashes"] != [
-            digest128(str(newest_issue["id"]))
-        ]
+        assert incremental_state["incremental"]["created_at"]["unique_hashes"] != newest_hashes
 
     # load to destination
     p = destination_config.setup_pipeline("github_3", full_refresh=True)
@@ -1,10 +1,11 @@
 import os
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from time import sleep
 from unittest import mock
 import pytest
 from unittest.mock import patch
-from typing import List
+from typing import Any, List
 
 from dlt.common.exceptions import TerminalException, TerminalValueError
 from dlt.common.storages import FileStorage, PackageStorage, ParsedLoadJobFileName
@@ -25,7 +26,12 @@ from dlt.destinations.impl.dummy.configuration import DummyClientConfiguration
 
 from dlt.load import Load
 from dlt.load.exceptions import LoadClientJobFailed, LoadClientJobRetry
-from dlt.load.utils import get_completed_table_chain, init_client, _extend_tables_with_table_chain
+from dlt.load.utils import (
+    JobClientPool,
+    get_completed_table_chain,
+    init_client,
+    _extend_tables_with_table_chain,
+)
 
 from tests.utils import (
     clean_test_storage,
@@ -246,16 +252,49 @@ def test_spool_job_retry_new() -> None:
         assert job.state() == "retry"
 
 
-def test_spool_job_retry_spool_new() -> None:
+def test_spool_job_retry_schedule_jobs() -> None:
     # this config retries job on start (transient fail)
     load = setup_loader(client_config=DummyClientConfiguration(retry_prob=1.0))
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
-    # call higher level function that returns jobs and counts
+    files = load.load_storage.list_new_jobs(load_id)
+    # start jobs in the pool like the loader does
     with ThreadPoolExecutor() as pool:
         load.pool = pool
-        jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-        assert jobs_count == 2
-        assert len(jobs) == 2
+        try:
+            load.schedule_jobs(load_id, schema, [], files)
+        finally:
+            load.client_pool.close()
+    # both jobs were started and moved back to new jobs to be retried
+    files = load.load_storage.list_new_jobs(load_id)
+    assert len(files) == 2
+    for fn in files:
+        assert ParsedLoadJobFileName.parse(fn).retry_count == 1
+
+
+def test_schedule_jobs_waits_for_starting_jobs_on_error() -> None:
+    load = setup_loader()
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    files = load.load_storage.list_new_jobs(load_id)
+    started: List[str] = []
+    starting = threading.Event()
+
+    def _spool_job(load_id_: int, file_path: str, *args: Any) -> LoadJob:
+        if file_path == files[0]:
+            # fail when the other job is starting
+            starting.wait(5)
+            raise RuntimeError("worker failed")
+        starting.set()
+        sleep(0.2)
+        started.append(file_path)
+        return EmptyLoadJob.from_file_path(file_path, "retry")
+
+    with ThreadPoolExecutor(2) as pool:
+        load.pool = pool
+        with patch.object(Load, "w_spool_job", staticmethod(_spool_job)):
+            with pytest.raises(RuntimeError):
+                load.schedule_jobs(load_id, schema, [], files)
+            # the other job finished starting before pooled clients could be closed
+            assert started == [files[1]]
 
 
 def test_spool_job_retry_started() -> None:
@@ -313,9 +352,8 @@ def test_try_retrieve_job() -> None:
             assert j.state() == "failed"
     # new load package
     load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
-    load.pool = ThreadPoolExecutor()
-    jobs_count, jobs = load.spool_new_jobs(load_id, schema)
-    assert jobs_count == 2
+    for f in load.load_storage.normalized_packages.list_new_jobs(load_id):
+        Load.w_spool_job(load, f, load_id, schema)
     # now jobs are known
     with load.destination.client(schema, load.initial_client_config) as c:
         job_count, jobs = load.retrieve_jobs(c, load_id)
@@ -446,6 +484,116 @@ def test_load_single_thread() -> None:
     )
 
 
+def test_schedule_jobs_keeps_workers_busy() -> None:
+    # more files than workers: all jobs are started and completed in a single run
+    os.environ["LOAD__WORKERS"] = "1"
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, _ = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with ThreadPoolExecutor() as pool:
+        with patch.object(load, "complete_jobs", wraps=load.complete_jobs) as complete_jobs:
+            load.run(pool)
+        # each job was completed right after it started, never more than 1 in flight
+        assert all(len(c.args[1]) == 1 for c in complete_jobs.call_args_list)
+        assert len(load.load_storage.normalized_packages.list_new_jobs(load_id)) == 0
+        assert len(load.load_storage.normalized_packages.list_started_jobs(load_id)) == 0
+        # complete package
+        load.run(pool)
+    assert not load.load_storage.storage.has_folder(
+        load.load_storage.get_normalized_package_path(load_id)
+    )
+
+
+def test_jobs_reuse_pooled_clients() -> None:
+    load = setup_loader(client_config=DummyClientConfiguration(completed_prob=1.0))
+    load_id, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    with patch.object(
+        dummy_impl.DummyClient, "__exit__", autospec=True, return_value=None
+    ) as client_exit:
+        with patch.object(
+            load, "get_destination_client", wraps=load.get_destination_client
+        ) as get_client:
+            for f in load.load_storage.normalized_packages.list_new_jobs(load_id):
+                Load.w_spool_job(load, f, load_id, schema)
+            # both jobs used the same client
+            assert get_client.call_count == 1
+            assert len(load.client_pool) == 1
+            assert client_exit.call_count == 0
+        load.client_pool.close()
+        assert client_exit.call_count == 1
+        assert len(load.client_pool) == 0
+
+
+def test_pooled_client_dropped_on_exception() -> None:
+    load = setup_loader()
+    _, schema = prepare_load_package(load.load_storage, NORMALIZED_FILES)
+    pool = JobClientPool(max_size=1)
+    with pool.client(lambda: load.get_destination_client(schema)) as client:
+        pass
+    with pytest.raises(ValueError):
+        with pool.client(lambda: load.get_destination_client(schema)) as reused_client:
+            assert reused_client is client
+            raise ValueError()
+    assert len(pool) == 0
+    with pool.client(lambda: load.get_destination_client(schema)) as new_client:
+        assert new_client is not client
+        # pool is full so staging client is not kept
+        with pool.client(lambda: load.get_destination_client(schema), is_staging=True):
+            pass
+    assert len(pool) == 1
+
+
+def test_pooled_client_probed_after_idle() -> None:
+    class _SqlClient:
+        def __init__(self) -> None:
+            self.native_connection = object()
+            self.executed = 0
+            self.broken = False
+
+        def execute_sql(self, sql: str) -> None:
+            self.executed += 1
+            if self.broken:
+                raise ConnectionError("connection dropped")
+
+    class _JobClient:
+        def __init__(self) -> None:
+            self.sql_client = _SqlClient()
+            self.exited = False
+
+        def __enter__(self) -> "_JobClient":
+            return self
+
+        def __exit__(self, *args: Any) -> None:
+            self.exited = True
+
+    created: List[_JobClient] = []
+
+    def _client_factory() -> Any:
+        created.append(_JobClient())
+        return created[-1]
+
+    pool = JobClientPool(max_size=1, probe_after=3600)
+    with pool.client(_client_factory):
+        pass
+    client = created[0]
+    # recently used client is not probed
+    with pool.client(_client_factory) as reused_client:
+        assert reused_client is client
+    assert client.sql_client.executed == 0
+    # idle client is probed and kept when alive
+    pool.probe_after = 0
+    with pool.client(_client_factory) as reused_client:
+        assert reused_client is client
+    assert client.sql_client.executed == 1
+    # dropped connection is replaced with a new client
+    client.sql_client.broken = True
+    with pool.client(_client_factory) as new_client:
+        assert new_client is created[1]
+    assert client.exited
+    assert len(pool) == 1
+    pool.close()
+    assert created[1].exited
+
+
 def test_wrong_writer_type() -> None:
     load = setup_loader()
     load_id, _ = prepare_load_package(
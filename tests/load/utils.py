@@ -247,6 +247,9 @@ def destinations_configs(
         ]
         destination_configs += [
             DestinationTestConfiguration(destination="mssql", supports_dbt=False),
+            DestinationTestConfiguration(
+                destination="mssql", file_format="parquet", supports_dbt=False
+            ),
             DestinationTestConfiguration(destination="synapse", supports_dbt=False),
         ]
 
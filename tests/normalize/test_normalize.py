@@ -1,11 +1,14 @@
+import os
 import pytest
 from fnmatch import fnmatch
+from unittest import mock
 from typing import Dict, Iterator, List, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 
 from dlt.common import json
 from dlt.common.destination.capabilities import TLoaderFileFormat
 from dlt.common.schema.schema import Schema
+from dlt.common.schema import utils as schema_utils
 from dlt.common.schema.utils import new_table
 from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.typing import StrAny
@@ -17,6 +20,7 @@ from dlt.common.configuration.container import Container
 from dlt.extract.extract import ExtractStorage
 from dlt.normalize import Normalize
 from dlt.normalize.exceptions import NormalizeJobFailed
+from dlt.normalize.items_normalizers import JsonLItemsNormalizer
 
 from tests.cases import JSON_TYPED_DICT, JSON_TYPED_DICT_TYPES
 from tests.utils import (
@@ -295,6 +299,63 @@ def test_multiprocessing_row_counting(
         for t, m in step_info.metrics[step_info.loads_ids[0]][0]["table_metrics"].items()
     }
     assert row_counts == step_info.row_counts
+    # busy time of each worker is collected
+    worker_metrics = step_info.metrics[step_info.loads_ids[0]][0]["worker_metrics"]
+    assert sum(m.tasks_count for m in worker_metrics.values()) >= len(worker_metrics) > 0
+    assert sum(m.files_count for m in worker_metrics.values()) >= 1
+    for m in worker_metrics.values():
+        assert m.busy_time > 0
+        assert 0 < m.utilization <= 1.0
+    assert "worker_metrics" in step_info.asdict()
+
+
+def test_multiprocessing_row_counting_many_tasks(
+    raw_normalize: Normalize, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with open(json_case_path("github.events.load_page_1_duck"), "rb") as f:
+        items = json.load(f)
+    # extract to many files so the same tables are written by many tasks
+    with monkeypatch.context() as m:
+        m.setenv("DATA_WRITER__FILE_MAX_ITEMS", "10")
+        extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+        schema = load_or_create_schema(raw_normalize, "github")
+        load_id = extractor.create_load_package(schema)
+        for idx in range(0, len(items), 10):
+            extractor.item_storages["object"].write_data_item(
+                load_id, schema.name, "events", items[idx : idx + 10], None
+            )
+        extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+    assert len(raw_normalize.normalize_storage.extracted_packages.list_new_jobs(load_id)) == 10
+
+    with ProcessPoolExecutor(max_workers=4) as p:
+        raw_normalize.run(p)
+    step_info = raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts["events"] == 100
+    assert step_info.row_counts["events__payload__pull_request__requested_reviewers"] == 24
+
+
+@pytest.mark.parametrize("read_block_size", (1, 1024, JsonLItemsNormalizer.READ_BLOCK_SIZE))
+def test_normalize_jsonl_read_in_blocks(raw_normalize: Normalize, read_block_size: int) -> None:
+    with open(json_case_path("github.events.load_page_1_duck"), "rb") as f:
+        items = json.load(f)
+    # write many lines into a single extracted file
+    extractor = ExtractStorage(raw_normalize.normalize_storage.config)
+    schema = load_or_create_schema(raw_normalize, "github")
+    load_id = extractor.create_load_package(schema)
+    for idx in range(0, len(items), 7):
+        extractor.item_storages["object"].write_data_item(
+            load_id, schema.name, "events", items[idx : idx + 7], None
+        )
+    extractor.close_writers(load_id)
+    extractor.commit_new_load_package(load_id, schema)
+    assert len(raw_normalize.normalize_storage.extracted_packages.list_new_jobs(load_id)) == 1
+
+    with mock.patch.object(JsonLItemsNormalizer, "READ_BLOCK_SIZE", read_block_size):
+        normalize_pending(raw_normalize)
+    step_info = raw_normalize.get_step_info(MockPipeline("block_pipeline", True))  # type: ignore[abstract]
+    assert step_info.row_counts["events"] == 100
+    assert step_info.row_counts["events__payload__pull_request__requested_reviewers"] == 24
 
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
@@ -426,6 +487,94 @@ def test_schema_changes(caps: DestinationCapabilitiesContext, raw_normalize: Nor
     } == set(doc__comp_table["columns"].keys())
 
 
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_schema_hashed_on_commit(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    doc = {"str": "text", "int": 1}
+    extract_items(raw_normalize.normalize_storage, [doc], Schema("evolution"), "doc")
+    normalize_pending(raw_normalize)
+    schema = raw_normalize.schema_storage.load_schema("evolution")
+    version, version_hash = schema.stored_version, schema.stored_version_hash
+
+    extract_items(raw_normalize.normalize_storage, [{"bool": True}], schema, "doc")
+    with mock.patch.object(
+        schema_utils, "generate_version_hash", wraps=schema_utils.generate_version_hash
+    ) as generate_hash:
+        load_id = normalize_pending(raw_normalize)
+    # when package schema is loaded, to detect modification, when saved to storage and to package
+    assert generate_hash.call_count == 4
+    schema = raw_normalize.schema_storage.load_schema("evolution")
+    assert schema.stored_version == version + 1
+    assert schema.previous_hashes[0] == version_hash
+    assert not schema.is_modified
+    package_schema = raw_normalize.load_storage.normalized_packages.load_schema(load_id)
+    assert package_schema.stored_version_hash == schema.stored_version_hash
+    assert "bool" in package_schema.get_table("doc")["columns"]
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_batched_rows_preserve_order(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    # columns change in the middle of a chunk, rows must be written in order
+    docs = [{"idx": i} if i < 3 else {"idx": i, f"col_{i}": i} for i in range(6)]
+    extract_items(raw_normalize.normalize_storage, docs, Schema("batched"), "doc")
+    load_id = normalize_pending(raw_normalize)
+    _, table_files = expect_load_package(
+        raw_normalize.load_storage, caps.preferred_loader_file_format, load_id, ["doc"]
+    )
+    assert len(table_files["doc"]) == 1
+    lines = []
+    with raw_normalize.load_storage.normalized_packages.storage.open_file(
+        table_files["doc"][0]
+    ) as f:
+        lines = [json.loads(line) for line in f.readlines()]
+    assert [line["idx"] for line in lines] == list(range(6))
+    assert lines[5]["col_5"] == 5
+
+
+@pytest.mark.parametrize("caps", JSONL_CAPS, indirect=True)
+def test_batched_rows_rotate_on_new_columns(
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+) -> None:
+    # parquet file can't change schema once a buffer was flushed so a new column in the middle of a
+    # chunk starts a new file
+    raw_normalize.config.loader_file_format = "parquet"
+    docs = [{"id": 1}, {"id": 2, "extra": "x"}]
+    extract_items(raw_normalize.normalize_storage, docs, Schema("batched"), "doc")
+    with mock.patch.dict(os.environ, {"DATA_WRITER__BUFFER_MAX_ITEMS": "1"}):
+        load_id = normalize_pending(raw_normalize)
+    table_files = [
+        job
+        for job in raw_normalize.load_storage.list_new_jobs(load_id)
+        if ParsedLoadJobFileName.parse(job).table_name == "doc"
+    ]
+    assert len(table_files) == 2
+
+
+@pytest.mark.parametrize(
+    "limits,expected_files",
+    [
+        ({"DATA_WRITER__FILE_MAX_ITEMS": "10"}, 10),
+        ({"DATA_WRITER__BUFFER_MAX_ITEMS": "7", "DATA_WRITER__FILE_MAX_ITEMS": "25"}, 4),
+        ({"DATA_WRITER__BUFFER_MAX_ITEMS": "10", "DATA_WRITER__FILE_MAX_BYTES": "100"}, 10),
+    ],
+    ids=["file_max_items", "buffer_max_items", "file_max_bytes"],
+)
+def test_batched_rows_rotate_files(
+    raw_normalize: Normalize,
+    limits: Dict[str, str],
+    expected_files: int,
+) -> None:
+    docs = [{"idx": i} for i in range(100)]
+    extract_items(raw_normalize.normalize_storage, docs, Schema("batched"), "doc")
+    with mock.patch.dict(os.environ, limits):
+        load_id = normalize_pending(raw_normalize)
+    # same number of files as when rows were written one by one
+    assert len(raw_normalize.load_storage.list_new_jobs(load_id)) == expected_files
+
+
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_twice_with_flatten(
     caps: DestinationCapabilitiesContext, raw_normalize: Normalize
@@ -508,42 +657,24 @@ def test_collect_metrics_on_exception(raw_normalize: Normalize) -> None:
 
 
 def test_group_worker_files() -> None:
-    files = ["f%03d" % idx for idx in range(0, 100)]
-
-    assert Normalize.group_worker_files([], 4) == []
-    assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
-    assert Normalize.group_worker_files(["f001"], 100) == [["f001"]]
-    assert Normalize.group_worker_files(files[:4], 4) == [["f000"], ["f001"], ["f002"], ["f003"]]
-    assert Normalize.group_worker_files(files[:5], 4) == [
-        ["f000"],
-        ["f001"],
-        ["f002"],
-        ["f003", "f004"],
-    ]
-    assert Normalize.group_worker_files(files[:8], 4) == [
+    files = ["f%03d" % idx for idx in range(0, 8)]
+
+    assert Normalize.group_worker_files([], [], 10) == []
+    assert Normalize.group_worker_files(["f001"], [100], 10) == [["f001"]]
+    # equal sizes are batched by name
+    assert Normalize.group_worker_files(files[:4], [10] * 4, 20) == [
         ["f000", "f001"],
         ["f002", "f003"],
-        ["f004", "f005"],
-        ["f006", "f007"],
-    ]
-    assert Normalize.group_worker_files(files[:8], 3) == [
-        ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
     ]
-    assert Normalize.group_worker_files(files[:5], 3) == [
-        ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
-    ]
-
-    # check if sorted
-    files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
-    assert Normalize.group_worker_files(files, 3) == [
-        ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
+    # large files go first and get own groups, small files are batched
+    assert Normalize.group_worker_files(files, [1, 50, 2, 30, 1, 1, 20, 1], 20) == [
+        ["f001"],
+        ["f003"],
+        ["f006"],
+        ["f002", "f000", "f004", "f005", "f007"],
     ]
+    # each file in own group
+    assert Normalize.group_worker_files(files[:3], [1, 2, 3], 0) == [["f002"], ["f001"], ["f000"]]
 
 
 EXPECTED_ETH_TABLES = [
@@ -1,5 +1,6 @@
 import os
 from typing import Any
+from unittest import mock
 import pytest
 import pandas as pd
 import os
@@ -9,7 +10,9 @@ import pyarrow as pa
 import dlt
 from dlt.common import json, Decimal
 from dlt.common.utils import uniq_id
+from dlt.common.libs import pyarrow
 from dlt.common.libs.pyarrow import NameNormalizationClash, remove_columns, normalize_py_arrow_item
+from dlt.common.storages import FileStorage
 
 from dlt.pipeline.exceptions import PipelineStepFailed
 
@@ -263,6 +266,30 @@ def test_arrow_as_data_loading(item_type: TPythonTableFormat) -> None:
     assert info.row_counts["items"] == len(rows)
 
 
+@pytest.mark.parametrize("add_dlt_id", [False, True])
+def test_normalize_imports_parquet_without_reading(add_dlt_id: bool) -> None:
+    os.environ["NORMALIZE__PARQUET_NORMALIZER__ADD_DLT_ID"] = str(add_dlt_id)
+    item, records, _ = arrow_table_all_data_types("arrow-table", num_rows=1000)
+
+    pipeline = dlt.pipeline("arrow_" + uniq_id(), destination="duckdb")
+    pipeline.extract(dlt.resource(item, name="some_data"))
+    with mock.patch.object(
+        pyarrow, "pq_stream_with_new_columns", wraps=pyarrow.pq_stream_with_new_columns
+    ) as pq_stream, mock.patch.object(
+        FileStorage, "link_hard_with_fallback", wraps=FileStorage.link_hard_with_fallback
+    ) as link_hard:
+        info = pipeline.normalize(loader_file_format="parquet")
+    assert info.row_counts["some_data"] == len(records)
+    if add_dlt_id:
+        # file must be rewritten to add a column
+        assert pq_stream.call_count == 1
+        assert link_hard.call_count == 0
+    else:
+        # extracted file is linked into the package, only footer is read
+        assert pq_stream.call_count == 0
+        assert link_hard.call_count == 1
+
+
 @pytest.mark.parametrize("item_type", ["arrow-table"])  # , "pandas", "arrow-batch"
 def test_normalize_with_dlt_columns(item_type: TPythonTableFormat):
     item, records, _ = arrow_table_all_data_types(item_type, num_rows=5432)
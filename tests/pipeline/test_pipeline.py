@@ -2214,10 +2214,14 @@ def test_local_filesystem_destination(local_path: str) -> None:
     assert len(list(expected_dataset.joinpath("numbers").glob("*"))) == 1
     # two loads + init
     assert len(list(expected_dataset.joinpath("_dlt_loads").glob("*"))) == 3
-    # one schema (dedup on hash)
-    assert len(list(expected_dataset.joinpath("_dlt_version").glob("*"))) == 2
-    # one state (not sent twice)
-    assert len(list(expected_dataset.joinpath("_dlt_pipeline_state").glob("*"))) == 2
+    # one schema (dedup on hash) + init + manifests folder
+    assert len(list(expected_dataset.joinpath("_dlt_version").glob("*"))) == 3
+    # schema name and hash manifests
+    assert len(list(expected_dataset.joinpath("_dlt_version", "_manifests").glob("*"))) == 2
+    # one state (not sent twice) + init + manifests folder
+    assert len(list(expected_dataset.joinpath("_dlt_pipeline_state").glob("*"))) == 3
+    # pipeline manifest
+    assert len(list(expected_dataset.joinpath("_dlt_pipeline_state", "_manifests").glob("*"))) == 1
 
     fs_client = pipeline._fs_client()
     # all path formats we use must lead to "_storage" relative to tests
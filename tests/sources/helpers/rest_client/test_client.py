@@ -1,11 +1,18 @@
 import os
 import pytest
+import requests_mock
 from typing import Any, cast
+from unittest import mock
+
 from dlt.common.typing import TSecretStrValue
-from dlt.sources.helpers.requests import Response, Request
+from dlt.sources.helpers.requests import Response, Request, RateLimiter, Session, Client
 from dlt.sources.helpers.rest_client import RESTClient
 from dlt.sources.helpers.rest_client.client import Hooks
-from dlt.sources.helpers.rest_client.paginators import JSONResponsePaginator
+from dlt.sources.helpers.rest_client.paginators import (
+    JSONResponsePaginator,
+    PageNumberPaginator,
+    SinglePagePaginator,
+)
 
 from dlt.sources.helpers.rest_client.auth import AuthConfigBase
 from dlt.sources.helpers.rest_client.auth import (
@@ -120,6 +127,75 @@ class TestRESTClient:
         pages = list(pages_iter)
         assert pages == []
 
+    @pytest.mark.parametrize("ordered", (True, False))
+    def test_paginate_concurrently(self, rest_client: RESTClient, ordered: bool) -> None:
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(initial_page=1, total_path=None, maximum_page=11),
+                concurrency=4,
+                ordered=ordered,
+            )
+        )
+        if not ordered:
+            pages = sorted(pages, key=lambda page: page[0]["id"])
+        assert_pagination(pages)
+        # concurrently fetched pages keep the request that produced them
+        assert [page.request.params["page"] for page in pages[1:]] == list(range(2, 11))
+
+    def test_paginate_concurrently_ignore_response(self, rest_client: RESTClient) -> None:
+        def response_hook(response: Response, *args: Any, **kwargs: Any) -> None:
+            if response.json()["page"] == 5:
+                raise IgnoreResponseException
+
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(initial_page=1, total_path=None, maximum_page=11),
+                hooks={"response": response_hook},
+                concurrency=3,
+            )
+        )
+        assert len(pages) == 4
+
+    def test_paginate_stream(self, rest_client: RESTClient) -> None:
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=SinglePagePaginator(),
+                data_selector="$.data[*]",
+                stream=True,
+                stream_chunk_size=3,
+            )
+        )
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        assert [post for page in pages for post in page] == [
+            {"id": i, "title": f"Post {i}"} for i in range(10)
+        ]
+
+        # stream and paginate until the last page
+        pages = list(
+            rest_client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(initial_page=1, total_path=None, maximum_page=11),
+                data_selector="data",
+                stream=True,
+            )
+        )
+        assert_pagination(pages)
+
+    def test_rate_limiter(self) -> None:
+        limiter = RateLimiter(rate=1000.0)
+        rest_client = RESTClient(base_url="https://api.example.com", rate_limiter=limiter)
+        pages = list(
+            rest_client.paginate(
+                "/posts", paginator=JSONResponsePaginator(next_url_path="next_page")
+            )
+        )
+        assert_pagination(pages)
+        # rate grows with every successful response
+        assert limiter.rate > 1000.0
+
     def test_basic_auth_success(self, rest_client: RESTClient):
         response = rest_client.get(
             "/protected/posts/basic-auth",
@@ -183,3 +259,61 @@ class TestRESTClient:
         )
 
         assert_pagination(list(pages_iter))
+
+
+def test_paginate_concurrently_retries_in_worker_sessions() -> None:
+    url = "https://api.example.com/posts"
+    failed_pages = set()
+
+    def _page(request: Any, context: Any) -> Any:
+        page = int(request.qs["page"][0])
+        # every page after the first fails once
+        if page > 1 and page not in failed_pages:
+            failed_pages.add(page)
+            context.status_code = 503
+            return {}
+        return {"data": [{"id": page}]}
+
+    with requests_mock.Mocker() as m, mock.patch("time.sleep"), mock.patch.object(
+        Client, "_make_session", autospec=True, side_effect=Client._make_session
+    ) as make_session:
+        m.get(url, json=_page)
+        client = RESTClient(base_url="https://api.example.com")
+        pages = list(
+            client.paginate(
+                "/posts",
+                paginator=PageNumberPaginator(initial_page=1, total_path=None, maximum_page=6),
+                data_selector="data",
+                concurrency=3,
+            )
+        )
+
+    assert [page[0]["id"] for page in pages] == [1, 2, 3, 4, 5]
+    assert failed_pages == {2, 3, 4, 5}
+    assert m.call_count == 9
+    # worker threads do not use the session of the calling thread
+    assert make_session.call_count > 1
+
+
+def test_paginate_concurrently_custom_session() -> None:
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://api.example.com/posts",
+            json=lambda request, context: {"data": [{"id": int(request.qs["page"][0])}]},
+        )
+        client = RESTClient(
+            base_url="https://api.example.com", session=Session(raise_for_status=False)
+        )
+        with mock.patch.object(client, "_paginate_concurrently") as paginate_concurrently:
+            pages = list(
+                client.paginate(
+                    "/posts",
+                    paginator=PageNumberPaginator(initial_page=1, total_path=None, maximum_page=4),
+                    data_selector="data",
+                    concurrency=3,
+                )
+            )
+
+    # custom session is not shared between threads, pages are requested one by one
+    assert not paginate_concurrently.called
+    assert [page[0]["id"] for page in pages] == [1, 2, 3]
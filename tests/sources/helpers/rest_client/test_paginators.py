@@ -227,6 +227,17 @@ class TestOffsetPaginator:
         assert next_request.params["offset"] == 165
         assert next_request.params["limit"] == 42
 
+    def test_advance_with_known_total(self):
+        paginator = OffsetPaginator(offset=0, limit=10)
+        response = Mock(Response, json=lambda: {"total": 35})
+        paginator.update_state(response)
+        # compute remaining offsets without responses
+        offsets = []
+        while paginator.has_next_page:
+            offsets.append(paginator.current_value)
+            paginator.advance()
+        assert offsets == [10, 20, 30]
+
     def test_maximum_offset(self):
         paginator = OffsetPaginator(offset=0, limit=50, maximum_offset=100, total_path=None)
         response = Mock(Response, json=lambda: {"items": []})
@@ -0,0 +1,75 @@
+from typing import Any, Iterator, List
+
+import pytest
+
+from dlt.common import json
+from dlt.sources.helpers.rest_client.streaming import iter_json_items, simple_path_keys
+
+
+def _chunked(doc: Any, size: int) -> Iterator[bytes]:
+    data = json.dumps(doc, pretty=True).encode("utf-8")
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+DOCUMENT = {
+    "meta": {"count": 3, "next": None, "tags": ["a", "b"]},
+    "data": [
+        {"id": 1, "price": 12345.678, "name": "zażółć gęślą jaźń", "nested": {"list": [1, [2]]}},
+        {"id": 2, "price": -1e10, "name": 'quote " and \\ backslash', "flag": True},
+        12345678901234567890,
+    ],
+    "total": 100,
+}
+
+
+@pytest.mark.parametrize("chunk_size", (1, 3, 7, 64 * 1024))
+def test_iter_json_items(chunk_size: int) -> None:
+    items = list(iter_json_items(_chunked(DOCUMENT, chunk_size), ["data"]))
+    assert items == DOCUMENT["data"]
+    # nested path and not an array
+    assert list(iter_json_items(_chunked(DOCUMENT, chunk_size), ["meta", "count"])) == [3]
+    assert list(iter_json_items(_chunked(DOCUMENT, chunk_size), ["meta", "tags"])) == ["a", "b"]
+    # top level array
+    assert list(iter_json_items(_chunked(DOCUMENT["data"], chunk_size), [])) == DOCUMENT["data"]
+    # missing keys
+    assert list(iter_json_items(_chunked(DOCUMENT, chunk_size), ["missing"])) == []
+    assert list(iter_json_items(_chunked(DOCUMENT, chunk_size), ["total", "data"])) == []
+    assert list(iter_json_items(_chunked({"data": []}, chunk_size), ["data"])) == []
+
+
+def test_iter_json_items_invalid() -> None:
+    with pytest.raises(ValueError):
+        list(iter_json_items(iter([b'{"data": [1, 2']), ["data"]))
+    with pytest.raises(ValueError):
+        list(iter_json_items(iter([b'{"data": [1 2]}']), ["data"]))
+
+
+def test_iter_json_items_is_lazy() -> None:
+    read: List[bytes] = []
+
+    def _chunks() -> Iterator[bytes]:
+        for chunk in _chunked({"data": list(range(1000))}, 16):
+            read.append(chunk)
+            yield chunk
+
+    items = iter_json_items(_chunks(), ["data"])
+    assert next(items) == 0
+    assert len(read) < 5
+
+
+@pytest.mark.parametrize(
+    "selector,keys",
+    [
+        ("$", []),
+        ("data", ["data"]),
+        ("$.data", ["data"]),
+        ("$.data[*]", ["data"]),
+        ("results.items[*]", ["results", "items"]),
+        ("$.data[0]", None),
+        ("$..id", None),
+        ("data[*].id", None),
+    ],
+)
+def test_simple_path_keys(selector: str, keys: List[str]) -> None:
+    assert simple_path_keys(selector) == keys
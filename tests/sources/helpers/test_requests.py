@@ -1,4 +1,5 @@
-from typing import Iterator, Type
+from typing import Dict, Iterator, Optional, Type
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 import os
 import random
@@ -11,7 +12,13 @@ from tenacity import wait_exponential, RetryCallState, RetryError
 from tests.utils import preserve_environ
 import dlt
 from dlt.common.configuration.specs import RunConfiguration
-from dlt.sources.helpers.requests import Session, Client, client as default_client
+from dlt.sources.helpers.requests import (
+    Session,
+    Client,
+    HttpCache,
+    RateLimiter,
+    client as default_client,
+)
 from dlt.sources.helpers.requests.retry import (
     DEFAULT_RETRY_EXCEPTIONS,
     DEFAULT_RETRY_STATUS,
@@ -230,3 +237,181 @@ def test_client_instance_with_config(existing_session: bool) -> None:
     assert retry.wait.multiplier == cfg["RUNTIME__REQUEST_BACKOFF_FACTOR"]
     assert retry.stop.max_attempt_number == cfg["RUNTIME__REQUEST_MAX_ATTEMPTS"]
     assert retry.wait.max == cfg["RUNTIME__REQUEST_MAX_RETRY_DELAY"]
+
+
+def test_rate_limiter_reserve_across_threads() -> None:
+    limiter = RateLimiter(rate=10.0, burst=1)
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        delays = sorted(pool.map(lambda _: limiter._reserve(), range(10)))
+    # first request goes immediately, others are spaced by 1/rate
+    assert delays[0] == pytest.approx(0.0, abs=0.05)
+    for idx, delay in enumerate(delays):
+        assert delay == pytest.approx(idx / 10, abs=0.05)
+
+
+def test_rate_limiter_adapts_rate() -> None:
+    limiter = RateLimiter(rate=10.0, min_rate=1.0, max_rate=10.5)
+
+    def _response(
+        status_code: int = 200, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        return response
+
+    # additive increase up to max rate
+    limiter.update(_response())
+    assert limiter.rate == pytest.approx(10.1)
+    for _ in range(10):
+        limiter.update(_response())
+    assert limiter.rate == 10.5
+    # multiplicative decrease down to min rate
+    limiter.update(_response(429))
+    assert limiter.rate == pytest.approx(5.25)
+    for _ in range(10):
+        limiter.update(_response(429))
+    assert limiter.rate == 1.0
+    # remaining quota is spread until reset
+    limiter.rate = 10.0
+    limiter.update(_response(headers={"X-RateLimit-Remaining": "20", "X-RateLimit-Reset": "10"}))
+    assert limiter.rate == pytest.approx(2.0)
+    # exhausted quota pauses all requests until reset
+    limiter.update(_response(headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"}))
+    assert limiter._reserve() == pytest.approx(30, abs=1)
+
+
+def test_client_rate_limiter(mock_sleep: mock.MagicMock) -> None:
+    limiter = RateLimiter(rate=100.0)
+    session = Client(request_backoff_factor=0, rate_limiter=limiter).session
+    url = "https://example.com/data"
+    responses = [
+        dict(text="error", headers={"retry-after": "7"}, status_code=429),
+        dict(text="success"),
+    ]
+
+    with requests_mock.mock() as m:
+        m.get(url, responses)
+        assert session.get(url).text == "success"
+
+    # rate was cut and the retry waited for the limiter pause
+    assert limiter.rate < 100.0
+    assert any(6 <= call[0][0] <= 7 for call in mock_sleep.call_args_list)
+
+
+def test_http_cache_revalidates_with_etag(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"))
+    session = Client(http_cache=cache).session
+    url = "https://example.com/data"
+    responses = [
+        dict(json={"id": 1}, headers={"ETag": '"v1"'}),
+        dict(status_code=304, headers={"ETag": '"v1"'}),
+    ]
+
+    with requests_mock.mock() as m:
+        m.get(url, responses)
+        first = session.get(url)
+        second = session.get(url)
+
+    assert first.json() == second.json() == {"id": 1}
+    assert second.status_code == 200
+    assert second.from_cache  # type: ignore[attr-defined]
+    assert "If-None-Match" not in m.request_history[0].headers
+    assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+    # cache is persisted and used by other sessions
+    cache.close()
+    session = Client(http_cache=HttpCache(str(tmp_path / "cache.sqlite"))).session
+    with requests_mock.mock() as m:
+        m.get(url, status_code=304)
+        assert session.get(url).json() == {"id": 1}
+
+
+def test_http_cache_ttl(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), endpoint_ttl={"/static": 3600})
+    session = Client(http_cache=cache).session
+
+    with requests_mock.mock() as m:
+        m.get("https://example.com/static", json={"id": 1})
+        m.get("https://example.com/data", json={"id": 2})
+        for _ in range(3):
+            assert session.get("https://example.com/static").json() == {"id": 1}
+            assert session.get("https://example.com/data").json() == {"id": 2}
+
+    # only the first static request was sent, data has no ttl and no validators
+    assert [r.path for r in m.request_history] == ["/static", "/data", "/data", "/data"]
+
+
+def test_http_cache_lru_eviction(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), max_size=25, ttl=3600)
+    session = Client(http_cache=cache).session
+
+    with requests_mock.mock() as m:
+        for path in ("a", "b", "c"):
+            m.get(f"https://example.com/{path}", text=path * 10)
+        session.get("https://example.com/a")
+        session.get("https://example.com/b")
+        # a is used again so b is least recently used
+        session.get("https://example.com/a")
+        session.get("https://example.com/c")
+        assert m.call_count == 3
+        session.get("https://example.com/a")
+        assert m.call_count == 3
+        session.get("https://example.com/b")
+        assert m.call_count == 4
+
+
+def test_http_cache_skips_post_and_stream(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=3600)
+    session = Client(http_cache=cache).session
+    url = "https://example.com/data"
+
+    with requests_mock.mock() as m:
+        m.post(url, json={"id": 1}, headers={"ETag": '"v1"'})
+        m.get(url, json={"id": 2}, headers={"ETag": '"v2"'})
+        session.post(url)
+        session.post(url)
+        session.get(url, stream=True)
+        session.get(url, stream=True)
+        assert m.call_count == 4
+        assert all("If-None-Match" not in r.headers for r in m.request_history)
+
+
+def test_http_cache_keyed_by_request_headers(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=3600)
+    session = Client(http_cache=cache).session
+    url = "https://example.com/data"
+
+    with requests_mock.mock() as m:
+        m.get(url, [dict(json={"key": key}) for key in ("a", "b", "c")])
+        assert session.get(url, headers={"X-API-Key": "a"}).json() == {"key": "a"}
+        assert session.get(url, headers={"X-API-Key": "b"}).json() == {"key": "b"}
+        assert session.get(url, headers={"X-API-Key": "a"}).json() == {"key": "a"}
+        assert session.get(url, cookies={"session": "c"}).json() == {"key": "c"}
+        assert m.call_count == 3
+
+
+def test_http_cache_does_not_store_private_responses(tmp_path) -> None:
+    cache = HttpCache(str(tmp_path / "cache.sqlite"), ttl=3600)
+    session = Client(http_cache=cache).session
+
+    with requests_mock.mock() as m:
+        m.get("https://example.com/no-store", headers={"Cache-Control": "no-store"}, json={})
+        m.get(
+            "https://example.com/private", headers={"Cache-Control": "private, max-age=60"}, json={}
+        )
+        m.get("https://example.com/vary", headers={"Vary": "*"}, json={})
+        m.get("https://example.com/public", headers={"Cache-Control": "max-age=60"}, json={})
+        for _ in range(2):
+            for path in ("no-store", "private", "vary", "public"):
+                session.get(f"https://example.com/{path}")
+
+    assert [r.path for r in m.request_history] == [
+        "/no-store",
+        "/private",
+        "/vary",
+        "/public",
+        "/no-store",
+        "/private",
+        "/vary",
+    ]